@@ -0,0 +1,290 @@
+"""
+Test de charge multi-processus Epic Events.
+
+Plusieurs processus exécutent en parallèle un mélange d'opérations
+(`client report`, `contract payment`, `event create`, `event update`)
+sur une même base SQLite, au travers des modèles. Pour chaque profil
+SQLite, mélange et nombre de processus : débit, percentiles de latence
+et erreurs de verrou.
+
+Utilisation :
+    python -m benchmarks.load_test --workers 1 2 4 8 --duration 10
+    python -m benchmarks.load_test --profiles wal rollback --mixes écriture
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+from benchmarks.run_benchmarks import seed
+from src.models.base import Base
+from src.models.user import User
+from src.models.client import Client
+from src.models.contract import Contract
+from src.models.event import Event
+from src.models.payment import Payment
+from src.models.report import CLIENT_REPORT
+from src.models.locking import (
+    SQLITE_PROFILE, configure_sqlite, is_lock_error, lock_stats,
+    write_engine)
+from src.models import summary  # noqa: F401 (tables et triggers de synthèse)
+
+DEFAULT_SIZE = 10_000
+DEFAULT_WORKERS = [1, 2, 4, 8]
+DEFAULT_DURATION = 10.0
+
+# Profils SQLite comparés : celui de l'application et deux variantes
+PROFILES = {
+    "wal": SQLITE_PROFILE,
+    "wal-sans-attente": {**SQLITE_PROFILE, "busy_timeout": 0},
+    "rollback": {"journal_mode": "DELETE", "synchronous": "FULL",
+                 "busy_timeout": SQLITE_PROFILE["busy_timeout"]},
+}
+
+# Poids relatifs des opérations de chaque mélange
+MIXES = {
+    "lecture": {"client report": 85, "contract payment": 5,
+                "event create": 5, "event update": 5},
+    "équilibré": {"client report": 40, "contract payment": 20,
+                  "event create": 20, "event update": 20},
+    "écriture": {"client report": 10, "contract payment": 30,
+                 "event create": 30, "event update": 30},
+}
+
+
+def percentile(durations, rank):
+    """Percentile par rang le plus proche d'une liste triée"""
+    if not durations:
+        return 0.0
+    index = max(0, int(round(rank / 100 * len(durations))) - 1)
+    return round(durations[min(index, len(durations) - 1)], 3)
+
+
+class Workload:
+    """
+    Opérations d'un processus, chacune dans sa propre session comme
+    une commande de la CLI.
+        args: url (str) : base partagée,
+              profile (dict) : profil SQLite,
+              worker (int) : numéro du processus, graine et créneaux
+    """
+
+    def __init__(self, url, profile, worker):
+        engine = configure_sqlite(create_engine(url), profile)
+        self.Session = sessionmaker(bind=engine)
+        self.WriteSession = sessionmaker(bind=write_engine(engine))
+        self.rng = random.Random(worker)
+        self.slot = worker * 1_000_000
+        self.origin = datetime.now() + timedelta(days=3650)
+        with self.Session() as session:
+            self.commercials = session.scalars(
+                select(User.id).where(User.role == "COMMERCIAL")).all()
+            self.supports = session.scalars(
+                select(User.id).where(User.role == "SUPPORT")).all()
+            self.unpaid = session.scalars(
+                select(Contract.id)
+                .where(Contract.remaining_amount >= 1000)).all()
+            self.signed = session.execute(
+                select(Contract.id, Contract.client_id)
+                .where(Contract.is_signed.is_(True))).tuples().all()
+            self.events = session.scalar(select(Event.id).order_by(
+                Event.id.desc()).limit(1))
+
+    def client_report(self):
+        with self.Session() as session:
+            CLIENT_REPORT.rows(
+                session,
+                Client.commercial_id == self.rng.choice(self.commercials))
+
+    def contract_payment(self):
+        with self.WriteSession() as session:
+            Payment.record(session, self.rng.choice(self.unpaid), 1)
+
+    def event_create(self):
+        # Un créneau distinct par opération : pas de double réservation
+        self.slot += 1
+        start = self.origin + timedelta(hours=self.slot)
+        contract_id, client_id = self.rng.choice(self.signed)
+        with self.WriteSession() as session:
+            Event.create_object(
+                session, client_id=client_id, contract_id=contract_id,
+                support_contact_id=self.rng.choice(self.supports),
+                name="Charge", location="Lyon", attendees=10,
+                start_date=start.strftime("%Y-%m-%d %H:%M:%S"),
+                end_date=(start + timedelta(minutes=30)).strftime(
+                    "%Y-%m-%d %H:%M:%S"))
+
+    def event_update(self):
+        with self.WriteSession() as session:
+            Event.update_object(
+                session, self.rng.randint(1, self.events),
+                location=self.rng.choice(["Paris", "Lyon", "Nantes"]))
+
+    def operations(self):
+        return {"client report": self.client_report,
+                "contract payment": self.contract_payment,
+                "event create": self.event_create,
+                "event update": self.event_update}
+
+
+def work(url, profile, mix, duration, worker):
+    """
+    Processus de charge : tire des opérations selon les poids du mélange
+    jusqu'à l'échéance. Retourne, par opération, les durées en ms des
+    réussites et le nombre d'échecs (verrou ou autre).
+    """
+    workload = Workload(url, profile, worker)
+    operations = workload.operations()
+    names = list(mix)
+    weights = [mix[name] for name in names]
+    results = {name: {"durations": [], "lock_errors": 0, "errors": 0}
+               for name in names}
+    lock_stats.reset()
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        name = workload.rng.choices(names, weights)[0]
+        failures = lock_stats.failures
+        start = time.perf_counter()
+        try:
+            operations[name]()
+            results[name]["durations"].append(
+                (time.perf_counter() - start) * 1000)
+        except Exception as e:
+            if lock_stats.failures > failures or is_lock_error(e):
+                results[name]["lock_errors"] += 1
+            else:
+                results[name]["errors"] += 1
+    return results, lock_stats.retries
+
+
+def summarize(outcomes, elapsed):
+    """Regroupe les résultats des processus d'une exécution"""
+    operations = {}
+    for results, _ in outcomes:
+        for name, result in results.items():
+            total = operations.setdefault(
+                name, {"durations": [], "lock_errors": 0, "errors": 0})
+            total["durations"] += result["durations"]
+            total["lock_errors"] += result["lock_errors"]
+            total["errors"] += result["errors"]
+
+    summary = {"operations": {}, "completed": 0, "lock_errors": 0,
+               "errors": 0, "lock_retries": sum(
+                   retries for _, retries in outcomes)}
+    for name, total in operations.items():
+        durations = sorted(total["durations"])
+        summary["operations"][name] = {
+            "count": len(durations),
+            "p50_ms": percentile(durations, 50),
+            "p95_ms": percentile(durations, 95),
+            "p99_ms": percentile(durations, 99),
+            "lock_errors": total["lock_errors"],
+            "errors": total["errors"],
+        }
+        summary["completed"] += len(durations)
+        summary["lock_errors"] += total["lock_errors"]
+        summary["errors"] += total["errors"]
+    summary["throughput"] = round(summary["completed"] / elapsed, 1)
+    return summary
+
+
+def prepare(directory, size):
+    """Crée la base de référence, copiée avant chaque exécution"""
+    path = os.path.join(directory, "template.db")
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    with sessionmaker(bind=engine)() as session:
+        started = time.perf_counter()
+        seed(session, size)
+        print(f"🌱 {size} lignes insérées en "
+              f"{time.perf_counter() - started:.1f} s", file=sys.stderr)
+    engine.dispose()
+    return path
+
+
+def run(size, workers, duration, profiles, mixes):
+    """
+    Exécute chaque combinaison profil × mélange × nombre de processus
+    sur une copie neuve de la base et retourne les résultats.
+    """
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        template = prepare(directory, size)
+        path = os.path.join(directory, "load.db")
+        url = f"sqlite:///{path}"
+        for profile_name in profiles:
+            profile = PROFILES[profile_name]
+            for mix_name in mixes:
+                for count in workers:
+                    shutil.copy(template, path)
+                    # Le mode de journal est fixé avant l'arrivée des
+                    # processus : le changer exige une connexion seule
+                    engine = configure_sqlite(create_engine(url), profile)
+                    engine.connect().close()
+                    engine.dispose()
+
+                    with multiprocessing.Pool(count) as pool:
+                        started = time.perf_counter()
+                        outcomes = pool.starmap(work, [
+                            (url, profile, MIXES[mix_name], duration, worker)
+                            for worker in range(count)])
+                        elapsed = time.perf_counter() - started
+                    summary = summarize(outcomes, elapsed)
+                    summary.update(
+                        profile=profile_name, mix=mix_name, workers=count)
+                    results.append(summary)
+                    print(f"  {profile_name:<17} {mix_name:<10} "
+                          f"{count:>3} proc. {summary['throughput']:>9.1f} "
+                          f"op/s  verrous : {summary['lock_errors']}",
+                          file=sys.stderr)
+                    for name in (path, path + "-wal", path + "-shm"):
+                        if os.path.exists(name):
+                            os.remove(name)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=DEFAULT_SIZE)
+    parser.add_argument("--workers", type=int, nargs="+",
+                        default=DEFAULT_WORKERS)
+    parser.add_argument("--duration", type=float, default=DEFAULT_DURATION,
+                        help="Durée de chaque exécution, en secondes")
+    parser.add_argument("--profiles", nargs="+", choices=PROFILES,
+                        default=list(PROFILES))
+    parser.add_argument("--mixes", nargs="+", choices=MIXES,
+                        default=list(MIXES))
+    parser.add_argument("--output", default="load_test_results.json")
+    args = parser.parse_args(argv)
+
+    results = run(args.size, args.workers, args.duration,
+                  args.profiles, args.mixes)
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump({
+            "meta": {
+                "date": datetime.now().isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "cpus": os.cpu_count(),
+                "size": args.size,
+                "duration": args.duration,
+                "profiles": {name: PROFILES[name] for name in args.profiles},
+                "mixes": {name: MIXES[name] for name in args.mixes},
+            },
+            "results": results,
+        }, file, indent=2, ensure_ascii=False)
+    print(f"✅ Résultats écrits dans {args.output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,218 @@
+"""
+Rejeu d'une charge enregistrée Epic Events.
+
+Rejoue les commandes d'un journal EPIC_RECORD, dans l'ordre, sur une
+copie de la base (une CLI par commande, comme en production), puis
+compare les durées médianes par commande avec celles de l'enregistrement.
+Les commandes `auth` et celles dont un paramètre a été masqué (mot de
+passe) sont ignorées. Les commandes rejouées s'exécutent avec un dossier
+personnel temporaire et le jeton fourni par --token-file : le jeton de
+l'opérateur n'est ni utilisé ni modifié.
+
+Utilisation :
+    EPIC_RECORD=journee.jsonl python main.py ...
+    python -m benchmarks.replay journee.jsonl --database epic_event.db \
+        --token-file jeton_gestion.txt
+"""
+import argparse
+import json
+import os
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import click
+import typer
+
+from main import app
+from src.config.recorder import REDACTED, WorkloadRecorder
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MAIN = os.path.join(ROOT, "main.py")
+DEFAULT_THRESHOLD = 0.20
+# Nombre minimal d'exécutions réussies pour comparer une commande
+DEFAULT_MIN_RUNS = 3
+# Commandes jamais rejouées (elles modifient le jeton de connexion)
+SKIPPED_GROUPS = {"auth"}
+# Caractères de sortie d'erreur conservés pour un rejeu en échec
+STDERR_TAIL = 2000
+# Réponses aux confirmations (typer.confirm) des commandes rejouées
+CONFIRMATIONS = "y\n" * 20
+
+
+def build_argv(root, entry):
+    """
+    Reconstruit la ligne de commande d'une entrée du journal à partir
+    des paramètres de la commande Click. Retourne None pour une
+    commande `auth` ou si un paramètre a été masqué.
+    """
+    params = entry["params"]
+    names = entry["command"].split()
+    if names[0] in SKIPPED_GROUPS or REDACTED in params.values():
+        return None
+    command = root
+    for name in names:
+        command = command.commands[name]
+    argv = list(names)
+    for param in command.params:
+        value = params.get(param.name)
+        if value is None:
+            continue
+        values = value if isinstance(value, list) else [value]
+        if isinstance(param, click.Argument):
+            argv += [str(item) for item in values]
+        elif param.is_flag:
+            if value:
+                argv.append(param.opts[0])
+            elif param.secondary_opts:
+                argv.append(param.secondary_opts[0])
+        else:
+            for item in values:
+                argv += [param.opts[0], str(item)]
+    return argv
+
+
+def copy_database(source, destination):
+    """Copie cohérente de la base, journal WAL compris"""
+    with sqlite3.connect(source) as origin, \
+            sqlite3.connect(destination) as copy:
+        origin.backup(copy)
+
+
+def replay(entries, root, database, token, timeout=120):
+    """
+    Rejoue les entrées sur une copie de `database`, connecté avec
+    `token` dans un dossier personnel temporaire.
+    Retourne les paires (entrée enregistrée, entrée rejouée), le nombre
+    de commandes ignorées volontairement et les rejeux qui n'ont écrit
+    aucune ligne (plantage, délai dépassé) avec leur code de retour et
+    la fin de leur sortie d'erreur.
+    """
+    pairs, skipped, failures = [], 0, []
+    with tempfile.TemporaryDirectory() as directory:
+        copy = os.path.join(directory, "epic_event.db")
+        copy_database(database, copy)
+        home = os.path.join(directory, "home")
+        os.mkdir(home)
+        with open(os.path.join(home, ".epic_token"), "w") as file:
+            file.write(token)
+        recorder = WorkloadRecorder(os.path.join(directory, "replay.jsonl"))
+        env = {key: value for key, value in os.environ.items()
+               if key not in ("EPIC_METRICS_FILE", "EPIC_TRACE")}
+        env.update(DATABASE_URL=f"sqlite:///{copy}",
+                   HOME=home, USERPROFILE=home,
+                   EPIC_RECORD=recorder.path,
+                   PYTHONPATH=os.pathsep.join(
+                       filter(None, [ROOT, env.get("PYTHONPATH")])))
+        for entry in entries:
+            argv = build_argv(root, entry)
+            if argv is None:
+                skipped += 1
+                continue
+            before = len(recorder.load())
+            try:
+                process = subprocess.run(
+                    [sys.executable, MAIN, *argv], cwd=directory, env=env,
+                    input=CONFIRMATIONS, capture_output=True, text=True,
+                    timeout=timeout)
+                returncode, stderr = process.returncode, process.stderr
+            except subprocess.TimeoutExpired:
+                returncode, stderr = None, f"Délai de {timeout} s dépassé"
+            replayed = recorder.load()[before:]
+            if len(replayed) == 1:
+                pairs.append((entry, replayed[0]))
+            else:
+                failures.append({
+                    "command": entry["command"], "argv": argv,
+                    "returncode": returncode,
+                    "stderr": (stderr or "")[-STDERR_TAIL:]})
+    return pairs, skipped, failures
+
+
+def compare(pairs, threshold=DEFAULT_THRESHOLD, min_runs=DEFAULT_MIN_RUNS):
+    """
+    Durées médianes par commande, enregistrées et rejouées.
+    Les paires dont l'une des deux exécutions a échoué sont comptées à
+    part et exclues des médianes ; une commande n'est comparée qu'à
+    partir de `min_runs` exécutions réussies.
+    Retourne {commande: {runs, errors, recorded_ms, replayed_ms, ratio,
+    regression}}.
+    """
+    commands = {}
+    for recorded, replayed in pairs:
+        durations = commands.setdefault(
+            recorded["command"], {"recorded": [], "replayed": [],
+                                  "errors": 0})
+        if recorded["error"] or replayed["error"]:
+            durations["errors"] += 1
+            continue
+        durations["recorded"].append(recorded["duration"] * 1000)
+        durations["replayed"].append(replayed["duration"] * 1000)
+
+    results = {}
+    for command, durations in sorted(commands.items()):
+        result = {"runs": len(durations["recorded"]),
+                  "errors": durations["errors"], "recorded_ms": None,
+                  "replayed_ms": None, "ratio": None, "regression": False}
+        if result["runs"] >= min_runs:
+            recorded_ms = statistics.median(durations["recorded"])
+            replayed_ms = statistics.median(durations["replayed"])
+            ratio = replayed_ms / recorded_ms if recorded_ms else 1.0
+            result.update(
+                recorded_ms=round(recorded_ms, 3),
+                replayed_ms=round(replayed_ms, 3),
+                ratio=round(ratio, 2), regression=ratio > 1 + threshold)
+        results[command] = result
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("record", help="Journal JSONL (EPIC_RECORD)")
+    parser.add_argument("--database", default="epic_event.db",
+                        help="Base copiée avant le rejeu")
+    parser.add_argument("--token-file", required=True,
+                        help="Jeton de connexion utilisé pour le rejeu")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Ralentissement toléré (0.2 = +20 %%)")
+    parser.add_argument("--min-runs", type=int, default=DEFAULT_MIN_RUNS,
+                        help="Exécutions réussies requises par commande")
+    parser.add_argument("--output", default="replay_results.json")
+    args = parser.parse_args(argv)
+
+    with open(args.token_file, encoding="utf-8") as file:
+        token = file.read().strip()
+    entries = WorkloadRecorder(args.record).load()
+    pairs, skipped, failures = replay(
+        entries, typer.main.get_command(app), args.database, token)
+    results = compare(pairs, args.threshold, args.min_runs)
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump({"record": args.record, "replayed": len(pairs),
+                   "skipped": skipped, "failed": failures,
+                   "results": results},
+                  file, indent=2, ensure_ascii=False)
+
+    print(f"🔁 {len(pairs)} commandes rejouées, {skipped} ignorées, "
+          f"{len(failures)} en échec", file=sys.stderr)
+    for failure in failures:
+        print(f"❌ {failure['command']} : rejeu interrompu "
+              f"(code {failure['returncode']})", file=sys.stderr)
+    for command, result in results.items():
+        errors = (f"  ({result['errors']} en erreur)"
+                  if result["errors"] else "")
+        if result["ratio"] is None:
+            print(f"   {command:<30} {result['runs']} exécutions réussies, "
+                  f"pas de comparaison{errors}", file=sys.stderr)
+            continue
+        marker = "❌" if result["regression"] else "  "
+        print(f"{marker} {command:<30} {result['recorded_ms']:>10.3f} ms "
+              f"→ {result['replayed_ms']:>10.3f} ms  x{result['ratio']}"
+              f"{errors}", file=sys.stderr)
+    print(f"✅ Résultats écrits dans {args.output}", file=sys.stderr)
+    return 1 if failures or any(
+        result["regression"] for result in results.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
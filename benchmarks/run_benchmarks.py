@@ -0,0 +1,285 @@
+"""
+Suite de benchmarks Epic Events.
+
+Crée des bases SQLite synthétiques de différentes tailles, mesure les
+opérations principales du modèle et écrit les résultats en JSON.
+Avec --baseline, les résultats sont comparés à une exécution de référence
+et le script se termine en erreur si une opération a ralenti.
+
+Utilisation :
+    python -m benchmarks.run_benchmarks --sizes 10000 100000 1000000
+    python -m benchmarks.run_benchmarks --baseline benchmarks/baseline.json
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.orm import Session, sessionmaker
+from rich.console import Console
+
+from src.models.base import Base
+from src.models.user import User
+from src.models.client import Client
+from src.models.contract import Contract
+from src.models.event import Event
+from src.models.permission import PermissionManager
+from src.models.report import EVENT_REPORT
+from src.models.seed import Seeder
+from src.models.audit import record_changes
+from src.models import summary  # noqa: F401 (tables et triggers de synthèse)
+from src.config.permission_rules import PermissionRule
+from src.controllers.contract import get_filtered_contracts
+from src.controllers.event import get_filtered_events
+from src.view.display_view import Display
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+DEFAULT_REPEAT = 20
+DEFAULT_THRESHOLD = 0.20
+RENDER_ROWS = 500
+USERS = 10
+WITHOUT_AUDIT = " (sans audit)"
+
+
+def seed(session, size):
+    """Insère `size` clients, contrats et événements en lots"""
+    Seeder(seed=size, password="benchmark").run(
+        session, users=USERS, clients=size, contracts=size, events=size)
+
+
+@contextlib.contextmanager
+def audit_disabled():
+    """Suspend le journal d'audit pour mesurer son surcoût"""
+    event.remove(Session, "after_flush", record_changes)
+    try:
+        yield
+    finally:
+        event.listen(Session, "after_flush", record_changes)
+
+
+def without_audit(func):
+    def wrapper():
+        with audit_disabled():
+            func()
+    return wrapper
+
+
+def measure(func, repeat):
+    """Exécute `func` `repeat` fois et retourne les durées en ms"""
+    durations = []
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            func()
+            durations.append((time.perf_counter() - start) * 1000)
+    return {
+        "min_ms": round(min(durations), 4),
+        "median_ms": round(statistics.median(durations), 4),
+        "runs": repeat,
+    }
+
+
+def benchmarks(session, size):
+    """Retourne les opérations à mesurer pour une base de taille `size`"""
+    rng = random.Random(size)
+    gestion = User.get_object(session, id=1)
+    commercial = User.get_object(session, id=2)
+    signed = session.execute(
+        select(Contract.id, Contract.client_id)
+        .where(Contract.is_signed.is_(True)).limit(1)).one()
+    event_date = datetime.now() + timedelta(days=3650)
+    counter = iter(range(size + 1, size * 10))
+    display = Display()
+    display.console = Console(file=io.StringIO(), width=200)
+    render_rows = EVENT_REPORT.rows(session, Event.id <= RENDER_ROWS)
+
+    def random_id():
+        return rng.randint(1, size)
+
+    def create_client():
+        i = next(counter)
+        Client.create_object(
+            session, first_name="Bench", last_name=f"Nom{i}",
+            email=f"new{i}@bench.fr", phone=f"07{i:08d}",
+            company_name="Bench", commercial_id=2)
+
+    def create_contract():
+        Contract.create_object(
+            session, client_id=random_id(), commercial_id=2,
+            total_amount=500.0, remaining_amount=500.0)
+
+    def create_event():
+        # Un créneau par appel : le support ne peut être réservé deux fois
+        start = event_date + timedelta(hours=next(counter))
+        Event.create_object(
+            session, client_id=signed.client_id, contract_id=signed.id,
+            support_contact_id=3,
+            name="Bench", location="Lyon", attendees=5,
+            start_date=start.strftime("%Y-%m-%d %H:%M:%S"),
+            end_date=(start + timedelta(minutes=30)).strftime(
+                "%Y-%m-%d %H:%M:%S"))
+
+    def update_client():
+        Client.update_object(
+            session, random_id(), company_name=f"Bench {next(counter)}")
+
+    def update_contract():
+        Contract.update_object(
+            session, random_id(), total_amount=1000.0,
+            remaining_amount=float(next(counter) % 1000))
+
+    return {
+        "BaseModel.get_object": lambda: Client.get_object(
+            session, id=random_id()),
+        "User.create_object": lambda: User.create_object(
+            session, username=f"user{next(counter)}",
+            email=f"user{next(counter)}@bench.fr",
+            password="benchmark", role="SUPPORT"),
+        "User.update_object": lambda: User.update_object(
+            session, 2, email=commercial.email),
+        "Client.create_object": create_client,
+        "Client.update_object": update_client,
+        "Client.update_object" + WITHOUT_AUDIT: without_audit(update_client),
+        "Contract.create_object": create_contract,
+        "Contract.update_object": update_contract,
+        "Contract.update_object" + WITHOUT_AUDIT: without_audit(
+            update_contract),
+        "Event.create_object": create_event,
+        "Event.update_object": lambda: Event.update_object(
+            session, random_id(), location="Marseille"),
+        "PermissionManager.validate_permission": lambda: (
+            PermissionManager.validate_permission(
+                session, commercial, "update_own_contracts",
+                context={"contract": Contract.get_object(
+                    session, id=random_id())})),
+        "PermissionManager.validate_permission (refus)": lambda: (
+            PermissionManager.validate_permission(
+                session, gestion, "create_clients")),
+        "get_filtered_contracts": lambda: get_filtered_contracts(
+            session, amount_left=True, is_signed=True),
+        "get_filtered_events": lambda: get_filtered_events(
+            session, unassigned_only=True),
+        f"Display.rows ({RENDER_ROWS} lignes)": lambda: display.rows(
+            "Bench", EVENT_REPORT.headers, render_rows),
+        f"Display.table ({RENDER_ROWS} lignes)": lambda: display.table(
+            "Bench",
+            [dict(zip(EVENT_REPORT.headers, row)) for row in render_rows],
+            EVENT_REPORT.headers),
+    }
+
+
+def run(sizes, repeat, selected=None):
+    """Exécute la suite pour chaque taille et retourne les résultats"""
+    results = {}
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as directory:
+            engine = create_engine(
+                f"sqlite:///{os.path.join(directory, 'bench.db')}")
+            Base.metadata.create_all(engine)
+            session = sessionmaker(bind=engine)()
+            PermissionRule.initialize_permission(session)
+            PermissionRule.initialize_rules(session)
+
+            started = time.perf_counter()
+            seed(session, size)
+            print(f"🌱 {size} lignes insérées en "
+                  f"{time.perf_counter() - started:.1f} s", file=sys.stderr)
+
+            results[str(size)] = {}
+            for name, func in benchmarks(session, size).items():
+                if selected and not any(key in name for key in selected):
+                    continue
+                results[str(size)][name] = measure(func, repeat)
+                print(f"  {size:>9} {name:<50} "
+                      f"{results[str(size)][name]['median_ms']:>10.3f} ms",
+                      file=sys.stderr)
+            session.close()
+            engine.dispose()
+    return results
+
+
+def audit_overhead(results):
+    """
+    Surcoût du journal d'audit : ratio entre chaque opération et sa
+    mesure sans audit. Retourne la liste (taille, opération, ratio).
+    """
+    overheads = []
+    for size, operations in results.items():
+        for name, measures in operations.items():
+            reference = operations.get(name + WITHOUT_AUDIT)
+            if reference and reference["median_ms"]:
+                overheads.append((size, name, round(
+                    measures["median_ms"] / reference["median_ms"], 2)))
+    return overheads
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """
+    Compare les médianes aux résultats de référence.
+    Retourne la liste des régressions (taille, opération, ratio).
+    """
+    regressions = []
+    for size, operations in results.items():
+        for name, measures in operations.items():
+            reference = baseline.get(size, {}).get(name)
+            if not reference or not reference["median_ms"]:
+                continue
+            ratio = measures["median_ms"] / reference["median_ms"]
+            if ratio > 1 + threshold:
+                regressions.append((size, name, round(ratio, 2)))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument(
+        "--only", nargs="*",
+        help="Ne mesurer que les opérations contenant ce texte")
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--baseline", help="Fichier JSON de référence")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Ralentissement toléré (0.2 = +20 %%)")
+    args = parser.parse_args(argv)
+
+    results = run(args.sizes, args.repeat, args.only)
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump({
+            "meta": {
+                "date": datetime.now().isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "repeat": args.repeat,
+            },
+            "results": results,
+        }, file, indent=2, ensure_ascii=False)
+    print(f"✅ Résultats écrits dans {args.output}", file=sys.stderr)
+    for size, name, ratio in audit_overhead(results):
+        print(f"📝 Surcoût de l'audit sur {name} ({size} lignes) : "
+              f"x{ratio}", file=sys.stderr)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        for size, name, ratio in regressions:
+            print(f"❌ Régression {name} ({size} lignes) : x{ratio}",
+                  file=sys.stderr)
+        if regressions:
+            return 1
+        print("✅ Aucune régression par rapport à la référence",
+              file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,12 +1,17 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect, select, text
 from sqlalchemy.orm import sessionmaker
-from src.models.base import Base
+from src.models.base import Base, utc_now
 from src.models.user import User
 from src.models.client import Client
 from src.models.contract import Contract
 from src.models.event import Event
 from src.models.permission import DynamicPermission, DynamicPermissionRule
+from src.models.summary import ClientSummary, CommercialSummary, Summary
+from src.models.search import Search
+from src.models.audit import AuditLog
+from src.models.payment import Payment
 from src.models.relationships import setup_relationships
+from src.models.validators import ClientValidator
 from src.config.permission_rules import PermissionRule
 import os
 from dotenv import load_dotenv
@@ -26,6 +31,10 @@ def create_core_tables(engine):
         Client.__table__,
         Contract.__table__,
         Event.__table__,
+        ClientSummary.__table__,
+        CommercialSummary.__table__,
+        AuditLog.__table__,
+        Payment.__table__,
     ])
 
 
@@ -48,6 +57,123 @@ def init_database(database_url=DATABASE_URL):
     return engine
 
 
+def create_indexes(engine):
+    """Crée les index manquants sur une base existante"""
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(engine, checkfirst=True)
+
+
+def add_missing_columns(engine):
+    """
+    Ajoute aux tables existantes les colonnes déclarées dans les modèles
+    (SQLite n'accepte ni contrainte NOT NULL ni UNIQUE dans ALTER TABLE :
+    les colonnes sont ajoutées nullables, les index uniques sont créés
+    ensuite par create_indexes). Retourne les colonnes ajoutées.
+    """
+    inspector = inspect(engine)
+    added = []
+    with engine.begin() as connection:
+        for table in Base.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            existing = {
+                column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing:
+                    continue
+                definition = (f"{column.name} "
+                              f"{column.type.compile(engine.dialect)}")
+                if column.server_default is not None:
+                    definition += f" DEFAULT {column.server_default.arg}"
+                connection.exec_driver_sql(
+                    f"ALTER TABLE {table.name} ADD COLUMN {definition}")
+                added.append(f"{table.name}.{column.name}")
+    return added
+
+
+def migrate_client_contacts(engine):
+    """
+    Remplit les colonnes normalisées des clients (email en minuscules,
+    téléphone E.164) sur une base existante. En cas de doublon, seul
+    le client le plus ancien reçoit la valeur normalisée.
+    """
+    table = Client.__table__
+    with engine.begin() as connection:
+        rows = connection.execute(select(
+            table.c.id, table.c.email, table.c.phone,
+            table.c.email_normalized, table.c.phone_normalized,
+        ).order_by(table.c.id)).all()
+        emails = {row.email_normalized for row in rows} - {None}
+        phones = {row.phone_normalized for row in rows} - {None}
+        updates, skipped = [], []
+        for row in rows:
+            # Une valeur déjà normalisée est conservée : la migration
+            # peut être relancée sans rien défaire
+            email, phone = row.email_normalized, row.phone_normalized
+            if email and phone:
+                continue
+            if email is None:
+                email = ClientValidator.normalize_email(row.email)
+                if email in emails:
+                    skipped.append(row.id)
+                    email = None
+                elif email:
+                    emails.add(email)
+            if phone is None:
+                try:
+                    phone = ClientValidator.normalize_phone(row.phone)
+                except Exception:
+                    phone = None
+                if phone in phones:
+                    skipped.append(row.id)
+                    phone = None
+                elif phone:
+                    phones.add(phone)
+            if (email, phone) != (row.email_normalized, row.phone_normalized):
+                updates.append({"client_id": row.id,
+                                "email_normalized": email,
+                                "phone_normalized": phone})
+        if updates:
+            # Requête textuelle : la migration ne modifie pas updated_at
+            connection.execute(text(
+                "UPDATE clients SET email_normalized = :email_normalized, "
+                "phone_normalized = :phone_normalized WHERE id = :client_id"),
+                updates)
+    if skipped:
+        print(f"⚠️ Coordonnées en double, non normalisées pour les "
+              f"clients : {', '.join(map(str, sorted(set(skipped))))}")
+    return len(updates)
+
+
+def backfill_updated_at(engine):
+    """
+    Renseigne updated_at sur les lignes qui n'en ont pas (colonne ajoutée
+    par migration) avec leur date de création, pour l'export des
+    modifications. Retourne le nombre de lignes complétées.
+    """
+    count = 0
+    with engine.begin() as connection:
+        for table in ("users", "clients", "contracts", "events"):
+            count += connection.execute(text(
+                f"UPDATE {table} SET updated_at = COALESCE(created_at, :now) "
+                "WHERE updated_at IS NULL"), {"now": utc_now()}).rowcount
+    return count
+
+
+def init_summaries(engine):
+    """
+    Recalcule les tables de synthèse et l'index de recherche
+    à partir des données existantes
+    """
+    session = sessionmaker(bind=engine)()
+    try:
+        Summary.rebuild(session)
+        Search.rebuild(session)
+    finally:
+        session.close()
+
+
 def init_permissions_and_rules(engine):
     """Initialise les permissions et les règles dans la base de données"""
     Session = sessionmaker(bind=engine)
@@ -70,7 +196,12 @@ def main():
     try:
         print("🔄 Initialisation de la base de données et des permissions...")
         engine = init_database()
+        add_missing_columns(engine)
+        migrate_client_contacts(engine)
+        backfill_updated_at(engine)
+        create_indexes(engine)
         init_permissions_and_rules(engine)
+        init_summaries(engine)
         print("✅ Base de données et permissions initialisées avec succès!")
     except Exception as e:
         print(f"❌ Erreur: {str(e)}")
@@ -4,7 +4,19 @@ from src.controllers.contract import contract_app
 from sqlalchemy import create_engine
 from src.controllers.event import event_app
 from src.controllers.authentication import auth_app
+from src.controllers.server import server_app
+from src.controllers.dashboard import dashboard
+from src.controllers.search import search
+from src.controllers.db import db_app
+from src.controllers.export import export_app
+from src.config.profiling import Profiler
+from src.config.query_stats import track_queries
+from src.config.metrics import instrument
+from src.config.tracing import tracer, TRACE_FILE
+from src.config.sentry_base import logger
+from src.models.locking import lock_stats
 from sqlalchemy.orm import sessionmaker
+import sys
 import typer
 
 
@@ -14,18 +26,62 @@ Session = sessionmaker(bind=create_engine("sqlite:///epic_event.db"))
 
 
 @app.callback()
-def main(ctx: typer.Context):
+def main(
+    ctx: typer.Context,
+    profile: bool = typer.Option(
+        False, "--profile",
+        help="Profile la commande (cProfile) et affiche un résumé"),
+    profile_output: str = typer.Option(
+        "epic_profile.pstats", "--profile-output",
+        help="Fichier .pstats écrit avec --profile"),
+    profile_top: int = typer.Option(
+        20, "--profile-top", help="Nombre de fonctions du résumé"),
+    sql_stats: bool = typer.Option(
+        False, "--sql-stats",
+        help="Affiche le nombre de requêtes SQL et le temps passé en base"),
+):
     """Initialise le contexte global pour l'application"""
     if ctx.obj is None:
         ctx.obj = {}
     ctx.obj["session"] = Session()
 
+    def report_queries():
+        name = ctx.meta.get("command", ctx.invoked_subcommand)
+        logger.info(f"Commande {name} : {queries.summary()}")
+        if lock_stats.retries or lock_stats.failures:
+            logger.warning(f"Commande {name} : {lock_stats.summary()}")
+        if sql_stats:
+            typer.echo(f"🗄️  {queries.summary()}", err=True)
+
+    ctx.call_on_close(report_queries)
+    queries = ctx.with_resource(track_queries())
+
+    if TRACE_FILE:
+        tracer.enable()
+        ctx.call_on_close(lambda: tracer.write(TRACE_FILE))
+        ctx.with_resource(tracer.span("cli", "cli", argv=sys.argv[1:]))
+
+    if profile:
+        profiler = Profiler(output=profile_output, top=profile_top)
+
+        def report():
+            typer.echo(profiler.report(profiler.stop()), err=True)
+
+        ctx.call_on_close(report)
+        profiler.start()
+
 
 app.add_typer(user_app, name='user')
 app.add_typer(client_app, name='client')
 app.add_typer(contract_app, name='contract')
 app.add_typer(event_app, name='event')
 app.add_typer(auth_app, name='auth')
+app.add_typer(server_app, name='server')
+app.add_typer(db_app, name='db')
+app.add_typer(export_app, name='export')
+app.command(name='dashboard')(dashboard)
+app.command(name='search')(search)
+instrument(app)
 
 
 if __name__ == '__main__':
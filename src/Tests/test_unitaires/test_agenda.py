@@ -0,0 +1,49 @@
+from datetime import datetime, timedelta
+from src.models.user import User
+from src.models.client import Client
+from src.models.contract import Contract
+from src.models.event import Event
+from src.controllers.event import agenda_query
+from src.view.calendar_view import Calendar
+
+
+def test_agenda_query_is_filtered_ordered_and_limited(
+        session, make_user, make_client, make_contract):
+    """Test de l'agenda d'un support sur une fenêtre de dates."""
+    now = datetime(2030, 1, 1, 8, 0)
+    session.add_all([
+        User(**make_user(id=1, role="SUPPORT")),
+        Client(**make_client(id=1)),
+        Contract(**make_contract(id=1)),
+    ])
+    for event_id, days, support_id in [
+            (1, 3, 1), (2, 1, 1), (3, 20, 1), (4, 2, None), (5, 5, 1)]:
+        start = now + timedelta(days=days)
+        session.add(Event(
+            id=event_id, contract_id=1, client_id=1, name="Salon",
+            support_contact_id=support_id, location="Lyon", attendees=5,
+            start_date=start, end_date=start + timedelta(hours=2)))
+    session.flush()
+
+    rows = session.execute(
+        agenda_query(support_id=1, days=14, limit=2, now=now)).all()
+
+    assert [row[2] for row in rows] == [2, 1]
+    assert rows[0][6] == make_client()["company_name"]
+
+
+def test_calendar_render_escapes_and_folds_lines():
+    """Test du format iCalendar : échappement, pliage et CRLF."""
+    start = datetime(2030, 5, 1, 9, 30)
+    content = Calendar.render([{
+        "id": 7, "name": "Gala, édition 2030", "location": "Paris",
+        "start_date": start, "end_date": start + timedelta(hours=3),
+        "description": "x" * 200,
+    }])
+
+    lines = content.split("\r\n")
+    assert lines[0] == "BEGIN:VCALENDAR" and content.endswith("\r\n")
+    assert "SUMMARY:Gala\\, édition 2030" in lines
+    assert "DTSTART:20300501T093000" in lines
+    assert all(len(line.encode("utf-8")) <= 75 for line in lines)
+    assert any(line.startswith(" x") for line in lines)
@@ -0,0 +1,78 @@
+import asyncio
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from src.models.base import Base
+from src.models.user import User
+from src.models.client import Client
+from src.models.contract import Contract
+from src.controllers.contract import aget_filtered_contracts
+
+
+def run_with_async_session(scenario):
+    """Exécute un scénario sur une base aiosqlite en mémoire."""
+    async def main():
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        Session = async_sessionmaker(bind=engine, expire_on_commit=False)
+        try:
+            return await scenario(Session)
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(main())
+
+
+def test_async_create_update_delete(make_user, make_client):
+    """Test du cycle création / mise à jour / suppression asynchrone."""
+    async def scenario(Session):
+        async with Session() as session:
+            user = await User.acreate_object(
+                session, **make_user(id=None, role="COMMERCIAL"))
+            client = await Client.acreate_object(
+                session, **make_client(id=None, commercial_id=user.id))
+            await Client.aupdate_object(
+                session, client.id, first_name="Jane")
+            updated = await Client.aget_object(session, id=client.id)
+            await Client.adelete_object(session, client.id)
+            remaining = await Client.aget_all_object(session)
+            return updated.first_name, remaining
+
+    first_name, remaining = run_with_async_session(scenario)
+
+    assert first_name == "Jane"
+    assert remaining == []
+
+
+def test_async_concurrent_reports(make_user, make_client, make_contract):
+    """Test que plusieurs lectures peuvent être lancées en parallèle."""
+    async def scenario(Session):
+        async with Session() as session:
+            user = await User.acreate_object(
+                session, **make_user(id=None, role="COMMERCIAL"))
+            client = await Client.acreate_object(
+                session, **make_client(id=None, commercial_id=user.id))
+            await Contract.acreate_object(session, **make_contract(
+                id=None, client_id=client.id, commercial_id=user.id))
+
+        async with Session() as first, Session() as second:
+            return await asyncio.gather(
+                Client.aget_all_object(first),
+                aget_filtered_contracts(second, is_signed=True),
+            )
+
+    clients, contracts = run_with_async_session(scenario)
+
+    assert len(clients) == 1
+    assert len(contracts) == 1
+
+
+def test_async_save_object_raises_error(make_user):
+    """Test qu'une erreur d'écriture est remontée avec le nom du modèle."""
+    async def scenario(Session):
+        async with Session() as session:
+            await User._asave_object(session, User(**make_user()))
+            await User._asave_object(session, User(**make_user()))
+
+    with pytest.raises(Exception, match="de l'objet User"):
+        run_with_async_session(scenario)
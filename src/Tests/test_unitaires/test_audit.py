@@ -0,0 +1,74 @@
+import json
+import pytest
+from sqlalchemy import create_engine, select, func
+from sqlalchemy.orm import sessionmaker
+from src.models.base import Base
+from src.models.user import User
+from src.models.client import Client
+from src.models.contract import Contract
+from src.models.audit import AuditLog
+
+
+@pytest.fixture
+def db_session(make_user, make_client):
+    """Base en mémoire, modifications faites par l'utilisateur 1."""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.info["actor_id"] = 1
+    session.add_all([User(**make_user(id=1)), Client(**make_client(id=1))])
+    session.commit()
+    yield session
+    session.close()
+
+
+def entries(session, entity, entity_id):
+    return [(operation, json.loads(changes))
+            for _, _, _, _, operation, changes
+            in reversed(AuditLog.history(session, entity, entity_id))]
+
+
+def test_audit_records_contract_lifecycle(db_session):
+    """Test de la création, la modification, la signature et la
+    suppression d'un contrat."""
+    Contract.create_object(
+        db_session, client_id=1, commercial_id=1,
+        total_amount=1000.0, remaining_amount=1000.0)
+    Contract.update_object(
+        db_session, 1, total_amount=1000.0, remaining_amount=400.0)
+    Contract.sign_object(db_session, 1)
+    Contract.delete_object(db_session, 1)
+
+    log = entries(db_session, "contracts", 1)
+    assert [operation for operation, _ in log] == [
+        "create", "update", "sign", "delete"]
+    assert log[0][1]["total_amount"] == 1000.0
+    assert log[1][1] == {"remaining_amount": [1000.0, 400.0]}
+    assert log[2][1] == {"is_signed": [False, True]}
+    assert db_session.scalar(
+        select(AuditLog.actor_id).limit(1)) == 1
+
+
+def test_audit_masks_passwords_and_skips_noop_updates(db_session):
+    """Test du masquage des mots de passe et des mises à jour sans effet."""
+    User.update_object(db_session, 1, password="nouveau")
+    Client.update_object(db_session, 1, company_name="JD Corp")
+
+    assert entries(db_session, "users", 1)[-1] == (
+        "update", {"password": ["***", "***"]})
+    assert [operation for operation, _ in entries(
+        db_session, "clients", 1)] == ["create"]
+
+
+def test_audit_is_written_in_the_same_transaction(db_session):
+    """Test qu'un rollback annule aussi les entrées d'audit."""
+    before = db_session.scalar(select(func.count(AuditLog.id)))
+    client = db_session.get(Client, 1)
+    client.company_name = "Annulé"
+    db_session.flush()
+    assert db_session.scalar(
+        select(func.count(AuditLog.id))) == before + 1
+
+    db_session.rollback()
+
+    assert db_session.scalar(select(func.count(AuditLog.id))) == before
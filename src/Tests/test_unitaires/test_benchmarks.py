@@ -0,0 +1,159 @@
+import os
+import sqlite3
+import subprocess
+import typer
+from benchmarks import load_test, replay
+from main import app
+from benchmarks.run_benchmarks import run, compare, audit_overhead
+
+
+def test_benchmark_suite_runs_on_small_database():
+    """Test que la suite s'exécute sur une petite base."""
+    results = run(sizes=[20], repeat=1, selected=["get_object", "filtered"])
+
+    assert set(results["20"]) == {
+        "BaseModel.get_object",
+        "get_filtered_contracts",
+        "get_filtered_events",
+    }
+
+
+def test_compare_flags_regressions():
+    """Test de la détection des régressions par rapport à la référence."""
+    baseline = {"10": {"op": {"median_ms": 1.0}, "stable": {"median_ms": 2.0}}}
+    results = {"10": {"op": {"median_ms": 1.5}, "stable": {"median_ms": 2.1}}}
+
+    assert compare(results, baseline, threshold=0.2) == [("10", "op", 1.5)]
+
+
+def test_audit_overhead_pairs_measures_with_and_without_audit():
+    """Test du calcul du surcoût de l'audit."""
+    results = run(sizes=[20], repeat=1, selected=["Client.update_object"])
+
+    assert [name for _, name, _ in audit_overhead(results)] == [
+        "Client.update_object"]
+
+
+def test_load_test_reports_each_combination():
+    """Test du test de charge sur une petite base, deux processus."""
+    results = load_test.run(size=20, workers=[2], duration=0.3,
+                            profiles=["wal"], mixes=["équilibré"])
+
+    assert len(results) == 1
+    result = results[0]
+    assert (result["profile"], result["mix"], result["workers"]) == (
+        "wal", "équilibré", 2)
+    assert result["completed"] > 0
+    assert result["lock_errors"] == result["errors"] == 0
+    assert set(result["operations"]) == set(load_test.MIXES["équilibré"])
+
+
+def test_percentile_uses_nearest_rank():
+    """Test du calcul des percentiles."""
+    durations = [float(value) for value in range(1, 101)]
+
+    assert [load_test.percentile(durations, rank)
+            for rank in (50, 95, 99)] == [50.0, 95.0, 99.0]
+    assert load_test.percentile([], 50) == 0.0
+
+
+def test_replay_rebuilds_recorded_command_lines():
+    """Test de la reconstruction des commandes du journal de charge."""
+    root = typer.main.get_command(app)
+
+    assert replay.build_argv(root, {
+        "command": "contract payment",
+        "params": {"contract_id": 1, "amount": 10.5}}) == [
+        "contract", "payment", "--contract-id", "1", "--amount", "10.5"]
+    assert replay.build_argv(root, {
+        "command": "event report",
+        "params": {"unassigned_only": True, "export_format": "csv"}})[:3] == [
+        "event", "report", "--unassigned-only"]
+    assert replay.build_argv(root, {
+        "command": "user update",
+        "params": {"user_id": 2, "password": "***"}}) is None
+    assert replay.build_argv(root, {
+        "command": "auth logout", "params": {}}) is None
+
+
+def test_replay_compares_median_durations():
+    """Test de la comparaison des durées enregistrées et rejouées :
+    les exécutions en erreur sont exclues et comptées à part."""
+    def pair(recorded, replayed, error=False):
+        return ({"command": "event report", "duration": recorded,
+                 "error": error},
+                {"command": "event report", "duration": replayed,
+                 "error": False})
+
+    pairs = [pair(0.1, 0.2), pair(0.1, 0.3), pair(0.2, 0.1),
+             pair(0.0002, 0.2, error=True)]
+
+    result = replay.compare(pairs, threshold=0.5)["event report"]
+
+    assert (result["runs"], result["errors"]) == (3, 1)
+    assert (result["recorded_ms"], result["replayed_ms"]) == (100.0, 200.0)
+    assert result["regression"]
+    assert replay.compare(pairs[:2], min_runs=3)["event report"] == {
+        "runs": 2, "errors": 0, "recorded_ms": None, "replayed_ms": None,
+        "ratio": None, "regression": False}
+
+
+def test_replay_uses_a_temporary_home(tmp_path, monkeypatch):
+    """Test que le rejeu n'utilise ni ne modifie le jeton de l'opérateur
+    et ignore les commandes `auth`."""
+    home = tmp_path / "operateur"
+    home.mkdir()
+    (home / ".epic_token").write_text("jeton-operateur")
+    monkeypatch.setenv("HOME", str(home))
+    database = tmp_path / "epic_event.db"
+    sqlite3.connect(database).close()
+    calls = []
+
+    def run(argv, env, **kwargs):
+        calls.append(argv[2:])
+        with open(os.path.join(env["HOME"], ".epic_token")) as file:
+            assert file.read() == "jeton-rejeu"
+        return subprocess.CompletedProcess(argv, 1, "", "Traceback")
+
+    monkeypatch.setattr(replay.subprocess, "run", run)
+    entries = [{"command": "auth logout", "params": {}},
+               {"command": "contract statement",
+                "params": {"contract_id": 1}}]
+
+    pairs, skipped, failures = replay.replay(
+        entries, typer.main.get_command(app), str(database), "jeton-rejeu")
+
+    assert calls == [["contract", "statement", "--contract-id", "1"]]
+    assert (pairs, skipped) == ([], 1)
+    assert failures == [{
+        "command": "contract statement",
+        "argv": ["contract", "statement", "--contract-id", "1"],
+        "returncode": 1, "stderr": "Traceback"}]
+    assert (home / ".epic_token").read_text() == "jeton-operateur"
+
+
+def test_every_benchmark_runs_repeatedly():
+    """Test que chaque opération de la suite supporte plusieurs
+    exécutions successives sur une petite base."""
+    results = run(sizes=[20], repeat=3)
+
+    assert len(results["20"]) == 17
+    assert "Event.create_object" in results["20"]
+    assert all(measures["runs"] == 3 for measures in results["20"].values())
+
+
+def test_replay_counts_failed_commands_as_errors(tmp_path):
+    """Test du rejeu d'une commande dont le contrôleur échoue (jeton
+    invalide) : elle est exclue des médianes et comptée en erreur."""
+    database = tmp_path / "epic_event.db"
+    sqlite3.connect(database).close()
+    entry = {"command": "contract statement", "params": {"contract_id": 1},
+             "duration": 0.03, "error": False}
+
+    pairs, skipped, failures = replay.replay(
+        [entry], typer.main.get_command(app), str(database), "invalide")
+
+    assert (len(pairs), skipped, failures) == (1, 0, [])
+    assert pairs[0][1]["error"] is True
+    assert replay.compare(pairs, min_runs=1)["contract statement"][
+        "errors"] == 1
@@ -283,3 +283,19 @@ def test_create_event(mocker, session, make_user, make_event):
 
     assert result.exit_code == 0
     assert "✅ Événement du contrat n°1 créé avec succès!" in result.output
+
+
+def test_delete_contract_failure_exits_with_error(mocker, session, make_user):
+    """Test qu'une suppression en échec se termine avec le code 1."""
+    mocker.patch("src.models.user_session.UserSession.get_current_user",
+                 return_value=User(**make_user(role="GESTION", id=2)))
+    mocker.patch("src.models.contract.Contract.get_object",
+                 return_value=None)
+    mocker.patch("src.models.contract.Contract.delete_object",
+                 side_effect=Exception("Le contrat n'existe pas"))
+
+    result = runner.invoke(contract_app, ["delete", "--id", "1"],
+                           obj={"session": session}, input="y")
+
+    assert result.exit_code == 1
+    assert "❌ Erreur: Le contrat n'existe pas" in result.output
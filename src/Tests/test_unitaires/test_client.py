@@ -1,5 +1,8 @@
 import pytest
+from sqlalchemy import create_engine
 from src.models.client import Client
+from src.models.validators import ClientValidator
+from database import add_missing_columns, migrate_client_contacts
 from src.models.user import User
 
 
@@ -77,6 +80,9 @@ def test_update_user_with_permission(mocker, session, make_client):
 
     assert updated_client.first_name == "Newclientname"
 
+    other = Client(**make_client(id=3, email="existing@example.com"))
+    mocker.patch("src.models.client.Client.get_object",
+                 side_effect=[client, other])
     with pytest.raises(
             Exception, match="Un client avec cet email existe déjà"):
         Client.update_object(
@@ -102,3 +108,83 @@ def test_delete_client_with_permission(mocker, session, make_client):
         session, client_id=client_fixture["id"])
 
     assert deleted_client.id == client_fixture["id"]
+
+
+def test_normalize_contacts():
+    """Test de la normalisation des emails et des téléphones (E.164)."""
+    assert ClientValidator.normalize_email(" John@Example.COM ") == (
+        "john@example.com")
+    assert ClientValidator.normalize_phone("06 12 34 56 78") == "+33612345678"
+    assert ClientValidator.normalize_phone("0033 6.12.34.56.78") == (
+        "+33612345678")
+    assert ClientValidator.normalize_phone("+1 (415) 555-2671") == (
+        "+14155552671")
+    with pytest.raises(Exception, match="téléphone doit être valide"):
+        ClientValidator.normalize_phone("12")
+
+
+def test_create_client_should_raise_error_email_variant(
+        session, make_client, make_user):
+    """Test qu'une variante de casse d'un email existant est refusée."""
+    session.add(User(**make_user(id=1, role="COMMERCIAL")))
+    Client.create_object(session, **make_client(id=None))
+
+    with pytest.raises(Exception, match="email existe déjà"):
+        Client.create_object(session, **make_client(
+            id=None, email=" JOHN@example.com", phone="0202020202"))
+    with pytest.raises(Exception, match="téléphone existe déjà"):
+        Client.create_object(session, **make_client(
+            id=None, email="other@example.com", phone="+33 1 01 01 01 01"))
+
+
+def test_update_client_accepts_own_contacts_in_another_format(
+        session, make_client, make_user):
+    """Test qu'un client peut réenregistrer son email ou son téléphone
+    sous une autre forme, mais pas ceux d'un autre client."""
+    session.add(User(**make_user(id=1, role="COMMERCIAL")))
+    Client.create_object(session, **make_client(
+        id=None, email="John@Example.com", phone="01 01 01 01 01"))
+    Client.create_object(session, **make_client(
+        id=None, email="jane@example.com", phone="0202020202"))
+
+    client = Client.update_object(
+        session, 1, email="john@example.com", phone="+33101010101")
+
+    assert (client.email, client.phone) == ("john@example.com", "+33101010101")
+    with pytest.raises(Exception, match="email existe déjà"):
+        Client.update_object(session, 1, email="JANE@example.com")
+    with pytest.raises(Exception, match="téléphone existe déjà"):
+        Client.update_object(session, 1, phone="02 02 02 02 02")
+
+
+def test_migrate_client_contacts_backfills_existing_rows(tmp_path, capsys):
+    """Test de la migration des colonnes normalisées."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    with engine.begin() as connection:
+        connection.exec_driver_sql(
+            "CREATE TABLE clients (id INTEGER PRIMARY KEY, email VARCHAR, "
+            "phone VARCHAR)")
+        connection.exec_driver_sql(
+            "INSERT INTO clients VALUES (1, 'A@B.fr', '06 00 00 00 01'), "
+            "(2, 'a@b.fr ', '0600000002'), (3, 'c@d.fr', 'inconnu'), "
+            "(4, 'e@f.fr', 'n/a')")
+
+    assert "clients.phone_normalized" in add_missing_columns(engine)
+    assert migrate_client_contacts(engine) == 4
+    assert "clients : 2\n" in capsys.readouterr().out
+
+    def normalized():
+        with engine.connect() as connection:
+            return connection.exec_driver_sql(
+                "SELECT id, email_normalized, phone_normalized FROM clients "
+                "ORDER BY id").all()
+
+    expected = [(1, "a@b.fr", "+33600000001"),
+                (2, None, "+33600000002"),
+                (3, "c@d.fr", None),
+                (4, "e@f.fr", None)]
+    assert normalized() == expected
+
+    # Relancée (comme à chaque `python database.py`), elle ne défait rien
+    assert migrate_client_contacts(engine) == 0
+    assert normalized() == expected
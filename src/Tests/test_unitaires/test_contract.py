@@ -1,4 +1,8 @@
 import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from src.models.base import Base, ConcurrentUpdateError
+from src.models.client import Client
 from src.models.contract import Contract
 from src.models.user import User
 
@@ -178,3 +182,28 @@ def test_sign_contract_with_no_contract(mocker, session):
 
     with pytest.raises(Exception, match="Le contrat n'existe pas"):
         Contract.sign_object(session, contract_id=1)
+
+
+def test_concurrent_payments_raise_conflict_error(
+        tmp_path, make_user, make_client, make_contract):
+    """Test que le second paiement concurrent échoue au lieu d'écraser."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'epic.db'}")
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    with Session() as setup:
+        setup.add_all([User(**make_user()), Client(**make_client()),
+                       Contract(**make_contract())])
+        setup.commit()
+
+    first, second = Session(), Session()
+    stale = Contract.get_object(first, id=1)
+    Contract.update_amount(second, 1, remaining_amount=300)
+    stale.remaining_amount = 200
+
+    with pytest.raises(ConcurrentUpdateError, match="Contract n°1"):
+        Contract._save_object(first, stale)
+
+    contract = Contract.update_amount(first, 1, remaining_amount=200)
+    assert (contract.remaining_amount, contract.version_id) == (200, 3)
+    first.close()
+    second.close()
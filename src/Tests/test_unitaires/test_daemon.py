@@ -0,0 +1,83 @@
+import asyncio
+import json
+from src.models.user import User
+from src.models.permission import PermissionManager
+from src.server.daemon import EpicDaemon
+
+
+def make_daemon(session):
+    """Crée un serveur utilisant la session de test."""
+    return EpicDaemon(session_factory=lambda: session)
+
+
+def login(daemon, session, role="GESTION"):
+    User.create_object(
+        session, username=f"daemon_{role}",
+        email=f"daemon_{role}@test.fr", password="password", role=role)
+    response = daemon.handle({
+        "action": "auth.login",
+        "params": {"username": f"daemon_{role}", "password": "password"},
+    })
+    assert response["ok"] is True
+    return response["data"]["token"]
+
+
+def test_daemon_login_and_report(session):
+    """Test qu'un utilisateur connecté peut lister les utilisateurs."""
+    daemon = make_daemon(session)
+    token = login(daemon, session)
+
+    response = daemon.handle({"action": "user.report", "token": token})
+
+    assert response["ok"] is True
+    assert response["data"][0]["username"] == "daemon_GESTION"
+    assert "password" not in response["data"][0]
+
+
+def test_daemon_refuses_without_token(session):
+    """Test qu'une requête sans token est refusée."""
+    daemon = make_daemon(session)
+
+    response = daemon.handle({"action": "client.report"})
+
+    assert response == {"ok": False, "error": "Vous devez être connecté."}
+
+
+def test_daemon_checks_permissions(session):
+    """Test qu'un support ne peut pas créer d'utilisateur."""
+    daemon = make_daemon(session)
+    token = login(daemon, session, role="SUPPORT")
+
+    response = daemon.handle({
+        "action": "user.create",
+        "token": token,
+        "params": {"username": "x", "email": "x@x.fr",
+                   "password": "x", "role": "SUPPORT"},
+    })
+
+    assert response["ok"] is False
+    assert "gestion" in response["error"]
+
+
+def test_daemon_unix_socket(session, tmp_path):
+    """Test d'un aller-retour JSON sur le socket Unix."""
+    daemon = make_daemon(session)
+    socket_path = str(tmp_path / "epic.sock")
+
+    async def scenario():
+        server = await daemon.start_unix(socket_path)
+        reader, writer = await asyncio.open_unix_connection(socket_path)
+        writer.write(b'{"action": "unknown"}\n')
+        await writer.drain()
+        response = json.loads(await reader.readline())
+        writer.close()
+        server.close()
+        await server.wait_closed()
+        return response
+
+    try:
+        response = asyncio.run(scenario())
+    finally:
+        PermissionManager.clear_cache()
+
+    assert response == {"ok": False, "error": "Action inconnue : unknown"}
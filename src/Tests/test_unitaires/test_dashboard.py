@@ -0,0 +1,54 @@
+import asyncio
+from datetime import datetime, timedelta
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from src.models.base import Base
+from src.models.user import User
+from src.models.client import Client
+from src.models.contract import Contract
+from src.models.event import Event
+from src.models.dashboard import Dashboard
+
+
+def test_dashboard_totals_per_commercial(tmp_path, make_user, make_client):
+    """Test des totaux agrégés par commercial."""
+    database_url = f"sqlite:///{tmp_path / 'dashboard.db'}"
+    engine = create_engine(database_url)
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+
+    commercial = User(**make_user(id=1, role="COMMERCIAL"))
+    support = User(**make_user(
+        id=2, username="support", email="s@test.fr", role="SUPPORT"))
+    client = Client(**make_client(commercial_id=1))
+    signed = Contract(id=1, client_id=1, commercial_id=1,
+                      total_amount=1000, remaining_amount=400, is_signed=True)
+    unsigned = Contract(id=2, client_id=1, commercial_id=1,
+                        total_amount=300, remaining_amount=300)
+    start = datetime.now() + timedelta(days=3)
+    upcoming = Event(contract_id=1, client_id=1, support_contact_id=2,
+                     start_date=start, end_date=start + timedelta(hours=2))
+    session.add_all([commercial, support, client, signed, unsigned, upcoming])
+    session.commit()
+    session.close()
+
+    async def fetch():
+        async_engine = create_async_engine(
+            database_url.replace("sqlite://", "sqlite+aiosqlite://"))
+        try:
+            return await Dashboard.fetch(async_sessionmaker(bind=async_engine))
+        finally:
+            await async_engine.dispose()
+
+    rows = asyncio.run(fetch())
+
+    assert rows == [{
+        "ID du commercial": 1,
+        "Commercial": "testuser",
+        "Clients": 1,
+        "Montant signé": 1000,
+        "Montant non signé": 300,
+        "Montant restant": 700,
+        "Événements à venir": 1,
+    }]
@@ -3,7 +3,7 @@ from src.models.event import Event
 from src.models.user import User
 from src.models.contract import Contract
 from src.models.client import Client
-from datetime import datetime
+from datetime import datetime, timedelta
 
 
 def test_create_event(
@@ -201,3 +201,55 @@ def test_delete_event_should_raise_error_no_event(mocker, session):
 
     with pytest.raises(Exception, match="L'événement n'existe pas"):
         Event.delete_object(session, event_id)
+
+
+@pytest.fixture
+def booked_support(session, make_user, make_client, make_contract):
+    """Support avec deux événements qui se chevauchent et un troisième."""
+    start = datetime.now().replace(microsecond=0) + timedelta(days=10)
+    session.add_all([
+        User(**make_user(id=1, role="SUPPORT")),
+        Client(**make_client(id=1)),
+        Contract(**make_contract(id=1)),
+    ])
+    for event_id, begin, hours in [(1, 0, 4), (2, 2, 4), (3, 8, 2)]:
+        session.add(Event(
+            id=event_id, contract_id=1, client_id=1, support_contact_id=1,
+            name=f"Événement {event_id}", location="Paris", attendees=10,
+            start_date=start + timedelta(hours=begin),
+            end_date=start + timedelta(hours=begin + hours)))
+    session.flush()
+    return start
+
+
+def test_create_event_should_raise_error_support_already_booked(
+        session, make_event, booked_support):
+    """Test qu'un support ne peut pas être réservé deux fois."""
+    event_fixture = make_event(
+        id=4,
+        start_date=(booked_support + timedelta(hours=7)).strftime(
+            "%Y-%m-%d %H:%M:%S"),
+        end_date=(booked_support + timedelta(hours=9)).strftime(
+            "%Y-%m-%d %H:%M:%S"))
+
+    with pytest.raises(Exception, match="déjà réservé.*n°3"):
+        Event.create_object(session, **event_fixture)
+
+
+def test_update_event_should_raise_error_support_already_booked(
+        session, booked_support):
+    """Test du contrôle de disponibilité lors d'un déplacement."""
+    Event.update_object(
+        session, 3, end_date=booked_support + timedelta(hours=12))
+
+    with pytest.raises(Exception, match="déjà réservé.*n°1"):
+        Event.update_object(
+            session, 3, start_date=booked_support + timedelta(hours=3))
+
+
+def test_conflicts_query_lists_each_double_booking_once(
+        session, booked_support):
+    """Test du rapport des doubles réservations."""
+    rows = session.execute(Event.conflicts_query()).tuples().all()
+
+    assert [(row[2], row[6]) for row in rows] == [(1, 2)]
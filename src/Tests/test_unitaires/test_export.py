@@ -0,0 +1,141 @@
+import csv
+import json
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy import create_engine, text
+from src.models.base import utc_now
+from src.models.contract import Contract
+from src.controllers.contract import (
+    export_contracts_query, get_filtered_contracts)
+from src.controllers.export import (
+    EXPORT_LAG, changes_queries, export_upper_bound, parse_watermark)
+from src.view.export_view import Export
+from database import backfill_updated_at
+
+
+@pytest.fixture
+def contracts(session, make_contract):
+    """Ajoute trois contrats dont deux signés."""
+    session.add_all([
+        Contract(**make_contract(id=1)),
+        Contract(**make_contract(id=2, remaining_amount=0)),
+        Contract(**make_contract(id=3, is_signed=False)),
+    ])
+    session.flush()
+
+
+def test_filtered_contracts_are_filtered_in_sql(session, contracts):
+    """Test des filtres SQL des rapports de contrats."""
+    signed = get_filtered_contracts(session, is_signed=True, amount_left=True)
+    unsigned = get_filtered_contracts(session, unsigned_only=True)
+
+    assert [contract.id for contract in signed] == [1]
+    assert [contract.id for contract in unsigned] == [3]
+
+
+def test_export_csv_in_chunks(session, contracts, tmp_path):
+    """Test d'un export CSV lu par paquets de deux lignes."""
+    path = tmp_path / "contracts.csv"
+
+    count = Export.write(
+        session, export_contracts_query(), path, "csv", chunk_size=2)
+
+    with open(path, newline="", encoding="utf-8") as file:
+        rows = list(csv.DictReader(file))
+    assert count == 3
+    assert [row["id"] for row in rows] == ["1", "2", "3"]
+    assert rows[0]["total_amount"] == "1000.0"
+
+
+def test_export_jsonl(session, contracts, tmp_path):
+    """Test d'un export JSONL filtré."""
+    path = tmp_path / "contracts.jsonl"
+
+    count = Export.write(
+        session, export_contracts_query(unsigned_only=True), path, "jsonl")
+
+    lines = [json.loads(line) for line in open(path, encoding="utf-8")]
+    assert count == 1
+    assert lines[0]["id"] == 3
+    assert lines[0]["is_signed"] is False
+
+
+def test_export_parquet(session, contracts, tmp_path):
+    """Test d'un export Parquet (nécessite pyarrow)."""
+    parquet = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "contracts.parquet"
+
+    count = Export.write(
+        session, export_contracts_query(), path, "parquet", chunk_size=2)
+
+    table = parquet.read_table(path)
+    assert count == 3
+    assert table.column("remaining_amount").to_pylist() == [500, 0, 500]
+
+
+def test_timestamps_are_evaluated_per_row(session, contracts):
+    """Test que created_at et updated_at sont calculés à chaque écriture."""
+    contract = session.get(Contract, 1)
+    created = contract.created_at
+    contract.remaining_amount = 10
+    session.flush()
+
+    assert utc_now() - created < timedelta(minutes=1)
+    assert contract.updated_at > created
+
+
+def test_changes_queries_select_rows_in_watermark_window(
+        session, contracts, tmp_path):
+    """Test de l'export des lignes modifiées depuis le dernier export."""
+    since = utc_now()
+    contract = session.get(Contract, 2)
+    contract.remaining_amount = 50
+    session.flush()
+    until = utc_now()
+
+    queries = changes_queries(since, until)
+    path = tmp_path / "contracts.jsonl"
+    count = Export.write(session, queries["contracts"], path, "jsonl")
+
+    assert count == 1
+    assert json.loads(path.read_text(encoding="utf-8"))["id"] == 2
+    assert session.execute(changes_queries(until, utc_now())[
+        "contracts"]).all() == []
+    assert "password" not in queries["users"].selected_columns.keys()
+
+
+def test_export_upper_bound_lags_behind_the_clock():
+    """Test de la borne haute : en retrait de l'horloge pour ne pas
+    manquer une écriture validée après l'export, jamais avant `since`."""
+    now = datetime(2025, 1, 31, 18, 0)
+
+    assert export_upper_bound(datetime(2025, 1, 30), now) == (
+        now - EXPORT_LAG)
+    assert export_upper_bound(now, now) == now
+
+def test_parse_watermark_converts_to_utc():
+    """Test de la lecture de l'horodatage --since."""
+    assert parse_watermark("2025-01-31T19:00:00+01:00") == datetime(
+        2025, 1, 31, 18, 0)
+    assert parse_watermark("2025-01-31") == datetime(2025, 1, 31)
+    with pytest.raises(Exception, match="Horodatage invalide"):
+        parse_watermark("hier")
+
+
+def test_backfill_updated_at_uses_created_at():
+    """Test de la migration des lignes sans updated_at."""
+    engine = create_engine("sqlite:///:memory:")
+    with engine.begin() as connection:
+        for table in ("users", "clients", "contracts", "events"):
+            connection.execute(text(
+                f"CREATE TABLE {table} (id INTEGER PRIMARY KEY, "
+                "created_at DATETIME, updated_at DATETIME)"))
+        connection.execute(text(
+            "INSERT INTO contracts (id, created_at) "
+            "VALUES (1, '2024-05-01 10:00:00.000000'), (2, NULL)"))
+
+    assert backfill_updated_at(engine) == 2
+    with engine.connect() as connection:
+        assert connection.execute(text(
+            "SELECT updated_at FROM contracts ORDER BY id")).scalars().all()[
+                0] == "2024-05-01 10:00:00.000000"
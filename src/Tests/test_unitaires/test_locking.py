@@ -0,0 +1,89 @@
+import multiprocessing
+import pytest
+from sqlalchemy import create_engine, select, func
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+from src.models.base import Base
+from src.models.user import User
+from src.models.client import Client
+from src.models.contract import Contract
+from src.models.payment import Payment
+from src.models.locking import (
+    DatabaseLockedError, configure_sqlite, lock_stats, retry_on_lock,
+    write_engine)
+
+WRITERS = 4
+PAYMENTS = 10
+
+
+def open_session(url):
+    engine = configure_sqlite(create_engine(url))
+    return sessionmaker(bind=write_engine(engine))()
+
+
+def pay(url):
+    """Processus écrivain : une série de petits paiements."""
+    session = open_session(url)
+    try:
+        for _ in range(PAYMENTS):
+            Payment.record(session, 1, 1)
+    finally:
+        session.close()
+    return lock_stats.snapshot()
+
+
+@pytest.fixture
+def url(tmp_path, make_user, make_client, make_contract):
+    url = f"sqlite:///{tmp_path / 'epic.db'}"
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    with sessionmaker(bind=engine)() as session:
+        session.add_all([
+            User(**make_user()), Client(**make_client()),
+            Contract(**make_contract(remaining_amount=1000))])
+        session.commit()
+    return url
+
+
+def test_concurrent_writers_all_commit(url):
+    """Test de plusieurs processus qui écrivent en même temps :
+    aucune écriture n'est perdue ni refusée pour verrou."""
+    context = multiprocessing.get_context("fork")
+    with context.Pool(WRITERS) as pool:
+        stats = pool.map(pay, [url] * WRITERS)
+
+    assert sum(stat["failures"] for stat in stats) == 0
+    with open_session(url) as session:
+        assert session.scalar(
+            select(func.count(Payment.id))) == WRITERS * PAYMENTS
+        assert session.get(Contract, 1).remaining_amount == (
+            1000 - WRITERS * PAYMENTS)
+
+
+def test_wal_profile_is_applied(url):
+    """Test du profil SQLite appliqué à la connexion."""
+    with open_session(url) as session:
+        assert session.connection().exec_driver_sql(
+            "PRAGMA journal_mode").scalar() == "wal"
+
+
+def test_retry_on_lock_backs_off_then_gives_up():
+    """Test des nouvelles tentatives sur verrou puis de l'abandon."""
+    lock_stats.reset()
+    attempts = []
+
+    def locked_twice():
+        attempts.append(1)
+        if len(attempts) <= 2:
+            raise OperationalError("BEGIN", {}, "database is locked")
+        return "ok"
+
+    assert retry_on_lock(locked_twice, backoff=0.001) == "ok"
+    assert lock_stats.retries == 2
+
+    def always_locked():
+        raise OperationalError("BEGIN", {}, "database is locked")
+
+    with pytest.raises(DatabaseLockedError):
+        retry_on_lock(always_locked, retries=1, backoff=0.001)
+    assert lock_stats.failures == 1
@@ -0,0 +1,110 @@
+import json
+import typer
+from typer.testing import CliRunner
+from src.config.metrics import MetricsRegistry, instrument, timed
+from src.config.recorder import WorkloadRecorder
+from src.controllers import contract
+from src.models.user import User
+
+runner = CliRunner()
+
+
+def build_app():
+    """Application Typer minimale avec une sous-application."""
+    app = typer.Typer()
+    contract_app = typer.Typer()
+
+    @contract_app.command(name="payment")
+    def payment(amount: int):
+        if amount < 0:
+            raise typer.Exit(code=1)
+
+    @contract_app.command()
+    def report():
+        pass
+
+    app.add_typer(contract_app, name="contract")
+    return app
+
+
+def test_instrumented_commands_are_recorded(tmp_path):
+    """Test des histogrammes et erreurs par sous-application et commande."""
+    path = str(tmp_path / "epic.prom")
+    app = build_app()
+    instrument(app, metrics_file=path)
+
+    runner.invoke(app, ["contract", "payment", "10"])
+    runner.invoke(app, ["contract", "payment", "--", "-5"])
+    runner.invoke(app, ["contract", "report"])
+
+    state = json.load(open(f"{path}.json"))
+    assert state["contract|payment"]["count"] == 2
+    assert state["contract|payment"]["errors"] == 1
+    assert state["contract|report"]["buckets"][-1] == 1
+    content = open(path).read()
+    assert ('epic_command_duration_seconds_bucket{app="contract",'
+            'command="payment",le="+Inf"} 2') in content
+    assert ('epic_command_errors_total{app="contract",'
+            'command="payment"} 1') in content
+
+
+def test_openmetrics_format_ends_with_eof(tmp_path):
+    """Test du format OpenMetrics."""
+    registry = MetricsRegistry(str(tmp_path / "epic.om"), "openmetrics")
+
+    registry.observe("event", "report", 0.2, queries=3)
+
+    content = open(tmp_path / "epic.om").read()
+    assert content.endswith("# EOF\n")
+    assert "# TYPE epic_command_db_queries counter" in content
+    assert 'le="0.25"} 1' in content and 'le="0.1"} 0' in content
+
+
+def test_recorder_logs_commands_with_secrets_redacted(tmp_path):
+    """Test du journal de charge : paramètres, secrets masqués, durée."""
+    path = str(tmp_path / "charge.jsonl")
+    app = build_app()
+    user_app = typer.Typer()
+
+    @user_app.command(name="update")
+    def update(user_id: int, password: str = typer.Option(None)):
+        pass
+
+    app.add_typer(user_app, name="user")
+    instrument(app, record_file=path)
+
+    runner.invoke(app, ["contract", "payment", "10"])
+    runner.invoke(app, ["user", "update", "2", "--password", "secret"])
+
+    entries = WorkloadRecorder(path).load()
+    assert [(entry["command"], entry["params"]) for entry in entries] == [
+        ("contract payment", {"amount": 10}),
+        ("user update", {"user_id": 2, "password": "***"}),
+    ]
+    assert all(entry["duration"] >= 0 and not entry["error"]
+               for entry in entries)
+    assert "secret" not in open(path).read()
+
+
+def test_failed_controller_is_counted_as_error(
+        tmp_path, mocker, session, make_user):
+    """Test qu'une commande qui affiche une erreur est comptée en erreur
+    dans les métriques et dans le journal de charge."""
+    mocker.patch("src.models.user_session.UserSession.get_current_user",
+                 return_value=User(**make_user(role="GESTION", id=2)))
+    mocker.patch("src.models.contract.Contract.get_object",
+                 return_value=None)
+    mocker.patch("src.models.contract.Contract.delete_object",
+                 side_effect=Exception("Le contrat n'existe pas"))
+    registry = MetricsRegistry(str(tmp_path / "epic.prom"))
+    recorder = WorkloadRecorder(str(tmp_path / "charge.jsonl"))
+    app = typer.Typer()
+    app.command(name="delete")(
+        timed("contract", "delete", contract.delete, registry, recorder))
+
+    result = runner.invoke(app, ["--id", "1"], obj={"session": session},
+                           input="y")
+
+    assert result.exit_code == 1
+    assert registry._load()["contract|delete"]["errors"] == 1
+    assert recorder.load()[0]["error"] is True
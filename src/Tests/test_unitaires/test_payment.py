@@ -0,0 +1,89 @@
+import json
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from src.models.base import Base
+from src.models.user import User
+from src.models.client import Client
+from src.models.contract import Contract
+from src.models.payment import Payment
+from src.models.audit import AuditLog
+
+
+@pytest.fixture
+def Session(tmp_path, make_user, make_client, make_contract):
+    """Base fichier avec un contrat de 1000 dont 1000 restent à payer."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'epic.db'}")
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    with Session() as session:
+        session.add_all([
+            User(**make_user()), Client(**make_client()),
+            Contract(**make_contract(remaining_amount=1000))])
+        session.commit()
+    return Session
+
+
+def test_payments_are_recorded_and_summed(Session):
+    """Test du registre et du relevé d'un contrat."""
+    with Session() as session:
+        session.info["actor_id"] = 1
+        assert Payment.record(session, 1, 300) == 700
+        assert Payment.record(session, 1, 200.5) == 499.5
+
+        contract, rows, total_paid = Payment.statement(session, 1)
+
+    assert total_paid == 500.5
+    assert [(amount, recorded_by) for _, _, amount, recorded_by in rows] == [
+        (300, 1), (200.5, 1)]
+    assert (contract.remaining_amount, contract.version_id) == (499.5, 3)
+
+
+def test_payment_cannot_exceed_remaining_amount(Session):
+    """Test qu'un paiement trop élevé est refusé sans rien écrire."""
+    with Session() as session:
+        with pytest.raises(Exception, match="dépasse le montant restant"):
+            Payment.record(session, 1, 1000.01)
+        with pytest.raises(Exception, match="doit être positif"):
+            Payment.record(session, 1, 0)
+        with pytest.raises(Exception, match="n'existe pas"):
+            Payment.record(session, 99, 10)
+
+        assert Payment.statement(session, 1)[2] == 0
+
+
+def test_concurrent_payments_never_overdraw(Session):
+    """Test de deux paiements simultanés : le solde est décrémenté
+    atomiquement, le second est refusé au lieu d'écraser le premier."""
+    first, second = Session(), Session()
+    Contract.get_object(first, id=1)
+    Contract.get_object(second, id=1)
+
+    assert Payment.record(first, 1, 600) == 400
+    with pytest.raises(Exception, match=r"dépasse le montant restant \(400"):
+        Payment.record(second, 1, 600)
+    assert Payment.record(second, 1, 400) == 0
+    first.close()
+    second.close()
+
+
+def test_total_change_is_saved_with_the_payment_only(Session):
+    """Test que le nouveau montant total n'est enregistré qu'avec le
+    paiement, dans la même transaction."""
+    with Session() as session:
+        with pytest.raises(Exception, match="dépasse le montant restant"):
+            Payment.record(session, 1, 1500, total_amount=2000)
+        assert session.get(Contract, 1).total_amount == 1000
+
+        assert Payment.record(session, 1, 20, total_amount=1200) == 980.0
+
+        session.expire_all()
+        contract = session.get(Contract, 1)
+        assert (contract.total_amount, contract.remaining_amount) == (
+            1200, 980)
+        changes = json.loads(
+            AuditLog.history(session, "contracts", 1)[0][5])
+    assert changes == {"total_amount": [1000, 1200],
+                       "remaining_amount": [1000, 980]}
+    assert all(isinstance(value, float)
+               for value in changes["remaining_amount"])
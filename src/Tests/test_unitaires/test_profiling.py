@@ -0,0 +1,34 @@
+from src.config.profiling import Profiler, layer_of
+from src.models.client import Client
+from src.view.display_view import Display
+
+
+def test_layer_of_classifies_functions():
+    """Test du classement des fonctions par couche."""
+    sql = ("~", 0, "<method 'execute' of 'sqlite3.Cursor' objects>")
+
+    assert layer_of(sql) == "sql"
+    assert layer_of(("/app/src/models/client.py", 1, "f")) == "model"
+    assert layer_of(("/app/src/models/permission.py", 1, "f")) == "permission"
+    assert layer_of(("/app/src/view/display_view.py", 1, "f")) == "display"
+    assert layer_of(("/usr/lib/rich/table.py", 1, "f")) is None
+
+
+def test_profiler_reports_layers(session, make_client, tmp_path, capsys):
+    """Test du profilage : fichier .pstats et temps par couche."""
+    session.add(Client(**make_client()))
+    session.flush()
+    profiler = Profiler(output=str(tmp_path / "run.pstats"), top=5)
+
+    profiler.start()
+    Client.get_all_object(session)
+    Display().rows("Clients", ["ID"], [(1,)])
+    stats = profiler.stop()
+    capsys.readouterr()
+
+    times = Profiler.layer_times(stats)
+    assert (tmp_path / "run.pstats").exists()
+    assert times["Modèles"] > 0
+    assert times["Exécution SQL"] > 0
+    assert times["Rendu (Display)"] > 0
+    assert "Temps par couche" in profiler.report(stats)
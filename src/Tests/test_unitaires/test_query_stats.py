@@ -0,0 +1,46 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from src.config.query_stats import assert_max_queries, track_queries
+from src.models.client import Client
+from src.models.report import CLIENT_REPORT
+
+
+def test_track_queries_counts_statements(session, make_client):
+    """Test du comptage des requêtes SQL d'un bloc."""
+    session.add(Client(**make_client()))
+    session.flush()
+
+    with track_queries() as queries:
+        Client.get_object(session, id=1)
+        Client.get_all_object(session)
+
+    assert queries.count == 2
+    assert queries.duration > 0
+
+
+def test_report_rows_use_a_single_query(session, make_client):
+    """Test que le rapport client est lu en une seule requête."""
+    session.add(Client(**make_client()))
+    session.flush()
+
+    with assert_max_queries(1):
+        CLIENT_REPORT.rows(session)
+
+
+def test_assert_max_queries_fails_above_limit(session):
+    """Test de l'échec quand trop de requêtes sont exécutées."""
+    with pytest.raises(AssertionError, match="3 requêtes SQL"):
+        with assert_max_queries(2):
+            for client_id in range(3):
+                Client.get_object(session, id=client_id)
+
+
+def test_failed_statement_does_not_leak_its_start_time(session):
+    """Test qu'une requête en erreur ne laisse pas son heure de début
+    sur la connexion (les mesures suivantes resteraient décalées)."""
+    connection = session.connection()
+    with pytest.raises(OperationalError):
+        connection.execute(text("SELECT * FROM table_absente"))
+
+    assert connection.info.get("query_start") == []
@@ -0,0 +1,55 @@
+from datetime import datetime
+from src.models.user import User
+from src.models.client import Client
+from src.models.report import CLIENT_REPORT, EVENT_REPORT
+from src.models.validators import DateTimeUtils
+from src.view.display_view import Display
+
+
+def test_client_report_rows_join_commercial(session, make_user, make_client):
+    """Test que les lignes du rapport client incluent le commercial."""
+    session.add_all([
+        User(**make_user(id=1, username="alice")),
+        Client(**make_client(id=1, commercial_id=1)),
+        Client(**make_client(id=2, email="b@test.fr", commercial_id=9)),
+    ])
+    session.flush()
+
+    rows = CLIENT_REPORT.rows(session)
+
+    assert len(CLIENT_REPORT.headers) == len(rows[0])
+    assert rows[0][0] == 1
+    assert rows[0][-1] == "alice"
+    assert rows[1][-1] == "Non attribué"
+
+
+def test_event_report_headers_are_shared():
+    """Test que les en-têtes du rapport correspondent aux colonnes SQL."""
+    assert len(EVENT_REPORT.headers) == len(EVENT_REPORT.columns)
+    assert EVENT_REPORT.headers[-1] == "Notes"
+
+
+def test_format_datetime_is_cached():
+    """Test que le formatage d'une même date est mis en cache."""
+    DateTimeUtils.format_datetime.cache_clear()
+    date = datetime(2030, 5, 1, 9, 30)
+
+    DateTimeUtils.format_datetime(date)
+    formatted = DateTimeUtils.format_datetime(date)
+
+    assert formatted == "2030-05-01 09:30:00"
+    assert DateTimeUtils.format_datetime.cache_info().hits == 1
+
+
+def test_display_rows_excludes_headers(capsys):
+    """Test de l'affichage des lignes avec exclusion d'en-têtes."""
+    Display().rows(
+        title="Rapport",
+        headers=["ID", "Nom", "Date"],
+        rows=[(1, "Salon", datetime(2030, 5, 1, 9, 30))],
+        exclude_headers=["Nom"],
+    )
+
+    output = capsys.readouterr().out
+    assert "2030-05-01 09:30:00" in output
+    assert "Salon" not in output
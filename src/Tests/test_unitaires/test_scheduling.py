@@ -0,0 +1,72 @@
+import pytest
+from datetime import datetime, timedelta
+from src.models.user import User
+from src.models.client import Client
+from src.models.contract import Contract
+from src.models.event import Event
+from src.models.scheduling import AutoAssign, SupportSchedule
+
+START = datetime.now().replace(microsecond=0) + timedelta(days=10)
+
+
+def add_event(session, event_id, begin, hours, support_id=None):
+    session.add(Event(
+        id=event_id, contract_id=1, client_id=1,
+        support_contact_id=support_id, name=f"Événement {event_id}",
+        location="Paris", attendees=10,
+        start_date=START + timedelta(hours=begin),
+        end_date=START + timedelta(hours=begin + hours)))
+
+
+@pytest.fixture
+def supports(session, make_user, make_client, make_contract):
+    """Deux supports, l'un déjà réservé huit heures."""
+    session.add_all([
+        User(**make_user(id=1, role="SUPPORT")),
+        User(**make_user(id=2, username="s2", email="s2@test.fr",
+                         role="SUPPORT")),
+        User(**make_user(id=3, username="g", email="g@test.fr",
+                         role="GESTION")),
+        Client(**make_client(id=1)),
+        Contract(**make_contract(id=1)),
+    ])
+    add_event(session, 1, 0, 8, support_id=1)
+    session.flush()
+
+
+def test_schedule_detects_overlaps():
+    """Test de la recherche de chevauchement dans un planning trié."""
+    schedule = SupportSchedule(1)
+    schedule.book(START, START + timedelta(hours=10))
+    schedule.book(START + timedelta(hours=20), START + timedelta(hours=21))
+
+    assert not schedule.is_available(
+        START + timedelta(hours=9), START + timedelta(hours=12))
+    assert schedule.is_available(
+        START + timedelta(hours=10), START + timedelta(hours=20))
+    assert schedule.hours == 11
+
+
+def test_auto_assign_balances_workload(session, supports):
+    """Test que le support le moins chargé et disponible est choisi."""
+    add_event(session, 2, 1, 2)
+    add_event(session, 3, 2, 2)
+    add_event(session, 4, 9, 1)
+    session.flush()
+
+    assignments, unassigned = AutoAssign.plan(session)
+
+    assert assignments == [(2, 2), (4, 2)]
+    assert unassigned == [3]
+
+
+def test_auto_assign_writes_in_one_transaction(session, supports, mocker):
+    """Test de l'écriture groupée des assignations."""
+    add_event(session, 2, 10, 2)
+    session.flush()
+    commit = mocker.patch.object(session, "commit")
+
+    AutoAssign.run(session)
+
+    commit.assert_called_once()
+    assert Event.get_object(session, id=2).support_contact_id == 2
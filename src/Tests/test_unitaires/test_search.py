@@ -0,0 +1,58 @@
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from src.models.base import Base
+from src.models.user import User
+from src.models.client import Client
+from src.models.contract import Contract
+from src.models.event import Event
+from src.models.search import Search
+
+
+@pytest.fixture
+def db_session(make_user, make_client, make_contract):
+    """Base en mémoire avec les index plein texte."""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    start = datetime.now() + timedelta(days=5)
+    session.add_all([
+        User(**make_user(id=1)),
+        Client(**make_client(id=1, company_name="Dupont Événements")),
+        Client(**make_client(id=2, email="b@test.fr",
+                             company_name="Martin Conseil")),
+        Contract(**make_contract(id=1)),
+        Event(id=1, contract_id=1, client_id=2, name="Gala annuel",
+              location="Lyon", attendees=50, notes="Salle Dupont",
+              start_date=start, end_date=start + timedelta(hours=4)),
+    ])
+    session.commit()
+    yield session
+    session.close()
+
+
+def test_search_ranks_hits_across_clients_and_events(db_session):
+    """Test d'une recherche sur les clients et les événements."""
+    rows = Search.find(db_session, ["dupon"])
+
+    assert {(row[0], row[1]) for row in rows} == {
+        ("Client", 1), ("Événement", 1)}
+
+
+def test_search_ignores_accents_and_follows_updates(db_session):
+    """Test de la synchronisation par triggers et des accents."""
+    assert Search.find(db_session, ["evenements"])[0][1] == 1
+
+    Client.update_object(db_session, 2, company_name="Lefèvre Voyages")
+    Event.delete_object(db_session, 1)
+
+    assert Search.find(db_session, ["martin", "conseil"]) == []
+    assert Search.find(db_session, ["lefevre"])[0][1] == 2
+    assert Search.find(db_session, ["gala"]) == []
+
+
+def test_search_requires_a_term(db_session):
+    """Test qu'une recherche sans mot valide est refusée."""
+    with pytest.raises(Exception, match="Aucun terme"):
+        Search.find(db_session, ["*", '"'])
@@ -0,0 +1,92 @@
+import pytest
+from datetime import datetime
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+from src.models.base import Base
+from src.models.user import User
+from src.models.client import Client
+from src.models.contract import Contract
+from src.models.event import Event
+from src.models.seed import Seeder
+from src.models.summary import CommercialSummary
+from src.models.validators import ContractValidator, ClientValidator
+
+
+@pytest.fixture
+def db_session():
+    """Base en mémoire avec les triggers de synthèse."""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def seed(session, seed=7):
+    return Seeder(seed=seed, batch_size=50).run(
+        session, users=10, clients=120, contracts=150, events=200)
+
+
+def test_seed_respects_business_constraints(db_session):
+    """Test des contraintes métier des données générées."""
+    counts = seed(db_session)
+
+    assert counts == {
+        "users": 10, "clients": 120, "contracts": 150, "events": 200}
+    roles = dict(db_session.execute(select(User.id, User.role)).all())
+    assert [roles[1], roles[2], roles[3]] == [
+        "GESTION", "COMMERCIAL", "SUPPORT"]
+    for client in Client.get_all_object(db_session):
+        assert roles[client.commercial_id] == "COMMERCIAL"
+    contracts = {c.id: c for c in Contract.get_all_object(db_session)}
+    for contract in contracts.values():
+        assert 0 <= contract.remaining_amount <= contract.total_amount
+    for event in Event.get_all_object(db_session):
+        assert contracts[event.contract_id].is_signed
+        assert event.client_id == contracts[event.contract_id].client_id
+        assert roles[event.support_contact_id] == "SUPPORT"
+        assert datetime.now() < event.start_date < event.end_date
+
+
+def test_seed_never_double_books_a_support(db_session):
+    """Test qu'aucun support n'a deux événements qui se chevauchent."""
+    seed(db_session)
+
+    slots = {}
+    for event in Event.get_all_object(db_session):
+        slots.setdefault(event.support_contact_id, []).append(
+            (event.start_date, event.end_date))
+    for dates in slots.values():
+        dates.sort()
+        for (_, end), (start, _) in zip(dates, dates[1:]):
+            assert end <= start
+
+
+def test_seed_is_deterministic(db_session):
+    """Test qu'une même graine produit les mêmes données."""
+    seed(db_session)
+    other = sessionmaker(bind=create_engine("sqlite:///:memory:"))()
+    Base.metadata.create_all(other.get_bind())
+    seed(other)
+
+    query = select(Contract.client_id, Contract.total_amount,
+                   Contract.is_signed).order_by(Contract.id)
+    assert (db_session.execute(query).all() == other.execute(query).all())
+    other.close()
+
+
+def test_seed_rebuilds_summaries(db_session):
+    """Test que les synthèses sont recalculées après le chargement."""
+    seed(db_session)
+
+    total = sum(s.contract_count
+                for s in CommercialSummary.get_all_object(db_session))
+    assert total == 150
+
+
+def test_batch_validators_report_first_invalid_row():
+    """Test des validateurs par lot."""
+    with pytest.raises(Exception, match="Ligne 1"):
+        ContractValidator.validate_amounts_batch([100, 100], [50, 150])
+    with pytest.raises(Exception, match="double"):
+        ClientValidator.validate_emails_batch(["a@b.fr", "a@b.fr"])
@@ -0,0 +1,103 @@
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from src.models.base import Base
+from src.models.user import User
+from src.models.client import Client
+from src.models.contract import Contract
+from src.models.event import Event
+from src.models.summary import ClientSummary, CommercialSummary, Summary
+
+
+@pytest.fixture
+def db_session():
+    """Base en mémoire avec les triggers de synthèse."""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def snapshot(session):
+    """Retourne le contenu des tables de synthèse."""
+    session.expire_all()
+    return (
+        [(s.client_id, s.contract_count, s.signed_count, s.total_amount,
+          s.remaining_amount, s.event_count)
+         for s in ClientSummary.get_all_object(session)],
+        [(s.commercial_id, s.client_count, s.contract_count, s.signed_count,
+          s.total_amount, s.remaining_amount, s.event_count)
+         for s in CommercialSummary.get_all_object(session)],
+    )
+
+
+def test_summaries_follow_contract_and_event_changes(
+        db_session, make_user, make_client):
+    """Test que les triggers tiennent les totaux à jour."""
+    db_session.add_all([
+        User(**make_user(id=1, role="COMMERCIAL")),
+        User(**make_user(id=2, username="s", email="s@t.fr", role="SUPPORT")),
+    ])
+    db_session.commit()
+    Client.create_object(db_session, **make_client(commercial_id=1))
+    contract = Contract.create_object(
+        db_session, client_id=1, commercial_id=1,
+        total_amount=1000, remaining_amount=1000)
+    Contract.create_object(
+        db_session, client_id=1, commercial_id=1,
+        total_amount=200, remaining_amount=50)
+    Contract.sign_object(db_session, contract.id)
+    Contract.update_amount(db_session, contract.id, remaining_amount=600)
+    start = datetime.now() + timedelta(days=2)
+    event = Event.create_object(
+        db_session, contract_id=contract.id, client_id=1,
+        support_contact_id=2, name="Salon",
+        start_date=start.strftime("%Y-%m-%d %H:%M:%S"),
+        end_date=(start + timedelta(hours=3)).strftime("%Y-%m-%d %H:%M:%S"),
+        location="Lyon", attendees=20)
+
+    assert snapshot(db_session) == (
+        [(1, 2, 1, 1200, 650, 1)],
+        [(1, 1, 2, 1, 1200, 650, 1)],
+    )
+
+    Event.delete_object(db_session, event.id)
+    Contract.delete_object(db_session, contract.id)
+
+    assert snapshot(db_session) == (
+        [(1, 1, 0, 200, 50, 0)],
+        [(1, 1, 1, 0, 200, 50, 0)],
+    )
+
+
+def test_rebuild_matches_incremental_totals(
+        db_session, make_user, make_client):
+    """Test que le recalcul complet donne les mêmes totaux."""
+    db_session.add(User(**make_user(id=1, role="COMMERCIAL")))
+    db_session.commit()
+    Client.create_object(db_session, **make_client(commercial_id=1))
+    Contract.create_object(
+        db_session, client_id=1, commercial_id=1,
+        total_amount=500, remaining_amount=100, is_signed=True)
+    incremental = snapshot(db_session)
+
+    Summary.rebuild(db_session)
+
+    assert snapshot(db_session) == incremental
+
+
+def test_deleted_client_leaves_no_summary(
+        db_session, make_user, make_client):
+    """Test que la suppression d'un client retire sa synthèse, comme
+    le recalcul complet."""
+    db_session.add(User(**make_user(id=1, role="COMMERCIAL")))
+    db_session.commit()
+    Client.create_object(db_session, **make_client(commercial_id=1))
+
+    Client.delete_object(db_session, 1)
+
+    assert snapshot(db_session) == ([], [(1, 0, 0, 0, 0, 0, 0)])
+    Summary.rebuild(db_session)
+    assert snapshot(db_session)[0] == []
@@ -0,0 +1,90 @@
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+from src.models.base import Base
+from src.models.user import User
+from src.models.client import Client
+from src.models.contract import Contract  # noqa: F401 (triggers de synthèse)
+from src.models.event import Event  # noqa: F401
+from src.models.summary import CommercialSummary
+from src.models.sync import ClientSync
+
+HEADER = "first_name,last_name,email,phone,company_name,commercial_id\n"
+
+
+@pytest.fixture
+def db_session(make_user):
+    """Base en mémoire avec un commercial."""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add(User(**make_user(id=1)))
+    session.commit()
+    yield session
+    session.close()
+
+
+def write_extract(tmp_path, lines):
+    path = tmp_path / "clients.csv"
+    path.write_text(HEADER + "".join(f"{line}\n" for line in lines),
+                    encoding="utf-8")
+    return str(path)
+
+
+def test_sync_inserts_updates_and_skips_unchanged(db_session, tmp_path):
+    """Test des trois cas : création, mise à jour et ligne inchangée."""
+    first = write_extract(tmp_path, [
+        "Jean,Dupont,jean@test.fr,06 12 34 56 78,Dupont SA,1",
+        "Marie,Martin,marie@test.fr,06 98 76 54 32,Martin SARL,1",
+    ])
+    assert ClientSync(batch_size=1).run(db_session, first) == {
+        "inserted": 2, "updated": 0, "unchanged": 0, "rejected": 0}
+
+    second = write_extract(tmp_path, [
+        "Jean,Dupont,JEAN@test.fr ,06 12 34 56 78,Dupont SA,1",
+        "Marie,Martin,marie@test.fr,06 98 76 54 32,Martin Conseil,1",
+        "Paul,Petit,paul@test.fr,06 11 11 11 11,Petit & Fils,1",
+    ])
+    assert ClientSync().run(db_session, second) == {
+        "inserted": 1, "updated": 1, "unchanged": 1, "rejected": 0}
+
+    clients = db_session.scalars(select(Client).order_by(Client.id)).all()
+    assert [client.company_name for client in clients] == [
+        "Dupont SA", "Martin Conseil", "Petit & Fils"]
+    assert clients[2].phone_normalized == "+33611111111"
+    assert [client.version_id for client in clients] == [1, 2, 1]
+    assert db_session.get(CommercialSummary, 1).client_count == 3
+
+
+def test_sync_rejects_invalid_rows(db_session, tmp_path):
+    """Test des lignes rejetées : email, commercial et téléphone pris."""
+    path = write_extract(tmp_path, [
+        "Jean,Dupont,jean@test.fr,06 12 34 56 78,Dupont SA,1",
+        "Marie,Martin,sans-arobase,06 98 76 54 32,Martin SARL,1",
+        "Paul,Petit,paul@test.fr,06 11 11 11 11,Petit & Fils,9",
+        "Léa,Leroy,lea@test.fr,+33 6 12 34 56 78,Leroy SAS,1",
+        "Hugo,Simon,hugo@test.fr,06 22 22 22 22,Simon SA,",
+    ])
+    synchronizer = ClientSync(commercial_id=None)
+
+    counts = synchronizer.run(db_session, path)
+
+    assert counts == {
+        "inserted": 1, "updated": 0, "unchanged": 0, "rejected": 4}
+    assert synchronizer.errors[0] == "ligne 3 : L'email doit être valide"
+    assert synchronizer.errors[-1] == (
+        "ligne 5 : Un client avec ce téléphone existe déjà")
+
+
+def test_sync_default_commercial_and_missing_columns(db_session, tmp_path):
+    """Test du commercial par défaut et d'un fichier incomplet."""
+    path = tmp_path / "clients.csv"
+    path.write_text("first_name,last_name,email,phone,company_name\n"
+                    "Jean,Dupont,jean@test.fr,0612345678,Dupont SA\n",
+                    encoding="utf-8")
+    assert ClientSync(commercial_id=1).run(
+        db_session, str(path))["inserted"] == 1
+
+    path.write_text("first_name,email\nJean,jean@test.fr\n", encoding="utf-8")
+    with pytest.raises(Exception, match="Colonnes manquantes"):
+        ClientSync(commercial_id=1).run(db_session, str(path))
@@ -0,0 +1,45 @@
+import json
+import pytest
+from src.config.tracing import tracer
+from src.models.client import Client
+from src.view.display_view import Display
+
+
+@pytest.fixture
+def active_tracer():
+    """Active le traçage le temps d'un test."""
+    tracer.enable()
+    yield tracer
+    tracer.disable()
+
+
+def test_spans_cover_models_sql_and_rendering(
+        active_tracer, session, make_client, tmp_path, capsys):
+    """Test des spans modèles, SQL et rendu au format Chrome trace."""
+    session.add(Client(**make_client()))
+    session.flush()
+    active_tracer.events.clear()
+
+    with active_tracer.span("commande", "cli"):
+        Client.get_object(session, id=1)
+        Display().rows("Clients", ["ID"], [(1,)])
+    path = tmp_path / "trace.json"
+    active_tracer.write(path)
+
+    events = json.load(open(path))["traceEvents"]
+    names = {(e["cat"], e["name"]) for e in events}
+    assert ("model", "Client.get_object") in names
+    assert ("render", "Display.rows") in names
+    assert any(e["cat"] == "sql" for e in events)
+    root = next(e for e in events if e["name"] == "commande")
+    assert all(e["ph"] == "X" and e["ts"] >= root["ts"] for e in events)
+
+
+def test_spans_are_not_recorded_when_disabled(session):
+    """Test que rien n'est enregistré sans EPIC_TRACE."""
+    tracer.events = []
+
+    with tracer.span("ignoré"):
+        Client.get_all_object(session)
+
+    assert tracer.events == []
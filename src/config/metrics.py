@@ -0,0 +1,175 @@
+import json
+import os
+import time
+from contextlib import contextmanager
+from functools import wraps
+import click
+import typer
+from src.config.query_stats import track_queries
+from src.config.recorder import RECORD_FILE, WorkloadRecorder
+from src.config.tracing import tracer
+
+try:
+    import fcntl
+except ImportError:  # Windows : pas de verrou entre processus
+    fcntl = None
+
+METRICS_FILE = os.getenv("EPIC_METRICS_FILE", "")
+METRICS_FORMAT = os.getenv("EPIC_METRICS_FORMAT", "prometheus")
+
+BUCKETS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0]
+
+
+class MetricsRegistry:
+    """
+    Métriques des commandes, cumulées entre les exécutions de la CLI.
+    L'état est conservé en JSON à côté du fichier exporté, puis réécrit
+    au format texte Prometheus (ou OpenMetrics) à chaque commande,
+    pour le collecteur textfile de node_exporter.
+        args: path (str) : fichier exporté,
+              export_format (str) : "prometheus" ou "openmetrics"
+    """
+
+    def __init__(self, path, export_format="prometheus"):
+        self.path = path
+        self.state_path = f"{path}.json"
+        self.export_format = export_format
+
+    @contextmanager
+    def _locked(self):
+        with open(f"{self.path}.lock", "w") as lock:
+            if fcntl:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            yield
+
+    def _load(self):
+        if not os.path.exists(self.state_path):
+            return {}
+        with open(self.state_path, encoding="utf-8") as file:
+            return json.load(file)
+
+    def _write(self, path, content):
+        """Écriture atomique : le collecteur ne lit jamais
+        un fichier partiel"""
+        temporary = f"{path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as file:
+            file.write(content)
+        os.replace(temporary, path)
+
+    def observe(self, app, command, duration, error=False, queries=0):
+        """Enregistre une exécution de commande et réécrit les fichiers"""
+        with self._locked():
+            state = self._load()
+            series = state.setdefault(f"{app}|{command}", {
+                "buckets": [0] * len(BUCKETS), "count": 0, "sum": 0.0,
+                "errors": 0, "queries": 0,
+            })
+            for index, bound in enumerate(BUCKETS):
+                if duration <= bound:
+                    series["buckets"][index] += 1
+            series["count"] += 1
+            series["sum"] += duration
+            series["errors"] += int(error)
+            series["queries"] += queries
+            self._write(self.state_path, json.dumps(state))
+            self._write(self.path, self.render(state))
+
+    def render(self, state):
+        """Formate l'état au format texte Prometheus / OpenMetrics"""
+        openmetrics = self.export_format == "openmetrics"
+        suffix = "" if openmetrics else "_total"
+        lines = [
+            "# HELP epic_command_duration_seconds Durée des commandes",
+            "# TYPE epic_command_duration_seconds histogram",
+        ]
+        for key, series in sorted(state.items()):
+            labels = self._labels(key)
+            for bound, count in zip(BUCKETS, series["buckets"]):
+                lines.append(
+                    f'epic_command_duration_seconds_bucket{{{labels},'
+                    f'le="{bound}"}} {count}')
+            lines += [
+                f'epic_command_duration_seconds_bucket{{{labels},'
+                f'le="+Inf"}} {series["count"]}',
+                f"epic_command_duration_seconds_count{{{labels}}} "
+                f"{series['count']}",
+                f"epic_command_duration_seconds_sum{{{labels}}} "
+                f"{series['sum']:.6f}",
+            ]
+        for name, field, description in [
+            ("epic_command_errors", "errors", "Commandes en erreur"),
+            ("epic_command_db_queries", "queries", "Requêtes SQL exécutées"),
+        ]:
+            lines += [f"# HELP {name}{suffix} {description}",
+                      f"# TYPE {name}{suffix} counter"]
+            lines += [
+                f"{name}_total{{{self._labels(key)}}} {series[field]}"
+                for key, series in sorted(state.items())
+            ]
+        if openmetrics:
+            lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _labels(key):
+        app, command = key.split("|")
+        return f'app="{app}",command="{command}"'
+
+
+def timed(app_name, command_name, func, registry=None, recorder=None):
+    """
+    Enveloppe une commande Typer : durée, erreurs, requêtes SQL et span
+    de trace. Le nom complet de la commande est aussi placé dans `ctx.meta`.
+    Avec `recorder`, l'exécution est ajoutée au journal de charge.
+    """
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        label = f"{app_name} {command_name}".strip()
+        ctx = click.get_current_context(silent=True)
+        if ctx:
+            ctx.meta["command"] = label
+        error = False
+        start = time.perf_counter()
+        with track_queries() as queries, tracer.span(label, "cli"):
+            try:
+                return func(*args, **kwargs)
+            except (typer.Exit, SystemExit) as e:
+                code = getattr(e, "exit_code", getattr(e, "code", 1))
+                error = code not in (0, None)
+                raise
+            except Exception:
+                error = True
+                raise
+            finally:
+                duration = time.perf_counter() - start
+                if registry:
+                    registry.observe(
+                        app_name or "main", command_name,
+                        duration, error, queries.count)
+                if recorder:
+                    recorder.record(
+                        label, ctx.params if ctx else kwargs,
+                        duration, queries.count, error)
+
+    return wrapper
+
+
+def instrument(app, metrics_file=METRICS_FILE, export_format=METRICS_FORMAT,
+               record_file=RECORD_FILE):
+    """
+    Enveloppe toutes les commandes enregistrées sur l'application
+    (sous-applications comprises). Sans fichier de métriques ni journal
+    de charge, seul le nom de la commande est renseigné.
+    """
+    registry = (MetricsRegistry(metrics_file, export_format)
+                if metrics_file else None)
+    recorder = WorkloadRecorder(record_file) if record_file else None
+    groups = [("", app)] + [
+        (group.name, group.typer_instance) for group in app.registered_groups
+    ]
+    for app_name, typer_app in groups:
+        for command in typer_app.registered_commands:
+            name = command.name or command.callback.__name__.replace("_", "-")
+            command.callback = timed(
+                app_name, name, command.callback, registry, recorder)
+    return registry
@@ -40,6 +40,10 @@ class PermissionRule:
                 "name": "update_own_events",
                 "description": "Modifier ses propres événements",
             },
+            {
+                "name": "manage_all_events",
+                "description": "Gérer tous les événements",
+            },
         ]
 
         for permission_data in permissions:
@@ -71,6 +75,14 @@ class PermissionRule:
                 "error_message":
                     "Seule l'équipe de gestion peut gérer tous les contrats",
             },
+            {
+                "permission_name": "manage_all_events",
+                "attribute": "user.role",
+                "operator": "==",
+                "value": "GESTION",
+                "error_message":
+                    "Seule l'équipe de gestion peut gérer tous les événements",
+            },
             # Règles pour l'équipe commerciale
             {
                 "permission_name": "create_clients",
@@ -0,0 +1,111 @@
+import cProfile
+import io
+import os
+import pstats
+import time
+
+LAYERS = {
+    "Modèles": "model",
+    "Exécution SQL": "sql",
+    "Rendu (Display)": "display",
+}
+
+AUTH_FILES = ("permission.py", "user_session.py", "authentication.py")
+
+
+def _path(filename):
+    return filename.replace(os.sep, "/")
+
+
+def is_project_code(filename):
+    """Indique si le fichier appartient à l'application (hors bibliothèques)"""
+    path = _path(filename)
+    return "/src/" in path or path.endswith("main.py")
+
+
+def layer_of(key):
+    """Retourne la couche d'une fonction pstats (fichier, ligne, nom)"""
+    filename, _, name = key
+    path = _path(filename)
+    if filename == "~" and "sqlite3." in name and (
+            "execute" in name or "fetch" in name):
+        return "sql"
+    if "/src/view/display_view.py" in path:
+        return "display"
+    if "/src/models/" in path:
+        if path.endswith(AUTH_FILES):
+            return "permission"
+        return "model"
+    return None
+
+
+class Profiler:
+    """
+    Profilage d'une commande avec cProfile.
+    Le rapport donne les fonctions les plus coûteuses et le temps
+    cumulé par couche (permissions, modèles, SQL, rendu).
+    Les temps sont inclusifs : le temps SQL d'une méthode de modèle
+    est compté dans les deux couches.
+        args: output (str) : fichier .pstats à écrire,
+              top (int) : nombre de fonctions du résumé
+    """
+
+    def __init__(self, output="epic_profile.pstats", top=20):
+        self.output = output
+        self.top = top
+        self.profile = cProfile.Profile()
+        self.elapsed = 0.0
+
+    def start(self):
+        self.started = time.perf_counter()
+        self.profile.enable()
+
+    def stop(self):
+        self.profile.disable()
+        self.elapsed = time.perf_counter() - self.started
+        self.profile.dump_stats(self.output)
+        return pstats.Stats(self.output)
+
+    @staticmethod
+    def layer_times(stats):
+        """
+        Temps cumulé par couche, en secondes.
+        Seuls les appels entrant dans une couche depuis le code de
+        l'application (ou au démarrage du profil) sont comptés, pour ne
+        pas additionner deux fois les appels imbriqués. Le SQL est
+        toujours appelé par SQLAlchemy.
+        Le temps de `requires_permission` exclut la commande décorée.
+        """
+        times = {name: 0.0 for name in ["requires_permission", *LAYERS]}
+        labels = {key: label for label, key in LAYERS.items()}
+        for key, (_, _, _, cumulative, callers) in stats.stats.items():
+            layer = layer_of(key)
+            if layer in labels and not callers:
+                times[labels[layer]] += cumulative
+            for caller, (_, _, _, cumulative) in callers.items():
+                entering = layer_of(caller) != layer and (
+                    layer == "sql" or is_project_code(caller[0]))
+                if layer in labels and entering:
+                    times[labels[layer]] += cumulative
+                if (_path(caller[0]).endswith("/src/models/permission.py")
+                        and caller[2] == "wrapper"
+                        and "/src/controllers/" in _path(key[0])):
+                    times["requires_permission"] -= cumulative
+            if (_path(key[0]).endswith("/src/models/permission.py")
+                    and key[2] == "wrapper"):
+                times["requires_permission"] += stats.stats[key][3]
+        return times
+
+    def report(self, stats):
+        """Retourne le résumé texte : couches puis fonctions principales"""
+        lines = ["⏱️  Temps par couche (cumulé) :"]
+        for name, seconds in self.layer_times(stats).items():
+            lines.append(f"  {name:<22} {seconds * 1000:>10.1f} ms")
+        lines.append(f"  {'Total':<22} {self.elapsed * 1000:>10.1f} ms")
+
+        buffer = io.StringIO()
+        stats.stream = buffer
+        stats.sort_stats("cumulative").print_stats(self.top)
+        lines.append(buffer.getvalue().rstrip())
+        lines.append(f"📄 Profil complet écrit dans {self.output}")
+        return "\n".join(lines)
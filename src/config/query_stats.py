@@ -0,0 +1,92 @@
+import os
+import threading
+import time
+from contextlib import contextmanager
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from src.config.sentry_base import logger
+
+SLOW_QUERY_MS = float(os.getenv("EPIC_SLOW_QUERY_MS", "100"))
+
+_counters = []
+_lock = threading.Lock()
+
+
+class QueryCounter:
+    """
+    Compteur des requêtes SQL exécutées pendant un bloc
+        args: count (int),
+              duration (float) : temps passé en base, en secondes,
+              statements (list) : requêtes exécutées
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.statements = []
+
+    def summary(self):
+        return (f"{self.count} requêtes SQL "
+                f"({self.duration * 1000:.1f} ms en base)")
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters,
+                           context, executemany):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters,
+                          context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_start"].pop()
+    if elapsed * 1000 >= SLOW_QUERY_MS:
+        logger.warning(
+            f"Requête lente ({elapsed * 1000:.1f} ms) : "
+            f"{' '.join(statement.split())}")
+    with _lock:
+        for counter in _counters:
+            counter.count += 1
+            counter.duration += elapsed
+            counter.statements.append(statement)
+
+
+@event.listens_for(Engine, "handle_error")
+def _handle_error(context):
+    """Une requête en erreur n'atteint pas after_cursor_execute :
+    son heure de début est retirée ici"""
+    connection = context.connection
+    if connection is not None and connection.info.get("query_start"):
+        connection.info["query_start"].pop()
+
+
+@contextmanager
+def track_queries():
+    """Compte les requêtes SQL exécutées dans le bloc"""
+    counter = QueryCounter()
+    with _lock:
+        _counters.append(counter)
+    try:
+        yield counter
+    finally:
+        with _lock:
+            _counters.remove(counter)
+
+
+@contextmanager
+def assert_max_queries(maximum):
+    """
+    Échoue si le bloc exécute plus de `maximum` requêtes SQL.
+    Utilisation dans les tests :
+        with assert_max_queries(1):
+            CLIENT_REPORT.rows(session)
+    """
+    with track_queries() as counter:
+        yield counter
+    if counter.count > maximum:
+        statements = "\n".join(
+            f"  {index}. {' '.join(statement.split())}"
+            for index, statement in enumerate(counter.statements, 1))
+        raise AssertionError(
+            f"{counter.count} requêtes SQL exécutées "
+            f"(maximum {maximum}) :\n{statements}")
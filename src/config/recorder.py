@@ -0,0 +1,66 @@
+import json
+import os
+from datetime import datetime, timezone
+from enum import Enum
+
+try:
+    import fcntl
+except ImportError:  # Windows : pas de verrou entre processus
+    fcntl = None
+
+RECORD_FILE = os.getenv("EPIC_RECORD", "")
+
+REDACTED = "***"
+# Paramètres dont la valeur n'est jamais enregistrée
+SECRET_PARAMS = ("password", "token", "secret")
+
+
+def redact(params):
+    """Paramètres de la commande, secrets masqués et valeurs en JSON"""
+    redacted = {}
+    for name, value in params.items():
+        if value is None:
+            continue
+        if any(secret in name.lower() for secret in SECRET_PARAMS):
+            value = REDACTED
+        elif isinstance(value, Enum):
+            value = value.value
+        elif isinstance(value, (list, tuple)):
+            value = [str(item) for item in value]
+        elif not isinstance(value, (str, int, float, bool)):
+            value = str(value)
+        redacted[name] = value
+    return redacted
+
+
+class WorkloadRecorder:
+    """
+    Enregistre chaque exécution de commande dans un fichier JSONL,
+    une ligne par commande, pour rejouer la charge réelle ensuite
+    (`python -m benchmarks.replay`).
+        args: path (str) : fichier JSONL, complété à chaque commande
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def record(self, command, params, duration, queries, error=False):
+        line = json.dumps({
+            "ts": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "command": command,
+            "params": redact(params),
+            "duration": round(duration, 6),
+            "queries": queries,
+            "error": error,
+        }, ensure_ascii=False)
+        # Plusieurs CLI peuvent écrire en même temps : une ligne par write
+        with open(self.path, "a", encoding="utf-8") as file:
+            if fcntl:
+                fcntl.flock(file, fcntl.LOCK_EX)
+            file.write(line + "\n")
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return []
+        with open(self.path, encoding="utf-8") as file:
+            return [json.loads(line) for line in file if line.strip()]
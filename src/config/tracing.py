@@ -0,0 +1,130 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+TRACE_FILE = os.getenv("EPIC_TRACE", "")
+
+
+class Tracer:
+    """
+    Enregistre des intervalles (spans) au format Chrome trace-event,
+    lisible dans chrome://tracing ou https://ui.perfetto.dev.
+    Inactif tant que `enable` n'a pas été appelé : les spans ne coûtent
+    alors qu'un test booléen.
+    """
+
+    def __init__(self):
+        self.active = False
+        self.events = []
+        self.origin = time.perf_counter()
+
+    def enable(self):
+        """Active le traçage : requêtes SQL et méthodes des modèles"""
+        if self.active:
+            return
+        self.active = True
+        self.events = []
+        self.origin = time.perf_counter()
+        event.listen(Engine, "before_cursor_execute", _before_sql)
+        event.listen(Engine, "after_cursor_execute", _after_sql)
+        instrument_models()
+
+    def disable(self):
+        """Désactive le traçage (les méthodes des modèles restent
+        enveloppées mais leurs spans ne sont plus enregistrés)"""
+        if not self.active:
+            return
+        self.active = False
+        event.remove(Engine, "before_cursor_execute", _before_sql)
+        event.remove(Engine, "after_cursor_execute", _after_sql)
+
+    def _now(self):
+        return (time.perf_counter() - self.origin) * 1_000_000
+
+    def record(self, name, category, start, end, args=None):
+        self.events.append({
+            "name": name, "cat": category, "ph": "X",
+            "ts": round(start, 3), "dur": round(end - start, 3),
+            "pid": os.getpid(), "tid": threading.get_ident(),
+            "args": args or {},
+        })
+
+    @contextmanager
+    def span(self, name, category="app", **args):
+        """Mesure le bloc et l'ajoute à la trace"""
+        if not self.active:
+            yield
+            return
+        start = self._now()
+        try:
+            yield
+        finally:
+            self.record(name, category, start, self._now(), args)
+
+    def write(self, path):
+        """Écrit la trace au format JSON Chrome trace-event"""
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump({"traceEvents": self.events,
+                       "displayTimeUnit": "ms"}, file)
+
+
+tracer = Tracer()
+
+
+def traced(category, name=None):
+    """Décorateur : chaque appel de la fonction devient un span"""
+    def decorator(func):
+        label = name or func.__qualname__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not tracer.active:
+                return func(*args, **kwargs)
+            with tracer.span(label, category):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def _before_sql(conn, cursor, statement, parameters, context, executemany):
+    if tracer.active:
+        conn.info.setdefault("trace_start", []).append(tracer._now())
+
+
+def _after_sql(conn, cursor, statement, parameters, context, executemany):
+    if tracer.active and conn.info.get("trace_start"):
+        tracer.record(
+            " ".join(statement.split())[:80], "sql",
+            conn.info["trace_start"].pop(), tracer._now(),
+            {"statement": statement, "executemany": executemany})
+
+
+def _traced_classmethod(func):
+    @wraps(func)
+    def wrapper(cls, *args, **kwargs):
+        with tracer.span(f"{cls.__name__}.{func.__name__}", "model"):
+            return func(cls, *args, **kwargs)
+
+    wrapper.__traced__ = True
+    return classmethod(wrapper)
+
+
+def instrument_models():
+    """Enveloppe chaque méthode de classe des modèles dans un span"""
+    from src.models.base import BaseModel
+
+    classes = [BaseModel]
+    while classes:
+        cls = classes.pop()
+        classes.extend(cls.__subclasses__())
+        for attribute, value in list(vars(cls).items()):
+            if (isinstance(value, classmethod)
+                    and not getattr(value.__func__, "__traced__", False)):
+                setattr(cls, attribute, _traced_classmethod(value.__func__))
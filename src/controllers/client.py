@@ -1,7 +1,12 @@
 import typer
 from typing import Optional
+from sqlalchemy import select
 from src.models.client import Client
+from src.models.sync import ClientSync
+from src.models.validators import ClientValidator
+from src.models.report import CLIENT_REPORT
 from src.view.display_view import Display
+from src.view.export_view import Export, ExportFormat
 from src.models.permission import requires_permission, requires_login
 from src.models.common import get_session
 from src.models.user_session import UserSession
@@ -32,7 +37,7 @@ def create_client(
     """Crée un utilisateur dans la base de données"""
     try:
         commercial_id = UserSession.get_current_user(ctx).id
-        session = get_session()
+        session = get_session(write=True)
         client = Client.create_object(
             session,
             first_name=first_name.replace("-", " "),
@@ -52,6 +57,7 @@ def create_client(
             f"❌ {str(e)}",
             fg=typer.colors.RED
         )
+        raise typer.Exit(code=1)
     finally:
         session.close()
 
@@ -68,60 +74,49 @@ def client_list(
             None,
             help="ID du commercial pour afficher les clients",
         ),
+        export: Optional[str] = typer.Option(
+            None, help="Chemin du fichier d'export"),
+        export_format: ExportFormat = typer.Option(
+            ExportFormat.CSV, "--format", help="Format du fichier d'export"),
 ):
     """Affiche la liste des clients"""
     session = get_session()
-    headers = [
-        "ID",
-        "Prènom",
-        "Nom",
-        "Email",
-        "Phone",
-        "Company name",
-        "Commercial ID",
-        "Commercial Name",
-    ]
     try:
+        if export:
+            count = Export.write(
+                session,
+                export_clients_query(id=id, commercial_id=commercial_id),
+                export, export_format)
+            typer.secho(f"✅ {count} clients exportés vers {export}")
+            return
+
         if id:
-            client = Client.get_object(session, id=id)
-            if client:
-                display.table(
+            rows = CLIENT_REPORT.rows(session, Client.id == id)
+            if rows:
+                display.rows(
                     title="Détails du client",
-                    headers=headers,
-                    items=[Client.format_client_data(session, client)],
+                    headers=CLIENT_REPORT.headers,
+                    rows=rows,
                 )
             else:
                 typer.secho("❌ Client non trouvé", fg=typer.colors.RED)
         else:
-            clients = Client.get_all_object(session)
             if commercial_id is not None:
-                clients = [
-                    client
-                    for client in clients
-                    if client.commercial_id == commercial_id
-                ]
-                display.table(
-                    title="Liste des clients pour ce commercial",
-                    headers=headers,
-                    items=[
-                        Client.format_client_data(session, client)
-                        for client in clients
-                    ],
-                    exclude_headers=["Commercial Name", "Company name"],
-                )
+                title = "Liste des clients pour ce commercial"
+                conditions = [Client.commercial_id == commercial_id]
             else:
-                display.table(
-                    title="Liste des clients",
-                    headers=headers,
-                    items=[
-                        Client.format_client_data(session, client)
-                        for client in clients
-                    ],
-                    exclude_headers=["Commercial Name", "Company name"],
-                )
+                title = "Liste des clients"
+                conditions = []
+            display.rows(
+                title=title,
+                headers=CLIENT_REPORT.headers,
+                rows=CLIENT_REPORT.rows(session, *conditions),
+                exclude_headers=["Commercial Name", "Company name"],
+            )
 
     except Exception as e:
         typer.secho(f"❌ Une erreur est survenue : {e}", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
     finally:
         session.close()
 
@@ -147,7 +142,7 @@ def update_client(
             None, help="ID du commercial"),
 ):
     """Mise à jour d'un client"""
-    session = get_session()
+    session = get_session(write=True)
     try:
         client = Client.update_object(
             session,
@@ -164,6 +159,7 @@ def update_client(
             f"✅ Evenement du contrat n°'{client.id}' créé avec succès!")
     except Exception as e:
         typer.secho(f"❌ Une erreur est survenue : {e}", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
 
 
 @client_app.command()
@@ -173,12 +169,98 @@ def delete(
         id: Optional[int] = typer.Option(
         None, prompt=True, help="ID du client à supprimer")):
     typer.confirm("❓Êtes vous sur de vouloir supprimer cet utilisateur ?")
-    session = get_session()
+    session = get_session(write=True)
     try:
         Client.delete_object(session, id)
         typer.secho(f"Client {id} supprimé avec succès", fg=typer.colors.GREEN)
     except Exception as e:
         typer.secho(f"❌{str(e)}", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
+
+
+@client_app.command(name="find")
+@requires_login()
+def find(
+        ctx: typer.Context,
+        email: Optional[str] = typer.Option(
+            None, help="Email du client (casse et espaces ignorés)"),
+        phone: Optional[str] = typer.Option(
+            None, help="Téléphone du client (tout format)"),
+):
+    """Recherche un client par email ou par téléphone"""
+    session = get_session()
+    try:
+        conditions = contact_conditions(email, phone)
+        if not conditions:
+            raise Exception("Indiquez --email ou --phone")
+        rows = CLIENT_REPORT.rows(session, *conditions)
+        if not rows:
+            typer.secho("❌ Client non trouvé", fg=typer.colors.RED)
+            return
+        display.rows(
+            title="Détails du client",
+            headers=CLIENT_REPORT.headers,
+            rows=rows,
+        )
+    except Exception as e:
+        typer.secho(f"❌ {str(e)}", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
+    finally:
+        session.close()
+
+
+@client_app.command(name="sync")
+@requires_permission("manage_all_contracts")
+def sync(
+        ctx: typer.Context,
+        file: str = typer.Argument(..., help="Extrait CSV des clients"),
+        commercial_id: Optional[int] = typer.Option(
+            None, "--commercial-id",
+            help="Commercial des lignes sans colonne commercial_id"),
+        batch_size: int = typer.Option(
+            ClientSync.BATCH_SIZE, "--batch-size", help="Lignes par lot"),
+):
+    """Synchronise les clients depuis un extrait CSV complet (upsert)"""
+    session = get_session(write=True)
+    try:
+        synchronizer = ClientSync(
+            batch_size=batch_size, commercial_id=commercial_id)
+        counts = synchronizer.run(session, file)
+        typer.secho(
+            f"✅ Synchronisation terminée : {counts['inserted']} créés, "
+            f"{counts['updated']} mis à jour, "
+            f"{counts['unchanged']} inchangés, "
+            f"{counts['rejected']} rejetés",
+            fg=typer.colors.GREEN)
+        for error in synchronizer.errors:
+            typer.secho(f"❌ {error}", fg=typer.colors.RED)
+    except Exception as e:
+        typer.secho(f"❌ {str(e)}", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
+    finally:
+        session.close()
+
+
+def contact_conditions(email=None, phone=None):
+    """Conditions sur les colonnes normalisées (index uniques)."""
+    conditions = []
+    if email:
+        conditions.append(
+            Client.email_normalized == ClientValidator.normalize_email(email))
+    if phone:
+        conditions.append(
+            Client.phone_normalized == ClientValidator.normalize_phone(phone))
+    return conditions
+
+
+def export_clients_query(id=None, commercial_id=None):
+    """Requête des colonnes brutes des clients filtrés, pour l'export."""
+    query = select(*Client.__table__.columns)
+    if id:
+        query = query.where(Client.id == id)
+    if commercial_id is not None:
+        query = query.where(Client.commercial_id == commercial_id)
+    return query.order_by(Client.id)
 
 
 if __name__ == "__main__":
@@ -1,8 +1,12 @@
 import typer
 from typing import Optional
+from sqlalchemy import select
 from src.models.contract import Contract
+from src.models.payment import Payment
+from src.models.report import CONTRACT_REPORT
 from src.models.permission import requires_permission, requires_login
 from src.view.display_view import Display
+from src.view.export_view import Export, ExportFormat
 from src.models.common import get_session
 
 display = Display()
@@ -27,7 +31,7 @@ def create(
         ..., prompt=True, help="Montant restant"),
 ):
     """Crée un contrat dans la base de données."""
-    session = get_session()
+    session = get_session(write=True)
     try:
         is_signed = None
         if typer.confirm(
@@ -44,6 +48,7 @@ def create(
         typer.secho(f"✅ Contrat n°{contract.client_id} créé avec succès !")
     except Exception as e:
         typer.secho(f"\n ❌ {str(e)}", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
     finally:
         session.close()
 
@@ -61,36 +66,41 @@ def contract_list(
     ),
     unsigned_only: Optional[bool] = typer.Option(
         False, help="Afficher uniquement les contrats non signés"),
+    export: Optional[str] = typer.Option(
+        None, help="Chemin du fichier d'export"),
+    export_format: ExportFormat = typer.Option(
+        ExportFormat.CSV, "--format", help="Format du fichier d'export"),
 ):
     """Récupère les contrats selon divers filtres."""
-    contract_headers = [
-        "ID du contrat",
-        "ID du client",
-        "ID du commercial",
-        "Montant total",
-        "Montant restant",
-        "Signé"
-    ]
     session = get_session()
     try:
-        contracts = get_filtered_contracts(
-            session, client_id, contract_id, is_signed, amount_left,
-            unsigned_only
-        )
+        if export:
+            count = Export.write(
+                session,
+                export_contracts_query(
+                    client_id=client_id, contract_id=contract_id,
+                    is_signed=is_signed, amount_left=amount_left,
+                    unsigned_only=unsigned_only),
+                export, export_format)
+            typer.secho(f"✅ {count} contrats exportés vers {export}")
+            return
+
+        rows = CONTRACT_REPORT.rows(session, *contract_conditions(
+            client_id, contract_id, is_signed, amount_left, unsigned_only
+        ))
 
-        if not contracts:
+        if not rows:
             typer.secho("❌ Aucun contrat trouvé", fg=typer.colors.RED)
             return
 
-        display.table(
+        display.rows(
             title="Liste des contrats",
-            headers=contract_headers,
-            items=[
-                Contract.format_contract_data(session, contract) for
-                contract in contracts]
+            headers=CONTRACT_REPORT.headers,
+            rows=rows,
         )
     except Exception as e:
         typer.secho(f"\n ❌ {str(e)}", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
     finally:
         session.close()
 
@@ -103,7 +113,7 @@ def sign_contract(
         ..., prompt=True, help="ID du contrat à signer"),
 ):
     """Signe un contrat."""
-    session = get_session()
+    session = get_session(write=True)
 
     if ctx.obj is None:
         ctx.obj = {}
@@ -119,6 +129,7 @@ def sign_contract(
                         .RED)
     except Exception as e:
         typer.secho(f"\n ❌ {str(e)}", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
 
 
 @contract_app.command(name="payment")
@@ -126,14 +137,15 @@ def sign_contract(
 def payment(
     ctx: typer.Context,
     contract_id: int = typer.Option(None, prompt=True, help="ID du contrat"),
-    amount: float = typer.Option(None, help="Montant du paiement"),
+    amount: float = typer.Option(
+        None, help="Montant payé (par défaut : tout le reste à payer)"),
     change_total_amount: Optional[float] = typer.Option(
         None, help="Nouveau montant total du contrat"
     ),
 ):
-    """Effectue un paiement partiel ou total sur un contrat."""
+    """Enregistre un paiement partiel ou total sur un contrat."""
     typer.confirm("Validation du paiement ✅")
-    session = get_session()
+    session = get_session(write=True)
 
     if ctx.obj is None:
         ctx.obj = {}
@@ -141,23 +153,58 @@ def payment(
     ctx.obj["contract_id"] = contract_id
 
     try:
-        contract = Contract.get_object(session, id=contract_id)
-
         if amount is None:
+            contract = Contract.get_object(session, id=contract_id)
+            if not contract:
+                raise Exception("Le contrat n'existe pas")
             amount = contract.remaining_amount
 
-        if change_total_amount is None:
-            change_total_amount = contract.total_amount
+        remaining = Payment.record(
+            session, contract_id, amount, total_amount=change_total_amount)
+        typer.secho(f"✅ Paiement de {amount} enregistré sur le contrat "
+                    f"n°{contract_id}, reste à payer : {remaining}")
+    except Exception as e:
+        typer.secho(f"\n ❌ {str(e)}", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
+    finally:
+        session.close()
 
-        Contract.update_amount(
-            session,
-            contract_id=contract_id,
-            remaining_amount=amount,
-            total_amount=change_total_amount
+
+@contract_app.command(name="statement")
+@requires_permission("update_own_contracts", "manage_all_contracts")
+def statement(
+    ctx: typer.Context,
+    contract_id: int = typer.Option(..., help="ID du contrat"),
+):
+    """Affiche le relevé des paiements d'un contrat."""
+    session = get_session()
+
+    if ctx.obj is None:
+        ctx.obj = {}
+
+    ctx.obj["contract_id"] = contract_id
+
+    try:
+        contract, rows, total_paid = Payment.statement(session, contract_id)
+        display.rows(
+            title=f"Relevé du contrat n°{contract_id}",
+            headers=Payment.headers,
+            rows=[(payment_id, paid_at.strftime("%Y-%m-%d %H:%M"), amount,
+                   recorded_by or "")
+                  for payment_id, paid_at, amount, recorded_by in rows],
         )
-        typer.secho(f"✅ Paiement du contrat n°{contract_id} effectué")
+        typer.echo(f"Montant total : {contract.total_amount}")
+        typer.echo(f"Total payé : {total_paid} ({len(rows)} paiements)")
+        typer.echo(f"Reste à payer : {contract.remaining_amount}")
+        gap = contract.total_amount - total_paid - contract.remaining_amount
+        if abs(gap) > 0.005:
+            typer.secho(
+                f"⚠️ Écart de {round(gap, 2)} avec le registre "
+                f"(paiements antérieurs au registre ou montant modifié)",
+                fg=typer.colors.YELLOW)
     except Exception as e:
-        typer.secho(f"\n ❌ {str(e)}", fg=typer.colors.RED)
+        typer.secho(f"❌ {str(e)}", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
     finally:
         session.close()
 
@@ -170,7 +217,7 @@ def delete(
 ):
     """Supprime un contrat."""
     typer.confirm("❓ Êtes-vous sûr de vouloir supprimer ce contrat ?")
-    session = get_session()
+    session = get_session(write=True)
 
     if ctx.obj is None:
         ctx.obj = {}
@@ -184,10 +231,10 @@ def delete(
             fg=typer.colors.GREEN)
     except Exception as e:
         typer.secho(f"❌ Erreur: {str(e)}", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
 
 
-def get_filtered_contracts(
-    session,
+def contract_conditions(
     client_id=None,
     contract_id=None,
     is_signed=False,
@@ -195,26 +242,59 @@ def get_filtered_contracts(
     unsigned_only=False
 ):
     """
-    Récupère les contrats filtrés en fonction des paramètres fournis.
+    Construit les conditions SQL correspondant aux filtres des rapports.
     """
-    contracts = Contract.get_all_object(session)
-
+    conditions = []
     if client_id:
-        contracts = [
-            contract for contract in
-            contracts if contract.client_id == client_id]
+        conditions.append(Contract.client_id == client_id)
     if contract_id:
-        contracts = [
-            contract for contract in
-            contracts if contract.id == contract_id]
+        conditions.append(Contract.id == contract_id)
     if is_signed:
-        contracts = [contract for contract in contracts if contract.is_signed]
+        conditions.append(Contract.is_signed.is_(True))
     if amount_left:
-        contracts = [
-            contract for contract in
-            contracts if contract.remaining_amount > 0]
+        conditions.append(Contract.remaining_amount > 0)
     if unsigned_only:
-        contracts = [
-            contract for contract in contracts if not contract.is_signed]
+        conditions.append(Contract.is_signed.isnot(True))
+    return conditions
+
+
+def get_filtered_contracts(
+    session,
+    client_id=None,
+    contract_id=None,
+    is_signed=False,
+    amount_left=False,
+    unsigned_only=False
+):
+    """
+    Récupère les contrats filtrés en fonction des paramètres fournis.
+    """
+    conditions = contract_conditions(
+        client_id, contract_id, is_signed, amount_left, unsigned_only)
+    return session.scalars(
+        select(Contract).where(*conditions).order_by(Contract.id)).all()
+
+
+def export_contracts_query(**filters):
+    """Requête des colonnes brutes des contrats filtrés, pour l'export."""
+    return select(*Contract.__table__.columns).where(
+        *contract_conditions(**filters)).order_by(Contract.id)
+
 
-    return contracts
+async def aget_filtered_contracts(
+    async_session,
+    client_id=None,
+    contract_id=None,
+    is_signed=False,
+    amount_left=False,
+    unsigned_only=False
+):
+    """Version asynchrone de `get_filtered_contracts`."""
+    return await async_session.run_sync(
+        get_filtered_contracts,
+        client_id,
+        contract_id,
+        is_signed,
+        amount_left,
+        unsigned_only
+    )
@@ -0,0 +1,34 @@
+import asyncio
+import typer
+from src.models.dashboard import Dashboard
+from src.models.permission import requires_login
+from src.models.common import dispose_async_engine
+from src.view.display_view import Display
+
+display = Display()
+
+
+async def fetch_dashboard():
+    """Calcule le tableau de bord puis libère les connexions asynchrones"""
+    try:
+        return await Dashboard.fetch()
+    finally:
+        await dispose_async_engine()
+
+
+@requires_login()
+def dashboard(ctx: typer.Context):
+    """Affiche les totaux par commercial (contrats, clients, événements)"""
+    try:
+        rows = asyncio.run(fetch_dashboard())
+        if not rows:
+            typer.secho("❌ Aucun commercial trouvé", fg=typer.colors.RED)
+            return
+        display.table(
+            title="Tableau de bord commercial",
+            headers=Dashboard.headers,
+            items=rows,
+        )
+    except Exception as e:
+        typer.secho(f"❌ Une erreur est survenue : {e}", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
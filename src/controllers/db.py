@@ -0,0 +1,101 @@
+import json
+import typer
+from typing import Optional
+from src.models.audit import AuditLog
+from src.models.summary import Summary
+from src.models.seed import Seeder
+from src.models.search import Search
+from src.models.permission import requires_permission
+from src.models.common import get_session
+from src.view.display_view import Display
+
+display = Display()
+
+db_app = typer.Typer(
+    name="Epic Events Database Management",
+    help="Maintenance de la base de données Epic Events",
+)
+
+
+@db_app.command(name="rebuild")
+@requires_permission("manage_all_contracts")
+def rebuild(ctx: typer.Context):
+    """Recalcule les totaux et reconstruit l'index de recherche"""
+    session = get_session(write=True)
+    try:
+        Summary.rebuild(session)
+        Search.rebuild(session)
+        typer.secho(
+            "✅ Tables de synthèse et index de recherche "
+            "recalculés avec succès",
+            fg=typer.colors.GREEN)
+    except Exception as e:
+        typer.secho(f"❌ {str(e)}", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
+    finally:
+        session.close()
+
+
+@db_app.command(name="seed")
+@requires_permission("manage_all_contracts")
+def seed(
+    ctx: typer.Context,
+    users: int = typer.Option(0, "--users", help="Nombre d'utilisateurs"),
+    clients: int = typer.Option(0, "--clients", help="Nombre de clients"),
+    contracts: int = typer.Option(
+        0, "--contracts", help="Nombre de contrats"),
+    events: int = typer.Option(0, "--events", help="Nombre d'événements"),
+    seed: int = typer.Option(42, "--seed", help="Graine du générateur"),
+    password: str = typer.Option(
+        "password", "--password",
+        help="Mot de passe des utilisateurs générés"),
+):
+    """Génère des données synthétiques déterministes (tests de charge)"""
+    session = get_session(write=True)
+    try:
+        counts = Seeder(seed=seed, password=password).run(
+            session, users=users, clients=clients,
+            contracts=contracts, events=events)
+        details = ", ".join(
+            f"{count} {table}" for table, count in counts.items())
+        typer.secho(
+            f"✅ Données générées avec succès : {details}",
+            fg=typer.colors.GREEN)
+    except Exception as e:
+        typer.secho(f"❌ {str(e)}", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
+    finally:
+        session.close()
+
+
+@db_app.command(name="audit")
+@requires_permission("manage_all_contracts")
+def audit(
+    ctx: typer.Context,
+    entity: str = typer.Argument(
+        ..., help="Table : users, clients, contracts ou events"),
+    entity_id: Optional[int] = typer.Argument(None, help="ID de la ligne"),
+    limit: int = typer.Option(50, "--limit", help="Nombre d'entrées"),
+):
+    """Affiche l'historique des modifications d'une table ou d'une ligne"""
+    session = get_session()
+    try:
+        rows = [
+            (ts.strftime("%Y-%m-%d %H:%M:%S"), actor_id, entity, row_id,
+             operation, ", ".join(
+                 f"{key}: {value}" for key, value in json.loads(
+                     changes).items()))
+            for ts, actor_id, entity, row_id, operation, changes
+            in AuditLog.history(session, entity, entity_id, limit)
+        ]
+        if not rows:
+            typer.secho("❌ Aucune entrée dans le journal d'audit",
+                        fg=typer.colors.RED)
+            return
+        display.rows(title="Journal d'audit", headers=AuditLog.headers,
+                     rows=rows)
+    except Exception as e:
+        typer.secho(f"❌ {str(e)}", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
+    finally:
+        session.close()
@@ -1,9 +1,15 @@
 import typer
 from typing import Optional
+from datetime import datetime, timedelta
+from sqlalchemy import select
 from src.models.event import Event
+from src.models.report import EVENT_REPORT, AGENDA_REPORT
 from src.view.display_view import Display
+from src.view.export_view import Export, ExportFormat
+from src.view.calendar_view import Calendar
 from src.models.permission import requires_permission, requires_login
 from src.models.contract import Contract
+from src.models.scheduling import AutoAssign
 from src.models.user_session import UserSession
 from src.models.common import get_session
 
@@ -33,7 +39,7 @@ def create(
         None, prompt=True, help="Description de l'événement"),
 ):
     """Crée un événement dans la base de données."""
-    session = get_session()
+    session = get_session(write=True)
     if ctx.obj is None:
         ctx.obj = {}
 
@@ -74,6 +80,7 @@ def create(
             f"✅ Événement du contrat n°{event.contract_id} créé avec succès!")
     except Exception as e:
         typer.secho(f"❌ {str(e)}", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
     finally:
         session.close()
 
@@ -89,32 +96,42 @@ def event_report(
     contract_id: Optional[int] = typer.Option(None, help="ID du contrat"),
     unassigned_only: bool = typer.Option(
         False, help="Afficher uniquement les événements sans support"),
+    export: Optional[str] = typer.Option(
+        None, help="Chemin du fichier d'export"),
+    export_format: ExportFormat = typer.Option(
+        ExportFormat.CSV, "--format", help="Format du fichier d'export"),
 ):
     """Affiche les détails des événements avec option de filtrage."""
-    event_headers = [
-        "ID de l'Événement", "ID du support", "ID du client", "ID du contrat",
-        "Nom de l'événement", "Date de début", "Date de fin", "Localisation",
-        "Nombre de participants", "Créé le", "Mise à jour le", "Notes",
-    ]
-
     session = get_session()
     try:
-        events = get_filtered_events(
-            session, client_id, event_id,
+        if export:
+            count = Export.write(
+                session,
+                export_events_query(
+                    client_id=client_id, event_id=event_id,
+                    support_contact_id=support_contact_id,
+                    contract_id=contract_id, unassigned_only=unassigned_only),
+                export, export_format)
+            typer.secho(f"✅ {count} événements exportés vers {export}")
+            return
+
+        rows = EVENT_REPORT.rows(session, *event_conditions(
+            client_id, event_id,
             support_contact_id, contract_id, unassigned_only
-        )
+        ))
 
-        if not events:
+        if not rows:
             typer.secho("❌ Aucun événement trouvé", fg=typer.colors.RED)
             return
 
-        display.table(
+        display.rows(
             title="Liste des Événements",
-            headers=event_headers,
-            items=[Event.format_event_data(session, event) for event in events]
+            headers=EVENT_REPORT.headers,
+            rows=rows,
         )
     except Exception as e:
         typer.secho(f"❌ Une erreur est survenue : {e}", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
     finally:
         session.close()
 
@@ -135,7 +152,7 @@ def event_update(
         None, help="Nombre de participants"),
 ):
     """Met à jour un événement."""
-    session = get_session()
+    session = get_session(write=True)
 
     if ctx.obj is None:
         ctx.obj = {}
@@ -155,6 +172,7 @@ def event_update(
         typer.secho(f"✅ Événement '{event}' mis à jour avec succès!")
     except Exception as e:
         typer.secho(f"❌ Une erreur est survenue : {e}", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
     finally:
         session.close()
 
@@ -168,7 +186,7 @@ def assign_support(
         ..., prompt=True, help="ID du support à assigner"),
 ):
     """Met à jour un événement."""
-    session = get_session()
+    session = get_session(write=True)
 
     if ctx.obj is None:
         ctx.obj = {}
@@ -186,6 +204,131 @@ def assign_support(
             f"l'événement n°{event_id} avec succès!")
     except Exception as e:
         typer.secho(f"❌{e}", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
+    finally:
+        session.close()
+
+
+@event_app.command(name="auto-assign")
+@requires_permission("manage_all_events")
+def auto_assign(
+    ctx: typer.Context,
+    dry_run: bool = typer.Option(
+        False, help="Affiche les assignations sans les enregistrer"),
+):
+    """Assigne un support à tous les événements à venir sans support."""
+    session = get_session(write=True)
+    try:
+        assignments, unassigned = AutoAssign.run(session, dry_run=dry_run)
+        if not assignments and not unassigned:
+            typer.secho("✅ Aucun événement à venir sans support")
+            return
+
+        if dry_run:
+            display.rows(
+                title="Assignations proposées",
+                headers=["ID de l'Événement", "ID du support"],
+                rows=assignments,
+            )
+        else:
+            typer.secho(
+                f"✅ {len(assignments)} événements assignés avec succès!",
+                fg=typer.colors.GREEN)
+        if unassigned:
+            typer.secho(
+                f"❌ {len(unassigned)} événements sans support disponible : "
+                f"{', '.join(map(str, unassigned))}", fg=typer.colors.RED)
+    except Exception as e:
+        typer.secho(f"❌ {str(e)}", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
+    finally:
+        session.close()
+
+
+@event_app.command(name="agenda")
+@requires_login()
+def agenda(
+    ctx: typer.Context,
+    days: int = typer.Option(14, help="Nombre de jours à afficher"),
+    support_id: Optional[int] = typer.Option(
+        None, help="ID du support (par défaut : l'utilisateur connecté)"),
+    limit: int = typer.Option(200, help="Nombre maximum d'événements"),
+    ics: Optional[str] = typer.Option(
+        None, help="Écrit l'agenda au format ICS (`-` : sortie standard)"),
+):
+    """Affiche les prochains événements d'un support."""
+    session = get_session()
+    try:
+        if support_id is None:
+            current_user = UserSession.get_current_user(ctx)
+            if current_user.role == "SUPPORT":
+                support_id = current_user.id
+
+        rows = session.execute(
+            agenda_query(support_id, days, limit)).tuples().all()
+
+        if ics:
+            Calendar.write([
+                {"id": row[2], "name": row[3], "start_date": row[0],
+                 "end_date": row[1], "location": row[4],
+                 "description": f"{row[6]} - {row[5]} participants"
+                                f"{' - ' + row[8] if row[8] else ''}"}
+                for row in rows
+            ], ics)
+            if ics != "-":
+                typer.secho(f"✅ {len(rows)} événements exportés vers {ics}")
+            return
+
+        if not rows:
+            typer.secho(
+                f"❌ Aucun événement dans les {days} prochains jours",
+                fg=typer.colors.RED)
+            return
+
+        display.rows(
+            title=f"Agenda des {days} prochains jours",
+            headers=AGENDA_REPORT.headers,
+            rows=rows,
+            exclude_headers=["ID du support"] if support_id else None,
+        )
+    except Exception as e:
+        typer.secho(f"❌ Une erreur est survenue : {e}", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
+    finally:
+        session.close()
+
+
+CONFLICT_HEADERS = [
+    "ID du support", "Support",
+    "ID de l'Événement", "Nom de l'événement", "Début", "Fin",
+    "En conflit avec", "Nom (conflit)", "Début (conflit)", "Fin (conflit)",
+]
+
+
+@event_app.command(name="conflicts")
+@requires_login()
+def event_conflicts(
+    ctx: typer.Context,
+    support_contact_id: Optional[int] = typer.Option(
+        None, help="ID du support"),
+):
+    """Liste les doubles réservations des supports."""
+    session = get_session()
+    try:
+        rows = session.execute(
+            Event.conflicts_query(support_contact_id)).tuples().all()
+        if not rows:
+            typer.secho("✅ Aucune double réservation", fg=typer.colors.GREEN)
+            return
+
+        display.rows(
+            title="Doubles réservations des supports",
+            headers=CONFLICT_HEADERS,
+            rows=rows,
+        )
+    except Exception as e:
+        typer.secho(f"❌ Une erreur est survenue : {e}", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
     finally:
         session.close()
 
@@ -198,7 +341,7 @@ def event_delete(
         ..., prompt=True, help="ID de l'événement à supprimer"),
 ):
     """Supprime un événement."""
-    session = get_session()
+    session = get_session(write=True)
 
     if ctx.obj is None:
         ctx.obj = {}
@@ -210,33 +353,83 @@ def event_delete(
         typer.secho(f"✅ L'événement n°{id} a été supprimé")
     except Exception as e:
         typer.secho(f"❌ Une erreur est survenue : {e}", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
+
+
+def agenda_query(support_id=None, days=14, limit=200, now=None):
+    """
+    Événements à venir, triés et limités en SQL.
+    Pour un support, la requête parcourt l'index
+    (support_contact_id, start_date, end_date) par plage de dates.
+    """
+    now = now or datetime.now()
+    conditions = [
+        Event.start_date >= now,
+        Event.start_date < now + timedelta(days=days),
+    ]
+    if support_id is not None:
+        conditions.append(Event.support_contact_id == support_id)
+    return AGENDA_REPORT.query(*conditions).order_by(
+        Event.start_date, Event.id).limit(limit)
 
 
-def get_filtered_events(
-    session,
+def event_conditions(
     client_id=None,
     event_id=None,
     support_contact_id=None,
     contract_id=None,
     unassigned_only=False
 ):
-    """Récupère les événements filtrés selon divers critères."""
-    events = Event.get_all_object(session)
-
+    """Construit les conditions SQL correspondant aux filtres des rapports."""
+    conditions = []
     if client_id:
-        events = [event for event in events if event.client_id == client_id]
+        conditions.append(Event.client_id == client_id)
     if event_id:
-        events = [event for event in events if event.id == event_id]
+        conditions.append(Event.id == event_id)
     if support_contact_id:
-        events = [
-            event for event in events if
-            event.support_contact_id == support_contact_id]
+        conditions.append(Event.support_contact_id == support_contact_id)
     if contract_id:
-        events = [
-            event for event in events if
-            event.contract_id == contract_id]
+        conditions.append(Event.contract_id == contract_id)
     if unassigned_only:
-        events = [
-            event for event in events if event.support_contact_id is None]
+        conditions.append(Event.support_contact_id.is_(None))
+    return conditions
 
-    return events
+
+def get_filtered_events(
+    session,
+    client_id=None,
+    event_id=None,
+    support_contact_id=None,
+    contract_id=None,
+    unassigned_only=False
+):
+    """Récupère les événements filtrés selon divers critères."""
+    conditions = event_conditions(
+        client_id, event_id, support_contact_id, contract_id, unassigned_only)
+    return session.scalars(
+        select(Event).where(*conditions).order_by(Event.id)).all()
+
+
+def export_events_query(**filters):
+    """Requête des colonnes brutes des événements filtrés, pour l'export."""
+    return select(*Event.__table__.columns).where(
+        *event_conditions(**filters)).order_by(Event.id)
+
+
+async def aget_filtered_events(
+    async_session,
+    client_id=None,
+    event_id=None,
+    support_contact_id=None,
+    contract_id=None,
+    unassigned_only=False
+):
+    """Version asynchrone de `get_filtered_events`."""
+    return await async_session.run_sync(
+        get_filtered_events,
+        client_id,
+        event_id,
+        support_contact_id,
+        contract_id,
+        unassigned_only
+    )
@@ -0,0 +1,113 @@
+import os
+import typer
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import select
+from src.models.base import utc_now
+from src.models.user import User
+from src.models.client import Client
+from src.models.contract import Contract
+from src.models.event import Event
+from src.models.audit import AuditLog
+from src.models.permission import requires_permission
+from src.models.common import get_session
+from src.view.export_view import Export, ExportFormat
+
+export_app = typer.Typer(
+    name="Epic Events Export",
+    help="Exports incrémentaux pour l'entrepôt de données",
+)
+
+CHANGE_MODELS = {
+    "users": User, "clients": Client, "contracts": Contract, "events": Event}
+# Colonnes jamais exportées
+EXCLUDED_COLUMNS = {"password"}
+# updated_at est fixé au flush, avant le commit : une transaction en
+# cours peut encore valider des lignes horodatées juste avant `now`.
+# La borne haute de l'export reste donc en retrait de l'horloge.
+EXPORT_LAG = timedelta(
+    seconds=int(os.getenv("EPIC_EXPORT_LAG_SECONDS", "60")))
+
+
+@export_app.command(name="changes")
+@requires_permission("manage_all_contracts")
+def changes(
+    ctx: typer.Context,
+    since: str = typer.Option(
+        ..., "--since",
+        help="Horodatage du dernier export, ISO 8601 (UTC si sans fuseau)"),
+    output_dir: str = typer.Option(
+        ".", "--output-dir", help="Dossier des fichiers exportés"),
+    export_format: ExportFormat = typer.Option(
+        ExportFormat.CSV, "--format", help="Format des fichiers"),
+):
+    """Exporte les lignes modifiées ou supprimées depuis un horodatage"""
+    session = get_session()
+    try:
+        watermark = parse_watermark(since)
+        until = export_upper_bound(watermark)
+        os.makedirs(output_dir, exist_ok=True)
+        counts = []
+        for name, query in changes_queries(watermark, until).items():
+            path = os.path.join(output_dir, f"{name}.{export_format.value}")
+            count = Export.write(session, query, path, export_format)
+            counts.append(f"{count} {name}")
+        typer.secho(
+            f"✅ Modifications exportées vers {output_dir} : "
+            f"{', '.join(counts)}", fg=typer.colors.GREEN)
+        typer.echo(f"Prochain export : --since {until.isoformat()}")
+    except Exception as e:
+        typer.secho(f"❌ {str(e)}", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
+    finally:
+        session.close()
+
+
+def parse_watermark(value):
+    """Horodatage ISO 8601 converti en UTC naïf (format des colonnes)"""
+    try:
+        watermark = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        raise Exception(
+            f"Horodatage invalide : {value} (ex. 2025-01-31T18:00:00)")
+    if watermark.tzinfo:
+        watermark = watermark.astimezone(timezone.utc).replace(tzinfo=None)
+    return watermark
+
+
+def export_upper_bound(since, now=None):
+    """
+    Borne haute de l'export, en retrait de EXPORT_LAG sur l'horloge :
+    les écritures encore en cours à ce moment sont validées avant
+    l'export suivant. Elle ne recule jamais sous `since`.
+    """
+    now = utc_now() if now is None else now
+    return max(since, now - EXPORT_LAG)
+
+
+def changes_queries(since, until):
+    """
+    Requêtes des lignes modifiées dans l'intervalle ]since, until],
+    servies par les index sur updated_at, et des suppressions relevées
+    par le journal d'audit. La borne haute devient le prochain `since`.
+    """
+    queries = {}
+    for name, model in CHANGE_MODELS.items():
+        table = model.__table__
+        columns = [column for column in table.columns
+                   if column.name not in EXCLUDED_COLUMNS]
+        queries[name] = (
+            select(*columns)
+            .where(table.c.updated_at > since, table.c.updated_at <= until)
+            .order_by(table.c.updated_at, table.c.id))
+    queries["deleted"] = (
+        select(AuditLog.entity, AuditLog.entity_id,
+               AuditLog.ts.label("deleted_at"))
+        .where(AuditLog.operation == "delete",
+               AuditLog.entity.in_(CHANGE_MODELS),
+               AuditLog.ts > since, AuditLog.ts <= until)
+        .order_by(AuditLog.ts, AuditLog.id))
+    return queries
+
+
+if __name__ == "__main__":
+    export_app()
@@ -0,0 +1,33 @@
+import typer
+from typing import List
+from src.models.search import Search
+from src.models.permission import requires_login
+from src.models.common import get_session
+from src.view.display_view import Display
+
+display = Display()
+
+
+@requires_login()
+def search(
+    ctx: typer.Context,
+    terms: List[str] = typer.Argument(..., help="Termes recherchés"),
+    limit: int = typer.Option(20, help="Nombre maximum de résultats"),
+):
+    """Recherche des clients et des événements (nom, email, lieu, notes)"""
+    session = get_session()
+    try:
+        rows = Search.find(session, terms, limit=limit)
+        if not rows:
+            typer.secho("❌ Aucun résultat", fg=typer.colors.RED)
+            return
+        display.rows(
+            title=f"Résultats pour « {' '.join(terms)} »",
+            headers=Search.headers,
+            rows=[(*row[:4], round(-row[4], 2)) for row in rows],
+        )
+    except Exception as e:
+        typer.secho(f"❌ {str(e)}", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
+    finally:
+        session.close()
@@ -0,0 +1,62 @@
+import json
+import typer
+from typing import List, Optional
+from src.server import daemon
+from src.server.client import DaemonClient
+
+server_app = typer.Typer(
+    name="Epic Events Server",
+    help="Serveur local exposant l'API Epic Events en JSON",
+)
+
+
+@server_app.command(name="start")
+def start(
+    socket_path: str = typer.Option(
+        daemon.DEFAULT_SOCKET_PATH, help="Chemin du socket Unix"),
+    host: str = typer.Option("127.0.0.1", help="Adresse d'écoute TCP"),
+    port: Optional[int] = typer.Option(
+        None, help="Port TCP local (remplace le socket Unix)"),
+):
+    """Démarre le serveur Epic Events"""
+    address = f"{host}:{port}" if port else socket_path
+    typer.secho(
+        f"🚀 Serveur Epic Events en écoute sur {address}",
+        fg=typer.colors.GREEN)
+    try:
+        daemon.run(socket_path=socket_path, host=host, port=port)
+    except KeyboardInterrupt:
+        typer.secho("✅ Serveur arrêté", fg=typer.colors.GREEN)
+
+
+@server_app.command(name="call")
+def call(
+    action: str = typer.Argument(..., help="Action, ex: client.report"),
+    param: List[str] = typer.Option(
+        [], "--param", "-p", help="Paramètre clé=valeur (valeur JSON)"),
+    socket_path: str = typer.Option(
+        daemon.DEFAULT_SOCKET_PATH, help="Chemin du socket Unix"),
+    host: str = typer.Option("127.0.0.1", help="Adresse TCP du serveur"),
+    port: Optional[int] = typer.Option(None, help="Port TCP du serveur"),
+):
+    """Envoie une requête au serveur Epic Events (client léger)"""
+    params = {}
+    for item in param:
+        key, _, value = item.partition("=")
+        try:
+            params[key] = json.loads(value)
+        except json.JSONDecodeError:
+            params[key] = value
+
+    try:
+        client = DaemonClient(socket_path=socket_path, host=host, port=port)
+        response = client.call(action, **params)
+        client.close()
+    except OSError as e:
+        typer.secho(f"❌ Serveur injoignable : {e}", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
+
+    if not response["ok"]:
+        typer.secho(f"❌ {response['error']}", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
+    typer.echo(json.dumps(response["data"], indent=2, ensure_ascii=False))
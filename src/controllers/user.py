@@ -1,7 +1,10 @@
 import typer
 from typing import Optional
+from sqlalchemy import select
 from src.models.user import User, UserRole
+from src.models.report import USER_REPORT
 from src.view.display_view import Display
+from src.view.export_view import Export, ExportFormat
 from sentry_sdk import capture_exception
 from src.models.permission import requires_permission, requires_login
 from src.models.common import get_session
@@ -26,7 +29,7 @@ def create(
         ..., prompt=True, help="Rôle d'utilisateur"),
 ):
     """Crée un utilisateur dans la base de données"""
-    session = get_session()
+    session = get_session(write=True)
     try:
         # Vérifie les permissions de l'utilisateur-
         user = User.create_object(
@@ -53,35 +56,43 @@ def user_repport(
     ctx: typer.Context,
     user_id: Optional[int] = typer.Option(
         None, help="ID d'un utilisateur spécifique"),
-    role: Optional[UserRole] = typer.Option(None, help="Filtrer par rôle")
+    role: Optional[UserRole] = typer.Option(None, help="Filtrer par rôle"),
+    export: Optional[str] = typer.Option(
+        None, help="Chemin du fichier d'export"),
+    export_format: ExportFormat = typer.Option(
+        ExportFormat.CSV, "--format", help="Format du fichier d'export"),
 ):
     """Lister les utilisateurs"""
     session = get_session()
-    headers = ["ID", "Username", "Email", "Role"]
     try:
+        if export:
+            count = Export.write(
+                session, export_users_query(user_id=user_id, role=role),
+                export, export_format)
+            typer.secho(f"✅ {count} utilisateurs exportés vers {export}")
+            return
+
         if user_id:
-            user = User.get_object(session, id=user_id)
-            if user:
-                display.table(
+            rows = USER_REPORT.rows(session, User.id == user_id)
+            if rows:
+                display.rows(
                     title="Détails de l'utilisateur:",
-                    headers=headers,
-                    items=[User.format_user_data(session, user)],
+                    headers=USER_REPORT.headers,
+                    rows=rows,
                 )
             else:
                 typer.secho("❌ Utilisateur non trouvé", fg=typer.colors.RED)
         else:
-            users = User.get_all_object(session)
-            if role:
-                users = [user for user in users if user.role == role.value]
-
-            display.table(
+            conditions = [User.role == role.value] if role else []
+            display.rows(
                 title="Liste des Utilisateurs",
-                items=[User.format_user_data(session, user) for user in users],
-                headers=headers,
+                headers=USER_REPORT.headers,
+                rows=USER_REPORT.rows(session, *conditions),
             )
     except Exception as e:
         typer.secho(
                     f"\n ❌ {str(e)}", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
     finally:
         session.close()
 
@@ -99,7 +110,7 @@ def user_update(
     password: Optional[str] = typer.Option(None, help="Nouveau mot de passe")
 ):
     """Mettre à jour les informations d'un utilisateur"""
-    session = get_session()
+    session = get_session(write=True)
     ctx.obj["client_id"] = id
     try:
         # Vérifie les permissions de l'utilisateur
@@ -116,6 +127,7 @@ def user_update(
     except Exception as e:
         typer.secho(
                     f"\n ❌ {str(e)}", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
     finally:
         session.close()
 
@@ -133,7 +145,7 @@ def delete(
         typer.confirm(
             "❓Êtes-vous sûr de vouloir supprimer cet utilisateur ?",
             abort=True)
-        session = get_session()
+        session = get_session(write=True)
         User.delete_object(session, id)
         typer.secho(
             f'✅ Utilisateur {id} supprimé avec succès',
@@ -143,9 +155,21 @@ def delete(
         typer.secho(
                     f"\n ❌ {str(e)}", fg=typer.colors.RED)
         capture_exception(e)
+        raise typer.Exit(code=1)
     finally:
         session.close()
 
 
+def export_users_query(user_id=None, role=None):
+    """Requête des utilisateurs filtrés (sans mot de passe), pour l'export."""
+    query = select(User.id, User.username, User.email, User.role,
+                   User.created_at)
+    if user_id:
+        query = query.where(User.id == user_id)
+    if role:
+        query = query.where(User.role == role.value)
+    return query.order_by(User.id)
+
+
 if __name__ == "__main__":
     user_app()
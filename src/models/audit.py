@@ -0,0 +1,146 @@
+import json
+from sqlalchemy import (
+    Column, Integer, String, Text, DateTime, Index, event, inspect, select)
+from sqlalchemy.orm import Session
+from src.models.base import BaseModel, utc_now
+
+AUDITED_TABLES = {"users", "clients", "contracts", "events"}
+# Colonnes techniques, absentes du journal
+IGNORED_COLUMNS = {"updated_at", "content_hash", "version_id"}
+# Colonnes dont seule la modification est journalisée, pas la valeur
+MASKED_COLUMNS = {"password"}
+MASK = "***"
+
+
+class AuditLog(BaseModel):
+    """
+    Journal d'audit en ajout seul
+        args: id (int),
+              ts (datetime),
+              actor_id (int) : utilisateur connecté (None hors CLI),
+              entity (str) : table concernée,
+              entity_id (int),
+              operation (str) : create, update, sign, delete, ou
+                                payment / sync pour les écritures en masse,
+              changes (str) : colonnes modifiées au format JSON
+    """
+    __tablename__ = "audit_log"
+
+    id = Column(Integer, primary_key=True)
+    ts = Column(DateTime, nullable=False, default=utc_now)
+    actor_id = Column(Integer)
+    entity = Column(String, nullable=False)
+    entity_id = Column(Integer)
+    operation = Column(String, nullable=False)
+    changes = Column(Text, nullable=False, default="{}")
+
+    __table_args__ = (
+        Index("ix_audit_log_entity", "entity", "entity_id", "ts"),
+        # Suppressions de l'export incrémental (export changes)
+        Index("ix_audit_log_ts", "ts"),
+        {'extend_existing': True},
+    )
+
+    headers = ["Date", "Utilisateur", "Entité", "ID", "Opération",
+               "Modifications"]
+
+    @classmethod
+    def history(cls, session, entity, entity_id=None, limit=50):
+        """Dernières entrées d'une table, ou d'une ligne, plus récentes
+        en premier"""
+        try:
+            query = select(
+                cls.ts, cls.actor_id, cls.entity, cls.entity_id,
+                cls.operation, cls.changes).where(cls.entity == entity)
+            if entity_id is not None:
+                query = query.where(cls.entity_id == entity_id)
+            return session.execute(
+                query.order_by(cls.ts.desc(), cls.id.desc()).limit(limit)
+            ).tuples().all()
+        except Exception as e:
+            raise Exception(
+                f"Erreur lors de la lecture du journal d'audit: {str(e)}")
+
+    @classmethod
+    def write(cls, session, entries):
+        """
+        Ajoute des entrées dans la transaction en cours, en un seul
+        INSERT multi-lignes (opérations en masse hors ORM).
+            entries: dictionnaires entity, entity_id, operation, changes
+        """
+        if not entries:
+            return
+        now, actor_id = utc_now(), current_actor(session)
+        session.connection().execute(cls.__table__.insert(), [
+            {"ts": now, "actor_id": actor_id, **entry,
+             "changes": json.dumps(entry.get("changes", {}), default=str)}
+            for entry in entries
+        ])
+
+
+def current_actor(session):
+    """
+    Utilisateur à l'origine des modifications : `session.info["actor_id"]`
+    s'il est fourni, sinon l'utilisateur connecté de la CLI.
+    """
+    if "actor_id" in session.info:
+        return session.info["actor_id"]
+    from src.models.user_session import UserSession
+
+    user = UserSession._current_user
+    identity = inspect(user).identity if user is not None else None
+    return identity[0] if identity else None
+
+
+def _changes(state, operation):
+    """Colonnes modifiées : [ancienne, nouvelle] pour une mise à jour,
+    valeurs de la ligne pour une création ou une suppression"""
+    changes = {}
+    for attribute in state.mapper.column_attrs:
+        key = attribute.key
+        if key in IGNORED_COLUMNS:
+            continue
+        if operation == "update":
+            history = state.attrs[key].history
+            if not history.has_changes():
+                continue
+            old = history.deleted[0] if history.deleted else None
+            new = history.added[0] if history.added else None
+            if old == new:
+                continue
+            changes[key] = ([MASK, MASK] if key in MASKED_COLUMNS
+                            else [old, new])
+        elif state.dict.get(key) is not None:
+            changes[key] = (MASK if key in MASKED_COLUMNS
+                            else state.dict[key])
+    return changes
+
+
+@event.listens_for(Session, "after_flush")
+def record_changes(session, flush_context):
+    """
+    Journalise les lignes écrites par le flush, dans la même transaction.
+    L'historique des attributs est encore disponible à ce stade.
+    """
+    entries = []
+    for objects, operation in ((session.new, "create"),
+                               (session.dirty, "update"),
+                               (session.deleted, "delete")):
+        for obj in objects:
+            state = inspect(obj)
+            table = state.mapper.local_table.name
+            if table not in AUDITED_TABLES:
+                continue
+            changes = _changes(state, operation)
+            if operation == "update" and not changes:
+                continue
+            signed = (table == "contracts" and operation == "update" and
+                      changes.get("is_signed", [None, None])[1] is True)
+            entries.append({
+                "entity": table,
+                "entity_id": (state.identity[0] if state.identity
+                              else state.dict.get("id")),
+                "operation": "sign" if signed else operation,
+                "changes": changes,
+            })
+    AuditLog.write(session, entries)
@@ -4,6 +4,7 @@ from src.models.user import User
 from pathlib import Path
 import os
 from dotenv import load_dotenv
+from src.config.tracing import traced
 
 load_dotenv()
 
@@ -53,6 +54,7 @@ class Token:
                 return file.read().strip()
         return None
 
+    @traced("auth", "Token.verify_token")
     def verify_token(token):
         try:
             payload = jwt.decode(token, SECRET_KEY, algorithms=["HS256"])
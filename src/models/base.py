@@ -1,8 +1,24 @@
+from datetime import datetime, timezone
+from sqlalchemy import inspect, select
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.orm.exc import StaleDataError
 
 Base = declarative_base()
 
 
+def utc_now():
+    """
+    Horodatage UTC (naïf, tel que stocké par SQLite).
+    Passé sans parenthèses en `default` / `onupdate` des colonnes :
+    il est évalué à chaque écriture, pas à l'import du module.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class ConcurrentUpdateError(Exception):
+    """La ligne a été modifiée par une autre session depuis sa lecture"""
+
+
 class BaseModel(Base):
     __abstract__ = True
 
@@ -27,6 +43,11 @@ class BaseModel(Base):
             session.add(obj)
             session.commit()
             return obj
+        except StaleDataError:
+            # UPDATE ... WHERE version_id = <version lue> n'a touché
+            # aucune ligne : une autre session a écrit entre-temps
+            session.rollback()
+            raise cls._conflict(obj)
         except Exception as e:
             session.rollback()
             raise Exception(
@@ -34,6 +55,14 @@ class BaseModel(Base):
                 f"de l'objet {cls.__name__}: {str(e)}"
             )
 
+    @classmethod
+    def _conflict(cls, obj):
+        identity = inspect(obj).identity
+        return ConcurrentUpdateError(
+            f"{cls.__name__} n°{identity[0] if identity else '?'} modifié "
+            f"par un autre utilisateur entre-temps : rechargez-le puis "
+            f"recommencez")
+
     @classmethod
     def _delete_object(cls, session, obj):
         try:
@@ -46,3 +75,66 @@ class BaseModel(Base):
                 f"Erreur lors de la suppression "
                 f"de l'objet {cls.__name__}: {str(e)}"
             )
+
+    # API asynchrone (AsyncSession). Les lectures et écritures simples sont
+    # natives, les méthodes métier réutilisent la version synchrone via
+    # `run_sync` pour conserver les mêmes validations.
+
+    @classmethod
+    async def aget_object(cls, async_session, **kwargs):
+        result = await async_session.execute(
+            select(cls).filter_by(**kwargs).limit(1))
+        return result.scalars().first()
+
+    @classmethod
+    async def aget_all_object(cls, async_session, **filters):
+        try:
+            query = select(cls)
+            if filters:
+                query = query.filter_by(**filters)
+            result = await async_session.execute(query)
+            return result.scalars().all()
+        except Exception as e:
+            raise Exception(
+                f'Erreur lors de la récupération: {str(e)}')
+
+    @classmethod
+    async def _asave_object(cls, async_session, obj):
+        try:
+            async_session.add(obj)
+            await async_session.commit()
+            return obj
+        except StaleDataError:
+            await async_session.rollback()
+            raise cls._conflict(obj)
+        except Exception as e:
+            await async_session.rollback()
+            raise Exception(
+                f"Erreur lors de la création "
+                f"de l'objet {cls.__name__}: {str(e)}"
+            )
+
+    @classmethod
+    async def _adelete_object(cls, async_session, obj):
+        try:
+            await async_session.delete(obj)
+            await async_session.commit()
+            return obj
+        except Exception as e:
+            await async_session.rollback()
+            raise Exception(
+                f"Erreur lors de la suppression "
+                f"de l'objet {cls.__name__}: {str(e)}"
+            )
+
+    @classmethod
+    async def acreate_object(cls, async_session, **kwargs):
+        return await async_session.run_sync(cls.create_object, **kwargs)
+
+    @classmethod
+    async def aupdate_object(cls, async_session, *args, **kwargs):
+        return await async_session.run_sync(cls.update_object, *args, **kwargs)
+
+    @classmethod
+    async def adelete_object(cls, async_session, *args):
+        return await async_session.run_sync(cls.delete_object, *args)
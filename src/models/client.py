@@ -1,6 +1,5 @@
-from datetime import datetime, timezone
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
-from src.models.base import BaseModel
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
+from src.models.base import BaseModel, ConcurrentUpdateError, utc_now
 from src.models.validators import ClientValidator
 from src.models.user import User
 
@@ -24,13 +23,23 @@ class Client(BaseModel):
     email = Column(String, nullable=False, unique=True)
     phone = Column(String, nullable=False)
     company_name = Column(String, nullable=False)
-    created_at = Column(DateTime, default=datetime.now(timezone.utc))
-    updated_at = Column(
-        DateTime, default=datetime.now, onupdate=datetime.now(timezone.utc)
-    )
+    created_at = Column(DateTime, default=utc_now)
+    updated_at = Column(DateTime, default=utc_now, onupdate=utc_now)
     commercial_id = Column(Integer, ForeignKey('users.id'), nullable=False)
-
-    __table_args__ = {'extend_existing': True}
+    # Coordonnées normalisées : email en minuscules, téléphone E.164
+    email_normalized = Column(String)
+    phone_normalized = Column(String)
+    # Empreinte du dernier enregistrement importé par `client sync`
+    content_hash = Column(String)
+    version_id = Column(Integer, nullable=False, server_default="1")
+
+    __table_args__ = (
+        Index("ix_clients_email_normalized", "email_normalized", unique=True),
+        Index("ix_clients_phone_normalized", "phone_normalized", unique=True),
+        Index("ix_clients_updated_at", "updated_at"),
+        {'extend_existing': True},
+    )
+    __mapper_args__ = {"version_id_col": version_id}
 
     def __repr__(self):
         return f'Client {self.first_name} {self.last_name}'
@@ -52,9 +61,17 @@ class Client(BaseModel):
         try:
             ClientValidator.validate_required_fields(**kwargs)
             ClientValidator.validate_email(kwargs['email'])
+            kwargs['email_normalized'] = ClientValidator.normalize_email(
+                kwargs['email'])
+            kwargs['phone_normalized'] = ClientValidator.normalize_phone(
+                kwargs['phone'])
 
-            if cls.get_object(session, email=kwargs['email']):
+            if cls.get_object(
+                    session, email_normalized=kwargs['email_normalized']):
                 raise Exception("Un client avec cet email existe déjà")
+            if cls.get_object(
+                    session, phone_normalized=kwargs['phone_normalized']):
+                raise Exception("Un client avec ce téléphone existe déjà")
 
             if 'commercial_id' in kwargs:
                 commercial = User.get_object(
@@ -94,8 +111,20 @@ class Client(BaseModel):
 
             if 'email' in updates:
                 ClientValidator.validate_email(updates['email'])
-                if cls.get_object(session, email=updates['email']):
+                updates['email_normalized'] = ClientValidator.normalize_email(
+                    updates['email'])
+                existing = cls.get_object(
+                    session, email_normalized=updates['email_normalized'])
+                if existing and existing.id != client_id:
                     raise Exception("Un client avec cet email existe déjà")
+            if 'phone' in updates:
+                updates['phone_normalized'] = ClientValidator.normalize_phone(
+                    updates['phone'])
+                existing = cls.get_object(
+                    session, phone_normalized=updates['phone_normalized'])
+                if existing and existing.id != client_id:
+                    raise Exception(
+                        "Un client avec ce téléphone existe déjà")
             if 'commercial_id' in updates:
                 commercial = User.get_object(
                     session, id=updates['commercial_id']
@@ -108,6 +137,8 @@ class Client(BaseModel):
                     setattr(client, key, value)
 
             return cls._save_object(session, client)
+        except ConcurrentUpdateError:
+            raise
         except Exception as e:
             raise Exception(
                 f"Une erreur lors de la mise à jour du client: {str(e)}")
@@ -2,21 +2,65 @@ import os
 from dotenv import load_dotenv
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from src.models import audit  # noqa: F401 (journal d'audit des sessions)
+from src.models.locking import configure_sqlite, write_engine
 
 load_dotenv()
 
 
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///epic_event.db")
-engine = create_engine(DATABASE_URL)
+engine = configure_sqlite(create_engine(DATABASE_URL))
 
 Session = sessionmaker(bind=engine)
+WriteSession = sessionmaker(bind=write_engine(engine))
 
+ASYNC_DATABASE_URL = DATABASE_URL.replace(
+    "sqlite://", "sqlite+aiosqlite://", 1)
+_async_session_factory = None
 
-def get_session():
-    """Retourne une session SQLAlchemy"""
+
+def get_session(write=False):
+    """
+    Retourne une session SQLAlchemy.
+    Les commandes qui écrivent demandent `write=True` : leurs
+    transactions prennent le verrou d'écriture dès le départ
+    (BEGIN IMMEDIATE, avec nouvelles tentatives si la base est occupée).
+    """
     try:
-        session = Session()
+        session = WriteSession() if write else Session()
         return session
     except Exception as e:
         print(f"❌ Erreur lors de la création de la session: {e}")
         raise
+
+
+def get_async_session():
+    """
+    Retourne une session SQLAlchemy asynchrone (pilote aiosqlite).
+    Le moteur asynchrone n'est créé qu'à la première utilisation.
+    """
+    global _async_session_factory
+    try:
+        if _async_session_factory is None:
+            from sqlalchemy.ext.asyncio import (
+                create_async_engine, async_sessionmaker)
+
+            _async_session_factory = async_sessionmaker(
+                bind=create_async_engine(ASYNC_DATABASE_URL),
+                expire_on_commit=False,
+            )
+        return _async_session_factory()
+    except Exception as e:
+        print(f"❌ Erreur lors de la création de la session asynchrone: {e}")
+        raise
+
+
+async def dispose_async_engine():
+    """
+    Ferme les connexions asynchrones pour laisser le processus
+    se terminer.
+    """
+    global _async_session_factory
+    if _async_session_factory is not None:
+        await _async_session_factory.kw["bind"].dispose()
+        _async_session_factory = None
@@ -1,6 +1,6 @@
-from datetime import datetime, timezone
-from sqlalchemy import Column, Integer, DateTime, ForeignKey, Float, Boolean
-from src.models.base import BaseModel
+from sqlalchemy import (
+    Column, Integer, DateTime, ForeignKey, Float, Boolean, Index)
+from src.models.base import BaseModel, ConcurrentUpdateError, utc_now
 from src.models.validators import ContractValidator
 from src.models.user import User
 from src.config.sentry_base import logger
@@ -24,10 +24,17 @@ class Contract(BaseModel):
     commercial_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     total_amount = Column(Float, nullable=False)
     remaining_amount = Column(Float, nullable=False)
-    created_at = Column(DateTime, default=datetime.now(timezone.utc))
+    created_at = Column(DateTime, default=utc_now)
+    updated_at = Column(DateTime, default=utc_now, onupdate=utc_now)
     is_signed = Column(Boolean, default=False)
+    # Verrou optimiste : chaque UPDATE vérifie puis incrémente la version
+    version_id = Column(Integer, nullable=False, server_default="1")
 
-    __table_args__ = {'extend_existing': True}
+    __table_args__ = (
+        Index("ix_contracts_updated_at", "updated_at"),
+        {'extend_existing': True},
+    )
+    __mapper_args__ = {"version_id_col": version_id}
 
     @classmethod
     def create_object(cls, session, **kwargs):
@@ -81,6 +88,8 @@ class Contract(BaseModel):
                 if hasattr(contract, key):
                     setattr(contract, key, value)
             return cls._save_object(session, contract)
+        except ConcurrentUpdateError:
+            raise
         except Exception as e:
             session.rollback()
             raise Exception(
@@ -104,6 +113,8 @@ class Contract(BaseModel):
             contract.total_amount = total_amount
             return cls._save_object(session, contract)
 
+        except ConcurrentUpdateError:
+            raise
         except Exception as e:
             raise Exception(
                 f"Une erreur lors de la mise à jour du contrat: {str(e)}")
@@ -125,6 +136,8 @@ class Contract(BaseModel):
             logger.info(success_message)
             capture_message(success_message)
             return cls._save_object(session, contract)
+        except ConcurrentUpdateError:
+            raise
         except Exception as e:
             logger.error(f"Erreur lors de la signature du contrat "
                          f"{contract_id}: {str(e)}")
@@ -132,6 +145,15 @@ class Contract(BaseModel):
             raise Exception(
                 f"Une erreur lors de la signature du contrat: {str(e)}")
 
+    @classmethod
+    async def aupdate_amount(cls, async_session, contract_id, **kwargs):
+        return await async_session.run_sync(
+            cls.update_amount, contract_id, **kwargs)
+
+    @classmethod
+    async def asign_object(cls, async_session, contract_id):
+        return await async_session.run_sync(cls.sign_object, contract_id)
+
     @classmethod
     def delete_object(cls, session, contract_id):
         """
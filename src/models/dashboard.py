@@ -0,0 +1,90 @@
+import asyncio
+from datetime import datetime
+from sqlalchemy import select, func, case
+from src.models.user import User, UserRole
+from src.models.client import Client
+from src.models.contract import Contract
+from src.models.event import Event
+from src.models.common import get_async_session
+
+
+class Dashboard:
+    """
+    Tableau de bord commercial calculé en SQL.
+    Chaque indicateur est une requête GROUP BY indépendante,
+    exécutée en parallèle sur sa propre connexion.
+    """
+
+    headers = [
+        "ID du commercial",
+        "Commercial",
+        "Clients",
+        "Montant signé",
+        "Montant non signé",
+        "Montant restant",
+        "Événements à venir",
+    ]
+
+    @staticmethod
+    def commercials_query():
+        return select(User.id, User.username).where(
+            User.role == UserRole.COMMERCIAL.value)
+
+    @staticmethod
+    def clients_query():
+        return select(
+            Client.commercial_id, func.count(Client.id)
+        ).group_by(Client.commercial_id)
+
+    @staticmethod
+    def contracts_query():
+        signed = Contract.is_signed.is_(True)
+        return select(
+            Contract.commercial_id,
+            func.sum(case((signed, Contract.total_amount), else_=0)),
+            func.sum(case((signed, 0), else_=Contract.total_amount)),
+            func.sum(Contract.remaining_amount),
+        ).group_by(Contract.commercial_id)
+
+    @staticmethod
+    def events_query(now=None):
+        return select(
+            Contract.commercial_id, func.count(Event.id)
+        ).join(
+            Contract, Event.contract_id == Contract.id
+        ).where(
+            Event.start_date >= (now or datetime.now())
+        ).group_by(Contract.commercial_id)
+
+    @staticmethod
+    async def _fetch_rows(session_factory, query):
+        async with session_factory() as session:
+            result = await session.execute(query)
+            return result.all()
+
+    @classmethod
+    async def fetch(cls, session_factory=get_async_session):
+        """Exécute les requêtes en parallèle et fusionne les résultats"""
+        commercials, clients, contracts, events = await asyncio.gather(
+            cls._fetch_rows(session_factory, cls.commercials_query()),
+            cls._fetch_rows(session_factory, cls.clients_query()),
+            cls._fetch_rows(session_factory, cls.contracts_query()),
+            cls._fetch_rows(session_factory, cls.events_query()),
+        )
+        client_counts = dict(clients)
+        amounts = {row[0]: row[1:] for row in contracts}
+        event_counts = dict(events)
+
+        rows = []
+        for commercial_id, username in commercials:
+            signed, unsigned, remaining = amounts.get(commercial_id, (0, 0, 0))
+            rows.append({
+                "ID du commercial": commercial_id,
+                "Commercial": username,
+                "Clients": client_counts.get(commercial_id, 0),
+                "Montant signé": signed or 0,
+                "Montant non signé": unsigned or 0,
+                "Montant restant": remaining or 0,
+                "Événements à venir": event_counts.get(commercial_id, 0),
+            })
+        return rows
@@ -1,6 +1,8 @@
-from datetime import datetime, timezone
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text
-from src.models.base import BaseModel
+from datetime import datetime
+from sqlalchemy import (
+    Column, Integer, String, DateTime, ForeignKey, Text, Index, select, or_)
+from sqlalchemy.orm import aliased
+from src.models.base import BaseModel, ConcurrentUpdateError, utc_now
 from src.models.contract import Contract
 from src.models.user import User
 from src.models.client import Client
@@ -32,21 +34,77 @@ class Event(BaseModel):
     location = Column(String)
     attendees = Column(Integer)
     notes = Column(Text)
-    created_at = Column(
-        DateTime,
-        default=datetime.now(timezone.utc)
-    )
-    updated_at = Column(
-        DateTime,
-        default=datetime.now(timezone.utc),
-        onupdate=datetime.now(timezone.utc)
-    )
+    created_at = Column(DateTime, default=utc_now)
+    updated_at = Column(DateTime, default=utc_now, onupdate=utc_now)
+    version_id = Column(Integer, nullable=False, server_default="1")
 
-    __table_args__ = {'extend_existing': True}
+    __table_args__ = (
+        # Index d'intervalles : recherche des réservations d'un support
+        # par plage de dates (chevauchements, agenda)
+        Index("ix_events_support_schedule",
+              "support_contact_id", "start_date", "end_date"),
+        Index("ix_events_updated_at", "updated_at"),
+        {'extend_existing': True},
+    )
+    __mapper_args__ = {"version_id_col": version_id}
 
     def __repr__(self):
         return f'<Event {self.name}>'
 
+    @classmethod
+    def get_conflicts(cls, session, support_contact_id, start_date,
+                      end_date, exclude_id=None):
+        """
+        Retourne les événements du support qui chevauchent
+        l'intervalle [start_date, end_date[ (deux événements qui se
+        touchent ne sont pas en conflit).
+        """
+        query = select(cls).where(
+            cls.support_contact_id == support_contact_id,
+            cls.start_date < end_date,
+            cls.end_date > start_date,
+        ).order_by(cls.start_date)
+        if exclude_id is not None:
+            query = query.where(cls.id != exclude_id)
+        return session.scalars(query).all()
+
+    @classmethod
+    def check_availability(cls, session, support_contact_id, start_date,
+                           end_date, exclude_id=None):
+        """Lève une erreur si le support est déjà réservé sur le créneau"""
+        conflicts = cls.get_conflicts(
+            session, support_contact_id, start_date, end_date, exclude_id)
+        if conflicts:
+            raise Exception(
+                "Le support est déjà réservé sur ce créneau "
+                f"(événement n°{', '.join(str(e.id) for e in conflicts)})")
+
+    @classmethod
+    def conflicts_query(cls, support_contact_id=None):
+        """
+        Toutes les doubles réservations en une requête.
+        Chaque événement est joint aux événements du même support qui
+        commencent pendant sa durée : la jointure parcourt l'index
+        (support, début) par plage au lieu de comparer toutes les paires.
+        """
+        other = aliased(cls)
+        query = select(
+            cls.support_contact_id, User.username,
+            cls.id, cls.name, cls.start_date, cls.end_date,
+            other.id, other.name, other.start_date, other.end_date,
+        ).join(
+            other,
+            (other.support_contact_id == cls.support_contact_id)
+            & (other.start_date >= cls.start_date)
+            & (other.start_date < cls.end_date)
+            & (other.end_date > cls.start_date)
+            & or_(other.start_date > cls.start_date, other.id > cls.id),
+        ).join(User, User.id == cls.support_contact_id).order_by(
+            cls.support_contact_id, cls.start_date, other.start_date)
+        if support_contact_id is not None:
+            query = query.where(cls.support_contact_id == support_contact_id)
+        return query
+
     @classmethod
     def create_object(cls, session, **kwargs):
         """
@@ -87,6 +145,9 @@ class Event(BaseModel):
                 )
                 if not support_contact or support_contact.role != 'SUPPORT':
                     raise ValueError("Le SUPPORT n'existe pas")
+                cls.check_availability(
+                    session, kwargs['support_contact_id'],
+                    kwargs['start_date'], kwargs['end_date'])
 
             if 'client_id' in kwargs and kwargs['client_id']:
                 if not Client.get_object(
@@ -116,9 +177,8 @@ class Event(BaseModel):
             if 'start_date' in updates or 'end_date' in updates:
                 start_date = updates.get('start_date', event.start_date)
                 end_date = updates.get('end_date', event.end_date)
-                updates['start_date'], updates['end_date'] = [
-                    EventValidator.validate_dates(start_date, end_date)
-                ]
+                updates['start_date'], updates['end_date'] = (
+                    EventValidator.validate_dates(start_date, end_date))
 
             if 'attendees' in updates:
                 EventValidator.validate_attendees(updates['attendees'])
@@ -130,12 +190,24 @@ class Event(BaseModel):
                 if not support or support.role != 'SUPPORT':
                     raise Exception("Contact support invalide")
 
+            support_id = updates.get(
+                'support_contact_id', event.support_contact_id)
+            if support_id and {'support_contact_id', 'start_date',
+                               'end_date'} & updates.keys():
+                cls.check_availability(
+                    session, support_id,
+                    updates.get('start_date', event.start_date),
+                    updates.get('end_date', event.end_date),
+                    exclude_id=event.id)
+
             # Mise à jour des attributs valides
             for key, value in updates.items():
                 setattr(event, key, value)
 
             return cls._save_object(session, event)
 
+        except ConcurrentUpdateError:
+            raise
         except Exception as e:
             raise Exception(f"Une erreur lors de la mise "
                             f"à jour de l'événement: {str(e)}")
@@ -163,7 +235,7 @@ class Event(BaseModel):
         """
         def format_datetime(dt):
             if isinstance(dt, datetime):
-                return dt.strftime(DateTimeUtils.DATETIME_FORMAT)
+                return DateTimeUtils.format_datetime(dt)
             return str(dt)
         notes = ''
         if event.notes is not None:
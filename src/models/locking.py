@@ -0,0 +1,125 @@
+import os
+import random
+import threading
+import time
+from sqlalchemy import event
+from sqlalchemy.exc import OperationalError
+
+# Profil SQLite appliqué à chaque connexion de l'application :
+# WAL laisse les lectures se poursuivre pendant une écriture,
+# busy_timeout fait patienter SQLite avant de signaler un verrou.
+SQLITE_PROFILE = {
+    "journal_mode": os.getenv("EPIC_SQLITE_JOURNAL_MODE", "WAL"),
+    "synchronous": os.getenv("EPIC_SQLITE_SYNCHRONOUS", "NORMAL"),
+    "busy_timeout": int(os.getenv("EPIC_SQLITE_BUSY_TIMEOUT_MS", "1000")),
+}
+
+LOCK_RETRIES = int(os.getenv("EPIC_LOCK_RETRIES", "6"))
+LOCK_BACKOFF = float(os.getenv("EPIC_LOCK_BACKOFF_MS", "50")) / 1000
+LOCK_MAX_BACKOFF = 2.0
+
+
+class DatabaseLockedError(Exception):
+    """La base est restée verrouillée malgré les nouvelles tentatives"""
+
+
+class LockStats:
+    """
+    Compteurs de contention sur le verrou d'écriture
+        args: retries (int) : nouvelles tentatives après un verrou,
+              failures (int) : écritures abandonnées,
+              wait (float) : temps passé à attendre le verrou, en secondes
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.retries = 0
+        self.failures = 0
+        self.wait = 0.0
+
+    def add(self, retries=0, failures=0, wait=0.0):
+        with self._lock:
+            self.retries += retries
+            self.failures += failures
+            self.wait += wait
+
+    def snapshot(self):
+        return {"retries": self.retries, "failures": self.failures,
+                "wait": self.wait}
+
+    def summary(self):
+        return (f"{self.retries} nouvelles tentatives sur verrou "
+                f"({self.wait * 1000:.1f} ms d'attente, "
+                f"{self.failures} abandons)")
+
+
+lock_stats = LockStats()
+
+
+def is_lock_error(error):
+    message = str(error).lower()
+    return "database is locked" in message or "database is busy" in message
+
+
+def retry_on_lock(func, retries=LOCK_RETRIES, backoff=LOCK_BACKOFF):
+    """
+    Exécute `func` et la relance tant que la base est verrouillée,
+    avec un délai exponentiel tiré au hasard (« full jitter ») pour que
+    les processus en attente ne se réveillent pas tous ensemble.
+    """
+    for attempt in range(retries + 1):
+        start = time.perf_counter()
+        try:
+            result = func()
+            lock_stats.add(wait=time.perf_counter() - start)
+            return result
+        except OperationalError as e:
+            waited = time.perf_counter() - start
+            if not is_lock_error(e):
+                raise
+            if attempt == retries:
+                lock_stats.add(failures=1, wait=waited)
+                raise DatabaseLockedError(
+                    "Base de données occupée par d'autres écritures : "
+                    "réessayez dans quelques instants")
+            delay = random.uniform(
+                0, min(LOCK_MAX_BACKOFF, backoff * 2 ** attempt))
+            time.sleep(delay)
+            lock_stats.add(retries=1, wait=waited + delay)
+
+
+def configure_sqlite(engine, profile=None):
+    """
+    Applique le profil SQLite et installe `BEGIN IMMEDIATE` pour les
+    sessions d'écriture (option d'exécution `sqlite_begin`).
+    Le verrou d'écriture est pris dès le début de la transaction :
+    une transaction de lecture n'a plus à être promue en écriture,
+    ce que SQLite refuse sans attendre quand un autre processus écrit.
+    """
+    if engine.dialect.name != "sqlite":
+        return engine
+    profile = SQLITE_PROFILE if profile is None else profile
+
+    @event.listens_for(engine, "connect")
+    def apply_profile(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma, value in profile.items():
+            cursor.execute(f"PRAGMA {pragma} = {value}")
+        cursor.close()
+
+    @event.listens_for(engine, "begin")
+    def begin_immediate(connection):
+        if connection.get_execution_options().get("sqlite_begin"):
+            retry_on_lock(
+                lambda: connection.exec_driver_sql("BEGIN IMMEDIATE"))
+
+    return engine
+
+
+def write_engine(engine):
+    """Variante du moteur dont les transactions commencent par
+    BEGIN IMMEDIATE"""
+    return engine.execution_options(sqlite_begin="IMMEDIATE")
@@ -0,0 +1,107 @@
+from sqlalchemy import (
+    Column, Integer, Float, DateTime, ForeignKey, Index, func, select,
+    update)
+from src.models.audit import AuditLog, current_actor
+from src.models.base import BaseModel, utc_now
+from src.models.contract import Contract
+from src.models.validators import ContractValidator
+
+
+class Payment(BaseModel):
+    """
+    Registre des paiements, en ajout seul
+        args: id (int),
+              contract_id (int),
+              amount (float),
+              paid_at (datetime),
+              recorded_by (int) : utilisateur ayant saisi le paiement
+    """
+    __tablename__ = "payments"
+
+    id = Column(Integer, primary_key=True)
+    contract_id = Column(Integer, ForeignKey("contracts.id"), nullable=False)
+    amount = Column(Float, nullable=False)
+    paid_at = Column(DateTime, nullable=False, default=utc_now)
+    recorded_by = Column(Integer, ForeignKey("users.id"))
+
+    __table_args__ = (
+        Index("ix_payments_contract_id", "contract_id", "paid_at"),
+        {'extend_existing': True},
+    )
+
+    headers = ["ID", "Date", "Montant", "Saisi par"]
+
+    @classmethod
+    def record(cls, session, contract_id, amount, total_amount=None):
+        """
+        Enregistre un paiement et déduit son montant du reste à payer.
+        Le solde est modifié par un seul UPDATE conditionnel : deux
+        paiements simultanés ne peuvent ni s'écraser ni rendre le
+        solde négatif. Avec `total_amount`, le nouveau montant total est
+        écrit par ce même UPDATE : il n'est jamais enregistré sans le
+        paiement.
+        Retourne le nouveau montant restant.
+        """
+        try:
+            ContractValidator.validate_payment(amount)
+            contracts = Contract.__table__
+            values = {
+                "remaining_amount": contracts.c.remaining_amount - amount,
+                "version_id": contracts.c.version_id + 1}
+            changes = {}
+            if total_amount is not None:
+                values["total_amount"] = total_amount
+                changes["total_amount"] = [session.scalar(
+                    select(contracts.c.total_amount)
+                    .where(contracts.c.id == contract_id)), total_amount]
+            remaining = session.execute(
+                update(contracts)
+                .where(contracts.c.id == contract_id,
+                       contracts.c.remaining_amount >= amount)
+                .values(**values)
+                .returning(contracts.c.remaining_amount)
+            ).scalar()
+            if remaining is None:
+                contract = Contract.get_object(session, id=contract_id)
+                if not contract:
+                    raise Exception("Le contrat n'existe pas")
+                raise Exception(
+                    f"Le paiement dépasse le montant restant "
+                    f"({contract.remaining_amount})")
+            remaining = float(remaining)
+            if total_amount is not None:
+                ContractValidator.validate_amounts(total_amount, remaining)
+
+            session.execute(cls.__table__.insert(), {
+                "contract_id": contract_id, "amount": amount,
+                "recorded_by": current_actor(session)})
+            changes["remaining_amount"] = [remaining + amount, remaining]
+            AuditLog.write(session, [{
+                "entity": "contracts", "entity_id": contract_id,
+                "operation": "payment", "changes": changes}])
+            session.commit()
+            return remaining
+        except Exception as e:
+            session.rollback()
+            raise Exception(
+                f"Une erreur lors de l'enregistrement du paiement: {str(e)}")
+
+    @classmethod
+    def statement(cls, session, contract_id):
+        """
+        Relevé d'un contrat : paiements par date et total payé,
+        lus par l'index sur contract_id.
+        Retourne (contrat, lignes, total payé).
+        """
+        contract = Contract.get_object(session, id=contract_id)
+        if not contract:
+            raise Exception("Le contrat n'existe pas")
+        rows = session.execute(
+            select(cls.id, cls.paid_at, cls.amount, cls.recorded_by)
+            .where(cls.contract_id == contract_id)
+            .order_by(cls.paid_at, cls.id)
+        ).tuples().all()
+        total_paid = session.scalar(
+            select(func.coalesce(func.sum(cls.amount), 0.0))
+            .where(cls.contract_id == contract_id))
+        return contract, rows, total_paid
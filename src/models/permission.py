@@ -5,6 +5,7 @@ from src.models.contract import Contract
 from src.models.client import Client
 import typer
 from functools import wraps
+from src.config.tracing import traced
 
 
 class DynamicPermission(BaseModel):
@@ -38,32 +39,68 @@ class DynamicPermissionRule(BaseModel):
 class PermissionManager:
     """Gestionnaire des permissions dynamiques"""
 
+    _rules_cache = None
+
+    @classmethod
+    def enable_cache(cls, session):
+        """
+        Charge toutes les permissions et leurs règles en mémoire.
+        Utilisé par les processus longs (serveur) pour éviter
+        deux requêtes par vérification de permission.
+        """
+        cls._rules_cache = {
+            permission.name: cls._load_rules(session, permission)
+            for permission in DynamicPermission.get_all_object(session)
+        }
+
+    @classmethod
+    def clear_cache(cls):
+        """Vide le cache des permissions"""
+        cls._rules_cache = None
+
+    @classmethod
+    def _load_rules(cls, session, permission):
+        """Retourne les règles d'une permission sous forme de tuples"""
+        return [
+            (rule.attribute, rule.value, rule.operator, rule.error_message)
+            for rule in DynamicPermissionRule.get_all_object(
+                session, permission_id=permission.id)
+        ]
+
     @classmethod
+    def _get_rules(cls, session, permission_name):
+        """Récupère les règles d'une permission, depuis le cache si actif"""
+        if cls._rules_cache is not None:
+            return cls._rules_cache.get(permission_name)
+
+        permission = DynamicPermission.get_object(
+            session, name=permission_name)
+        if not permission:
+            return None
+        return cls._load_rules(session, permission)
+
+    @classmethod
+    @traced("permission", "PermissionManager.validate_permission")
     def validate_permission(
         cls, session, user, permission_name, context=None, return_error=False
     ):
         """Vérifie si un utilisateur a une permission spécifique."""
-        permission = DynamicPermission.get_object(
-            session, name=permission_name)
-        if not permission:
+        rules = cls._get_rules(session, permission_name)
+        if rules is None:
             return (False, "Permission non trouvée") if return_error else False
 
-        rules = DynamicPermissionRule.get_all_object(
-            session, permission_id=permission.id
-        )
         context = context or {}
 
         errors = []
 
-        for rule in rules:
-            actual_value = cls._get_value(rule.attribute, user, context)
-            expected_value = cls._get_value(rule.value, user, context)
+        for attribute, value, operator, error_message in rules:
+            actual_value = cls._get_value(attribute, user, context)
+            expected_value = cls._get_value(value, user, context)
 
-            if cls._apply_operator(
-                    rule.operator, actual_value, expected_value):
+            if cls._apply_operator(operator, actual_value, expected_value):
                 return (True, None)
 
-            errors.append(rule.error_message)
+            errors.append(error_message)
 
         return (
             (False, errors[0])
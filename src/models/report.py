@@ -0,0 +1,98 @@
+from sqlalchemy import select, func
+from src.models.user import User
+from src.models.client import Client
+from src.models.contract import Contract
+from src.models.event import Event
+
+
+class ReportSchema:
+    """
+    Schéma d'un rapport : en-têtes affichés et colonnes SQL associées.
+    Les lignes sont lues en tuples directement depuis le curseur,
+    sans construire d'objets ORM ni de dictionnaires intermédiaires.
+    """
+
+    def __init__(self, columns, from_clause):
+        self.headers = list(columns.keys())
+        self.columns = list(columns.values())
+        self.from_clause = from_clause
+
+    def query(self, *conditions):
+        return select(*self.columns).select_from(
+            self.from_clause).where(*conditions)
+
+    def rows(self, session, *conditions):
+        """Retourne les lignes du rapport, triées par la première colonne"""
+        query = self.query(*conditions).order_by(self.columns[0])
+        return session.execute(query).tuples().all()
+
+
+CLIENT_REPORT = ReportSchema(
+    {
+        "ID": Client.id,
+        "Prènom": Client.first_name,
+        "Nom": Client.last_name,
+        "Email": Client.email,
+        "Phone": Client.phone,
+        "Company name": Client.company_name,
+        "Commercial ID": Client.commercial_id,
+        "Commercial Name": func.coalesce(User.username, "Non attribué"),
+    },
+    Client.__table__.outerjoin(
+        User.__table__, User.id == Client.commercial_id),
+)
+
+CONTRACT_REPORT = ReportSchema(
+    {
+        "ID du contrat": Contract.id,
+        "ID du client": Contract.client_id,
+        "ID du commercial": Contract.commercial_id,
+        "Montant total": Contract.total_amount,
+        "Montant restant": Contract.remaining_amount,
+        "Signé": Contract.is_signed,
+    },
+    Contract.__table__,
+)
+
+EVENT_REPORT = ReportSchema(
+    {
+        "ID de l'Événement": Event.id,
+        "ID du support": Event.support_contact_id,
+        "ID du client": Event.client_id,
+        "ID du contrat": Event.contract_id,
+        "Nom de l'événement": Event.name,
+        "Date de début": Event.start_date,
+        "Date de fin": Event.end_date,
+        "Localisation": Event.location,
+        "Nombre de participants": Event.attendees,
+        "Créé le": Event.created_at,
+        "Mise à jour le": Event.updated_at,
+        "Notes": func.coalesce(Event.notes, ""),
+    },
+    Event.__table__,
+)
+
+USER_REPORT = ReportSchema(
+    {
+        "ID": User.id,
+        "Username": User.username,
+        "Email": User.email,
+        "Role": User.role,
+    },
+    User.__table__,
+)
+
+AGENDA_REPORT = ReportSchema(
+    {
+        "Date de début": Event.start_date,
+        "Date de fin": Event.end_date,
+        "ID de l'Événement": Event.id,
+        "Nom de l'événement": Event.name,
+        "Localisation": Event.location,
+        "Nombre de participants": Event.attendees,
+        "Client": Client.company_name,
+        "ID du support": Event.support_contact_id,
+        "Notes": func.coalesce(Event.notes, ""),
+    },
+    Event.__table__.join(Client.__table__, Client.id == Event.client_id),
+)
@@ -0,0 +1,135 @@
+import heapq
+from bisect import bisect_left, insort
+from datetime import datetime
+from sqlalchemy import bindparam, select, update
+from src.models.audit import AuditLog
+from src.models.base import ConcurrentUpdateError
+from src.models.event import Event
+from src.models.user import User
+
+
+class SupportSchedule:
+    """
+    Réservations d'un support, triées par date de début.
+    La vérification de disponibilité est une recherche dichotomique :
+    seuls les événements qui commencent avant la fin du créneau et
+    dans la durée maximale déjà réservée sont examinés.
+    """
+
+    def __init__(self, support_id):
+        self.support_id = support_id
+        self.intervals = []
+        self.longest = 0.0
+        self.hours = 0.0
+
+    def book(self, start, end):
+        insort(self.intervals, (start, end))
+        duration = (end - start).total_seconds()
+        self.longest = max(self.longest, duration)
+        self.hours += duration / 3600
+
+    def is_available(self, start, end):
+        index = bisect_left(self.intervals, (end,))
+        while index > 0:
+            index -= 1
+            booked_start, booked_end = self.intervals[index]
+            if booked_end > start:
+                return False
+            if (start - booked_start).total_seconds() >= self.longest:
+                return True
+        return True
+
+
+class AutoAssign:
+    """Assignation automatique des supports aux événements à venir"""
+
+    @staticmethod
+    def plan(session, now=None):
+        """
+        Calcule les assignations sans les écrire.
+        Les événements sont traités par date de début ; chacun est confié
+        au support le moins chargé (tas min sur les heures réservées)
+        qui est libre sur le créneau.
+        Retourne (assignations [(event_id, support_id)], ids non assignés).
+        """
+        now = now or datetime.now()
+        pending = session.execute(
+            select(Event.id, Event.start_date, Event.end_date)
+            .where(Event.support_contact_id.is_(None),
+                   Event.start_date > now)
+            .order_by(Event.start_date, Event.id)
+        ).tuples().all()
+        if not pending:
+            return [], []
+
+        schedules = {
+            support_id: SupportSchedule(support_id)
+            for support_id in session.scalars(
+                select(User.id).where(User.role == "SUPPORT"))
+        }
+        booked = session.execute(
+            select(Event.support_contact_id, Event.start_date,
+                   Event.end_date)
+            .where(Event.support_contact_id.in_(schedules),
+                   Event.end_date > now)
+        ).tuples()
+        for support_id, start, end in booked:
+            schedules[support_id].book(start, end)
+
+        heap = [(s.hours, s.support_id) for s in schedules.values()]
+        heapq.heapify(heap)
+
+        assignments, unassigned = [], []
+        for event_id, start, end in pending:
+            busy = []
+            while heap:
+                hours, support_id = heapq.heappop(heap)
+                schedule = schedules[support_id]
+                if schedule.is_available(start, end):
+                    schedule.book(start, end)
+                    heapq.heappush(heap, (schedule.hours, support_id))
+                    assignments.append((event_id, support_id))
+                    break
+                busy.append((hours, support_id))
+            else:
+                unassigned.append(event_id)
+            for item in busy:
+                heapq.heappush(heap, item)
+        return assignments, unassigned
+
+    @staticmethod
+    def run(session, dry_run=False):
+        """
+        Calcule puis écrit toutes les assignations en une transaction.
+        Chaque UPDATE n'aboutit que si l'événement est toujours sans
+        support : si une autre session en a assigné un entre-temps,
+        rien n'est écrit.
+        """
+        try:
+            assignments, unassigned = AutoAssign.plan(session)
+            if assignments and not dry_run:
+                events = Event.__table__
+                result = session.execute(
+                    update(events)
+                    .where(events.c.id == bindparam("event_id"),
+                           events.c.support_contact_id.is_(None))
+                    .values(support_contact_id=bindparam("support_id"),
+                            version_id=events.c.version_id + 1),
+                    [{"event_id": event_id, "support_id": support_id}
+                     for event_id, support_id in assignments])
+                if result.rowcount != len(assignments):
+                    raise ConcurrentUpdateError(
+                        "Des événements ont été assignés entre-temps : "
+                        "relancez l'assignation")
+                AuditLog.write(session, [
+                    {"entity": "events", "entity_id": event_id,
+                     "operation": "update",
+                     "changes": {"support_contact_id": [None, support_id]}}
+                    for event_id, support_id in assignments
+                ])
+                session.commit()
+            return assignments, unassigned
+        except Exception as e:
+            session.rollback()
+            raise Exception(
+                f"Erreur lors de l'assignation automatique: {str(e)}")
@@ -0,0 +1,148 @@
+import re
+from sqlalchemy import event, inspect, text
+from src.models.base import Base
+
+# Tables FTS5 à contenu externe : l'index ne duplique pas les données,
+# il est tenu à jour par des triggers sur les tables sources.
+SEARCH_INDEXES = {
+    "clients_fts": (
+        "clients", ["first_name", "last_name", "email", "company_name"]),
+    "events_fts": ("events", ["name", "location", "notes"]),
+}
+
+TOKENIZER = "unicode61 remove_diacritics 2"
+
+
+def _triggers(index, table, columns):
+    """Triggers d'insertion, suppression et modification d'un index"""
+    names = ", ".join(columns)
+    new = ", ".join(f"NEW.{column}" for column in columns)
+    old = ", ".join(f"OLD.{column}" for column in columns)
+    insert = (f"INSERT INTO {index} (rowid, {names}) "
+              f"VALUES (NEW.id, {new});")
+    delete = (f"INSERT INTO {index} ({index}, rowid, {names}) "
+              f"VALUES ('delete', OLD.id, {old});")
+    return {
+        f"trg_{index}_insert": (f"AFTER INSERT ON {table}", insert),
+        f"trg_{index}_delete": (f"AFTER DELETE ON {table}", delete),
+        f"trg_{index}_update": (
+            f"AFTER UPDATE OF {names} ON {table}", delete + insert),
+    }
+
+
+SEARCH_TRIGGERS = {
+    name: trigger
+    for index, (table, columns) in SEARCH_INDEXES.items()
+    for name, trigger in _triggers(index, table, columns).items()
+}
+
+
+def fts5_available(connection):
+    options = connection.exec_driver_sql("PRAGMA compile_options").scalars()
+    return "ENABLE_FTS5" in set(options)
+
+
+@event.listens_for(Base.metadata, "after_create")
+def create_search_indexes(target, connection, **kwargs):
+    """Crée les index plein texte dès que les tables sources existent"""
+    if connection.dialect.name != "sqlite" or not fts5_available(connection):
+        return
+    if not {"clients", "events"} <= set(inspect(connection).get_table_names()):
+        return
+    for index, (table, columns) in SEARCH_INDEXES.items():
+        connection.exec_driver_sql(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {index} USING fts5("
+            f"{', '.join(columns)}, content='{table}', content_rowid='id', "
+            f"tokenize='{TOKENIZER}')")
+    install_search_triggers(connection)
+
+
+def install_search_triggers(connection):
+    """Crée les triggers de synchronisation s'ils n'existent pas"""
+    for name, (timing, body) in SEARCH_TRIGGERS.items():
+        connection.exec_driver_sql(
+            f"CREATE TRIGGER IF NOT EXISTS {name} {timing} "
+            f"BEGIN {body} END")
+
+
+def drop_search_triggers(connection):
+    """Supprime les triggers (avant un chargement en masse)"""
+    for name in SEARCH_TRIGGERS:
+        connection.exec_driver_sql(f"DROP TRIGGER IF EXISTS {name}")
+
+
+def has_search_indexes(connection):
+    return inspect(connection).has_table("clients_fts")
+
+
+SEARCH_QUERY = """
+SELECT * FROM (
+    SELECT 'Client' AS type, clients.id AS id,
+           clients.company_name AS title,
+           clients.first_name || ' ' || clients.last_name
+               || ' - ' || clients.email AS detail,
+           hits.rank AS rank
+    FROM (SELECT rowid, rank FROM clients_fts
+          WHERE clients_fts MATCH :terms
+          ORDER BY rank LIMIT :limit) AS hits
+    JOIN clients ON clients.id = hits.rowid
+)
+UNION ALL
+SELECT * FROM (
+    SELECT 'Événement' AS type, events.id AS id,
+           events.name AS title,
+           events.location
+               || ' - ' || strftime('%Y-%m-%d %H:%M', events.start_date)
+               || COALESCE(' - ' || NULLIF(events.notes, ''), '') AS detail,
+           hits.rank AS rank
+    FROM (SELECT rowid, rank FROM events_fts
+          WHERE events_fts MATCH :terms
+          ORDER BY rank LIMIT :limit) AS hits
+    JOIN events ON events.id = hits.rowid
+)
+ORDER BY rank LIMIT :limit
+"""
+
+
+class Search:
+    """Recherche plein texte sur les clients et les événements"""
+
+    headers = ["Type", "ID", "Titre", "Détail", "Score"]
+
+    @staticmethod
+    def match_expression(terms):
+        """
+        Transforme la saisie en expression FTS5 : chaque mot devient
+        un préfixe entre guillemets, tous les mots sont requis.
+        """
+        words = re.findall(r"\w+", " ".join(terms))
+        if not words:
+            raise Exception("Aucun terme de recherche valide")
+        return " ".join(f'"{word}"*' for word in words)
+
+    @staticmethod
+    def find(session, terms, limit=20):
+        """
+        Retourne les résultats classés par pertinence (bm25).
+        Le tri et la limite sont appliqués dans chaque index avant la
+        jointure : seules les meilleures lignes sont lues.
+        """
+        try:
+            return session.execute(text(SEARCH_QUERY), {
+                "terms": Search.match_expression(terms), "limit": limit,
+            }).tuples().all()
+        except Exception as e:
+            raise Exception(f"Erreur lors de la recherche: {str(e)}")
+
+    @staticmethod
+    def rebuild(session):
+        """Reconstruit les index plein texte depuis les tables sources"""
+        try:
+            for index in SEARCH_INDEXES:
+                session.execute(text(
+                    f"INSERT INTO {index} ({index}) VALUES ('rebuild')"))
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            raise Exception(
+                f"Erreur lors de la reconstruction de l'index: {str(e)}")
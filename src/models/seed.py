@@ -0,0 +1,234 @@
+import random
+from datetime import datetime, timedelta
+from sqlalchemy import select, func, inspect
+from src.models.user import User
+from src.models.client import Client
+from src.models.contract import Contract
+from src.models.event import Event
+from src.models.summary import (
+    REBUILD_STATEMENTS, drop_summary_triggers, install_summary_triggers)
+from src.models.search import (
+    SEARCH_INDEXES, drop_search_triggers, install_search_triggers,
+    has_search_indexes)
+from src.models.validators import (
+    UserValidator, ClientValidator, ContractValidator, EventValidator)
+
+FIRST_NAMES = ["Alice", "Bruno", "Chloé", "David", "Emma", "Farid", "Gaëlle",
+               "Hugo", "Inès", "Julien", "Karim", "Léa", "Marc", "Nina"]
+LAST_NAMES = ["Martin", "Bernard", "Dubois", "Thomas", "Robert", "Richard",
+              "Petit", "Durand", "Leroy", "Moreau", "Simon", "Laurent"]
+COMPANIES = ["Événements", "Conseil", "Industries", "Solutions", "Voyages",
+             "Studio", "Consulting", "Groupe", "Services"]
+LOCATIONS = ["Paris", "Lyon", "Marseille", "Bordeaux", "Lille", "Nantes",
+             "Toulouse", "Strasbourg", "Nice", "Rennes"]
+EVENT_NAMES = ["Séminaire", "Gala", "Conférence", "Salon", "Mariage",
+               "Lancement produit", "Team building", "Soirée"]
+
+
+class Seeder:
+    """
+    Générateur de données synthétiques déterministe.
+    Une même graine produit toujours les mêmes lignes (les dates des
+    événements sont relatives au jour de génération).
+    Les lignes sont validées par colonnes puis insérées par lots via
+    des INSERT multi-lignes, sans passer par les objets ORM.
+        args: seed (int),
+              batch_size (int),
+              password (str) : mot de passe commun des utilisateurs générés
+    """
+
+    BATCH_SIZE = 10_000
+
+    def __init__(self, seed=42, batch_size=BATCH_SIZE, password="password"):
+        self.rng = random.Random(seed)
+        self.batch_size = batch_size
+        self.password = password
+
+    def run(self, session, users=0, clients=0, contracts=0, events=0):
+        """
+        Génère les lignes demandées dans une seule transaction.
+        Les triggers de synthèse et de recherche sont suspendus pendant
+        le chargement, puis les synthèses et les index plein texte sont
+        recalculés en une passe.
+        Retourne le nombre de lignes insérées par table.
+        """
+        try:
+            connection = session.connection()
+            summaries = (connection.dialect.name == "sqlite" and
+                         inspect(connection).has_table("client_summaries"))
+            search = summaries and has_search_indexes(connection)
+            if summaries:
+                drop_summary_triggers(connection)
+            if search:
+                drop_search_triggers(connection)
+
+            counts = {
+                "users": self.seed_users(session, users),
+                "clients": self.seed_clients(session, clients),
+                "contracts": self.seed_contracts(session, contracts),
+                "events": self.seed_events(session, events),
+            }
+
+            if summaries:
+                install_summary_triggers(connection)
+                for statement in REBUILD_STATEMENTS:
+                    connection.exec_driver_sql(statement)
+            if search:
+                install_search_triggers(connection)
+                for index in SEARCH_INDEXES:
+                    connection.exec_driver_sql(
+                        f"INSERT INTO {index} ({index}) VALUES ('rebuild')")
+            session.commit()
+            return counts
+        except Exception as e:
+            session.rollback()
+            raise Exception(
+                f"Erreur lors de la génération des données: {str(e)}")
+
+    def _next_id(self, session, model):
+        return (session.scalar(select(func.max(model.id))) or 0) + 1
+
+    def _insert(self, session, model, rows):
+        if rows:
+            session.execute(model.__table__.insert(), rows)
+
+    def _batches(self, session, model, count):
+        """Découpe `count` identifiants à partir du prochain id libre"""
+        start = self._next_id(session, model)
+        for offset in range(start, start + count, self.batch_size):
+            yield range(offset, min(offset + self.batch_size, start + count))
+
+    def seed_users(self, session, count):
+        """
+        Les trois premiers utilisateurs générés sont GESTION, COMMERCIAL
+        et SUPPORT, les suivants sont répartis aléatoirement.
+        """
+        password = User.hash_password(self.password)
+        roles_cycle = ["GESTION", "COMMERCIAL", "SUPPORT"]
+        generated = 0
+        for ids in self._batches(session, User, count):
+            roles = []
+            for _ in ids:
+                roles.append(roles_cycle[generated] if generated < 3 else
+                             self.rng.choices(roles_cycle, [1, 4, 4])[0])
+                generated += 1
+            UserValidator.validate_roles_batch(roles)
+            self._insert(session, User, [
+                {"id": i, "username": f"{role.lower()}_{i}",
+                 "email": f"{role.lower()}_{i}@seed.epic",
+                 "password": password, "role": role}
+                for i, role in zip(ids, roles)
+            ])
+        return count
+
+    def _user_ids(self, session, role):
+        ids = session.scalars(
+            select(User.id).where(User.role == role).order_by(User.id)).all()
+        if not ids:
+            raise Exception(f"Aucun utilisateur {role} pour rattacher "
+                            "les données générées")
+        return ids
+
+    def seed_clients(self, session, count):
+        """
+        Chaque client est rattaché à un commercial existant.
+        Email et téléphone sont dérivés de l'identifiant (uniques).
+        """
+        if not count:
+            return 0
+        commercials = self._user_ids(session, "COMMERCIAL")
+        rng = self.rng
+        for ids in self._batches(session, Client, count):
+            emails = [f"client_{i}@seed.epic" for i in ids]
+            ClientValidator.validate_emails_batch(emails)
+            self._insert(session, Client, [
+                {"id": i, "first_name": rng.choice(FIRST_NAMES),
+                 "last_name": rng.choice(LAST_NAMES), "email": email,
+                 "email_normalized": email,
+                 "phone": f"06 {i:08d}", "phone_normalized": f"+336{i:08d}",
+                 "company_name": f"{rng.choice(LAST_NAMES)} "
+                                 f"{rng.choice(COMPANIES)}",
+                 "commercial_id": rng.choice(commercials)}
+                for i, email in zip(ids, emails)
+            ])
+        return count
+
+    def seed_contracts(self, session, count):
+        """
+        Chaque contrat reprend le commercial de son client.
+        Environ 70 % des contrats sont signés.
+        """
+        if not count:
+            return 0
+        clients = session.execute(
+            select(Client.id, Client.commercial_id).order_by(Client.id)
+        ).tuples().all()
+        if not clients:
+            raise Exception("Aucun client pour rattacher les contrats")
+        rng = self.rng
+        for ids in self._batches(session, Contract, count):
+            owners = [rng.choice(clients) for _ in ids]
+            totals = [float(rng.randrange(500, 50_000, 50)) for _ in ids]
+            remainings = [rng.choice((0.0, total / 2, total))
+                          for total in totals]
+            ContractValidator.validate_amounts_batch(totals, remainings)
+            self._insert(session, Contract, [
+                {"id": i, "client_id": client_id,
+                 "commercial_id": commercial_id,
+                 "total_amount": total, "remaining_amount": remaining,
+                 "is_signed": rng.random() < 0.7}
+                for i, (client_id, commercial_id), total, remaining
+                in zip(ids, owners, totals, remainings)
+            ])
+        return count
+
+    def seed_events(self, session, count):
+        """
+        Les événements ne portent que sur des contrats signés et sont
+        confiés à un support. Chaque support reçoit des créneaux qui se
+        suivent sans se chevaucher (pas de double réservation), répartis
+        sur l'année qui suit la génération ; au-delà d'une année de
+        créneaux par support, le planning se prolonge d'autant.
+        """
+        if not count:
+            return 0
+        supports = self._user_ids(session, "SUPPORT")
+        contracts = session.execute(
+            select(Contract.id, Contract.client_id)
+            .where(Contract.is_signed.is_(True)).order_by(Contract.id)
+        ).tuples().all()
+        if not contracts:
+            raise Exception("Aucun contrat signé pour rattacher "
+                            "les événements")
+        rng = self.rng
+        origin = datetime.now().replace(
+            hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)
+        # Intervalle moyen entre deux événements d'un même support
+        # (durée moyenne : 4,5 h) pour couvrir une année
+        max_gap = max(0, int(2 * (24 * 365 * len(supports) / count - 4.5)))
+        next_free = dict.fromkeys(supports, origin)
+        for ids in self._batches(session, Event, count):
+            owners = [rng.choice(contracts) for _ in ids]
+            assigned = [rng.choice(supports) for _ in ids]
+            starts, ends = [], []
+            for support in assigned:
+                start = next_free[support] + timedelta(
+                    hours=rng.randint(0, max_gap))
+                end = start + timedelta(hours=rng.randint(1, 8))
+                next_free[support] = end
+                starts.append(start)
+                ends.append(end)
+            attendees = [rng.randint(5, 500) for _ in ids]
+            EventValidator.validate_dates_batch(starts, ends)
+            EventValidator.validate_attendees_batch(attendees)
+            self._insert(session, Event, [
+                {"id": i, "contract_id": contract_id, "client_id": client_id,
+                 "support_contact_id": support,
+                 "name": rng.choice(EVENT_NAMES),
+                 "start_date": start, "end_date": end,
+                 "location": rng.choice(LOCATIONS),
+                 "attendees": size, "notes": ""}
+                for i, (contract_id, client_id), support, start, end, size
+                in zip(ids, owners, assigned, starts, ends, attendees)
+            ])
+        return count
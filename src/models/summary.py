@@ -0,0 +1,244 @@
+from sqlalchemy import Column, Integer, Float, event, inspect, text
+from src.models.base import Base, BaseModel
+
+
+class ClientSummary(BaseModel):
+    """
+    Totaux par client, tenus à jour par des triggers SQLite
+        args: client_id (int),
+              contract_count (int),
+              signed_count (int),
+              total_amount (float),
+              remaining_amount (float),
+              event_count (int)
+    """
+    __tablename__ = "client_summaries"
+
+    client_id = Column(Integer, primary_key=True, autoincrement=False)
+    contract_count = Column(Integer, nullable=False, server_default="0")
+    signed_count = Column(Integer, nullable=False, server_default="0")
+    total_amount = Column(Float, nullable=False, server_default="0")
+    remaining_amount = Column(Float, nullable=False, server_default="0")
+    event_count = Column(Integer, nullable=False, server_default="0")
+
+    __table_args__ = {'extend_existing': True}
+
+
+class CommercialSummary(BaseModel):
+    """
+    Totaux par commercial, tenus à jour par des triggers SQLite
+        args: commercial_id (int),
+              client_count (int),
+              contract_count (int),
+              signed_count (int),
+              total_amount (float),
+              remaining_amount (float),
+              event_count (int)
+    """
+    __tablename__ = "commercial_summaries"
+
+    commercial_id = Column(Integer, primary_key=True, autoincrement=False)
+    client_count = Column(Integer, nullable=False, server_default="0")
+    contract_count = Column(Integer, nullable=False, server_default="0")
+    signed_count = Column(Integer, nullable=False, server_default="0")
+    total_amount = Column(Float, nullable=False, server_default="0")
+    remaining_amount = Column(Float, nullable=False, server_default="0")
+    event_count = Column(Integer, nullable=False, server_default="0")
+
+    __table_args__ = {'extend_existing': True}
+
+
+# Les triggers utilisent ON CONFLICT DO NOTHING plutôt que INSERT OR IGNORE :
+# dans un trigger déclenché par un upsert (INSERT ... ON CONFLICT DO UPDATE),
+# SQLite remplace OR IGNORE par la politique ABORT de l'instruction.
+
+
+def _contract_delta(row, sign):
+    """Met à jour les totaux pour la ligne de contrat OLD ou NEW"""
+    return f"""
+    INSERT INTO client_summaries (client_id)
+        VALUES ({row}.client_id) ON CONFLICT DO NOTHING;
+    INSERT INTO commercial_summaries (commercial_id)
+        VALUES ({row}.commercial_id) ON CONFLICT DO NOTHING;
+    UPDATE client_summaries SET
+        contract_count = contract_count {sign} 1,
+        signed_count = signed_count {sign} ({row}.is_signed IS 1),
+        total_amount = total_amount {sign} {row}.total_amount,
+        remaining_amount = remaining_amount {sign} {row}.remaining_amount
+        WHERE client_id = {row}.client_id;
+    UPDATE commercial_summaries SET
+        contract_count = contract_count {sign} 1,
+        signed_count = signed_count {sign} ({row}.is_signed IS 1),
+        total_amount = total_amount {sign} {row}.total_amount,
+        remaining_amount = remaining_amount {sign} {row}.remaining_amount
+        WHERE commercial_id = {row}.commercial_id;"""
+
+
+def _event_delta(row, sign):
+    """Met à jour le nombre d'événements pour la ligne OLD ou NEW"""
+    return f"""
+    INSERT INTO client_summaries (client_id)
+        VALUES ({row}.client_id) ON CONFLICT DO NOTHING;
+    INSERT INTO commercial_summaries (commercial_id)
+        SELECT commercial_id FROM contracts WHERE id = {row}.contract_id
+        ON CONFLICT DO NOTHING;
+    UPDATE client_summaries SET event_count = event_count {sign} 1
+        WHERE client_id = {row}.client_id;
+    UPDATE commercial_summaries SET event_count = event_count {sign} 1
+        WHERE commercial_id = (
+            SELECT commercial_id FROM contracts
+            WHERE id = {row}.contract_id);"""
+
+
+def _client_delta(row, sign):
+    """Met à jour le nombre de clients pour la ligne OLD ou NEW"""
+    return f"""
+    INSERT INTO commercial_summaries (commercial_id)
+        VALUES ({row}.commercial_id) ON CONFLICT DO NOTHING;
+    UPDATE commercial_summaries SET client_count = client_count {sign} 1
+        WHERE commercial_id = {row}.commercial_id;"""
+
+
+def _contract_events_delta(row, sign):
+    """Déplace les événements d'un contrat dont le commercial change"""
+    return f"""
+    UPDATE commercial_summaries SET event_count = event_count {sign} (
+            SELECT COUNT(*) FROM events WHERE contract_id = {row}.id)
+        WHERE commercial_id = {row}.commercial_id;"""
+
+
+SUMMARY_TRIGGERS = {
+    "trg_contracts_summary_insert": (
+        "AFTER INSERT ON contracts", _contract_delta("NEW", "+")),
+    "trg_contracts_summary_delete": (
+        "AFTER DELETE ON contracts", _contract_delta("OLD", "-")),
+    "trg_contracts_summary_update": (
+        "AFTER UPDATE OF client_id, commercial_id, total_amount, "
+        "remaining_amount, is_signed ON contracts",
+        _contract_delta("OLD", "-") + _contract_events_delta("OLD", "-")
+        + _contract_delta("NEW", "+") + _contract_events_delta("NEW", "+")),
+    "trg_events_summary_insert": (
+        "AFTER INSERT ON events", _event_delta("NEW", "+")),
+    "trg_events_summary_delete": (
+        "AFTER DELETE ON events", _event_delta("OLD", "-")),
+    "trg_events_summary_update": (
+        "AFTER UPDATE OF client_id, contract_id ON events",
+        _event_delta("OLD", "-") + _event_delta("NEW", "+")),
+    "trg_clients_summary_insert": (
+        "AFTER INSERT ON clients",
+        """
+    INSERT INTO client_summaries (client_id)
+        VALUES (NEW.id) ON CONFLICT DO NOTHING;"""
+        + _client_delta("NEW", "+")),
+    "trg_clients_summary_delete": (
+        "AFTER DELETE ON clients",
+        """
+    DELETE FROM client_summaries WHERE client_id = OLD.id;"""
+        + _client_delta("OLD", "-")),
+    "trg_clients_summary_update": (
+        "AFTER UPDATE OF commercial_id ON clients",
+        _client_delta("OLD", "-") + _client_delta("NEW", "+")),
+}
+
+REBUILD_STATEMENTS = [
+    "DELETE FROM client_summaries",
+    "DELETE FROM commercial_summaries",
+    """
+    INSERT INTO client_summaries (
+        client_id, contract_count, signed_count,
+        total_amount, remaining_amount, event_count)
+    SELECT ids.id,
+           COALESCE(k.contract_count, 0), COALESCE(k.signed_count, 0),
+           COALESCE(k.total_amount, 0), COALESCE(k.remaining_amount, 0),
+           COALESCE(e.event_count, 0)
+    FROM (SELECT id FROM clients
+          UNION SELECT client_id FROM contracts
+          UNION SELECT client_id FROM events) AS ids
+    LEFT JOIN (SELECT client_id,
+                      COUNT(*) AS contract_count,
+                      SUM(is_signed IS 1) AS signed_count,
+                      SUM(total_amount) AS total_amount,
+                      SUM(remaining_amount) AS remaining_amount
+               FROM contracts GROUP BY client_id) AS k
+           ON k.client_id = ids.id
+    LEFT JOIN (SELECT client_id, COUNT(*) AS event_count
+               FROM events GROUP BY client_id) AS e
+           ON e.client_id = ids.id
+    """,
+    """
+    INSERT INTO commercial_summaries (
+        commercial_id, client_count, contract_count, signed_count,
+        total_amount, remaining_amount, event_count)
+    SELECT ids.id,
+           COALESCE(c.client_count, 0),
+           COALESCE(k.contract_count, 0), COALESCE(k.signed_count, 0),
+           COALESCE(k.total_amount, 0), COALESCE(k.remaining_amount, 0),
+           COALESCE(e.event_count, 0)
+    FROM (SELECT commercial_id AS id FROM clients
+          UNION SELECT commercial_id FROM contracts) AS ids
+    LEFT JOIN (SELECT commercial_id, COUNT(*) AS client_count
+               FROM clients GROUP BY commercial_id) AS c
+           ON c.commercial_id = ids.id
+    LEFT JOIN (SELECT commercial_id,
+                      COUNT(*) AS contract_count,
+                      SUM(is_signed IS 1) AS signed_count,
+                      SUM(total_amount) AS total_amount,
+                      SUM(remaining_amount) AS remaining_amount
+               FROM contracts GROUP BY commercial_id) AS k
+           ON k.commercial_id = ids.id
+    LEFT JOIN (SELECT contracts.commercial_id, COUNT(*) AS event_count
+               FROM events JOIN contracts ON contracts.id = events.contract_id
+               GROUP BY contracts.commercial_id) AS e
+           ON e.commercial_id = ids.id
+    """,
+]
+
+
+@event.listens_for(Base.metadata, "after_create")
+def create_summary_triggers(target, connection, **kwargs):
+    """Crée les triggers dès que toutes les tables concernées existent"""
+    if connection.dialect.name != "sqlite":
+        return
+    required = {
+        "clients", "contracts", "events",
+        "client_summaries", "commercial_summaries",
+    }
+    if not required <= set(inspect(connection).get_table_names()):
+        return
+    install_summary_triggers(connection)
+
+
+def install_summary_triggers(connection):
+    """Crée les triggers de synthèse s'ils n'existent pas"""
+    for name, (timing, body) in SUMMARY_TRIGGERS.items():
+        connection.exec_driver_sql(
+            f"CREATE TRIGGER IF NOT EXISTS {name} {timing} "
+            f"BEGIN {body}\n END")
+
+
+def drop_summary_triggers(connection):
+    """Supprime les triggers de synthèse (avant un chargement en masse)"""
+    for name in SUMMARY_TRIGGERS:
+        connection.exec_driver_sql(f"DROP TRIGGER IF EXISTS {name}")
+
+
+class Summary:
+    """Opérations sur les tables de synthèse"""
+
+    @staticmethod
+    def rebuild(session):
+        """
+        Recalcule entièrement les tables de synthèse et réinstalle
+        les triggers (une base existante reçoit leur version courante)
+        """
+        try:
+            connection = session.connection()
+            drop_summary_triggers(connection)
+            install_summary_triggers(connection)
+            for statement in REBUILD_STATEMENTS:
+                session.execute(text(statement))
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            raise Exception(
+                f"Erreur lors du recalcul des synthèses: {str(e)}")
@@ -0,0 +1,157 @@
+import csv
+import hashlib
+from itertools import islice
+from sqlalchemy import select
+from sqlalchemy.dialects.sqlite import insert
+from src.models.audit import AuditLog
+from src.models.base import utc_now
+from src.models.client import Client
+from src.models.user import User
+from src.models.validators import ClientValidator
+
+FIELDS = ["first_name", "last_name", "email", "phone", "company_name"]
+
+
+class ClientSync:
+    """
+    Synchronisation des clients depuis un extrait CSV complet.
+    Le fichier est lu en flux, par lots : pour chaque lot, une requête
+    lit les empreintes existantes, les lignes inchangées sont écartées
+    et les autres sont écrites par un seul
+    INSERT ... ON CONFLICT(email_normalized) DO UPDATE.
+    Colonnes attendues : first_name, last_name, email, phone,
+    company_name et, facultativement, commercial_id.
+    Le journal d'audit reçoit une entrée de synthèse par import.
+        args: batch_size (int),
+              commercial_id (int) : commercial des lignes qui n'en ont pas
+    """
+
+    BATCH_SIZE = 5_000
+    MAX_ERRORS = 20
+
+    def __init__(self, batch_size=BATCH_SIZE, commercial_id=None):
+        self.batch_size = batch_size
+        self.commercial_id = commercial_id
+        self.errors = []
+        self.counts = {
+            "inserted": 0, "updated": 0, "unchanged": 0, "rejected": 0}
+
+    @staticmethod
+    def content_hash(row):
+        """Empreinte des champs normalisés d'une ligne"""
+        content = "\x1f".join(str(row[field]) for field in (
+            "first_name", "last_name", "email_normalized",
+            "phone_normalized", "company_name", "commercial_id"))
+        return hashlib.sha1(content.encode("utf-8")).hexdigest()
+
+    def run(self, session, path):
+        """
+        Synchronise le fichier, un commit par lot.
+        Retourne les nombres de lignes insérées, mises à jour,
+        inchangées et rejetées.
+        """
+        try:
+            self.commercials = set(session.scalars(
+                select(User.id).where(User.role == "COMMERCIAL")))
+            with open(path, encoding="utf-8-sig", newline="") as file:
+                reader = csv.DictReader(file)
+                missing = set(FIELDS) - set(reader.fieldnames or [])
+                if missing:
+                    raise Exception(
+                        f"Colonnes manquantes : {', '.join(sorted(missing))}")
+                lines = enumerate(reader, start=2)
+                while batch := list(islice(lines, self.batch_size)):
+                    self.sync_batch(session, batch)
+                    session.commit()
+            AuditLog.write(session, [{
+                "entity": "clients", "entity_id": None, "operation": "sync",
+                "changes": {"file": str(path), **self.counts}}])
+            session.commit()
+            return self.counts
+        except Exception as e:
+            session.rollback()
+            raise Exception(
+                f"Erreur lors de la synchronisation des clients: {str(e)}")
+
+    def reject(self, line, reason):
+        self.counts["rejected"] += 1
+        if len(self.errors) < self.MAX_ERRORS:
+            self.errors.append(f"ligne {line} : {reason}")
+
+    def prepare(self, line, record):
+        """Valide et normalise une ligne du fichier (None si rejetée)"""
+        try:
+            values = {field: (record.get(field) or "").strip()
+                      for field in FIELDS}
+            for field, value in values.items():
+                if not value:
+                    raise Exception(f"Le champ {field} est requis")
+            ClientValidator.validate_email(values["email"])
+            commercial_id = (record.get("commercial_id") or "").strip()
+            commercial_id = (int(commercial_id) if commercial_id
+                             else self.commercial_id)
+            if commercial_id not in self.commercials:
+                raise Exception("Contact commercial invalide")
+            values["commercial_id"] = commercial_id
+            values["email_normalized"] = ClientValidator.normalize_email(
+                values["email"])
+            values["phone_normalized"] = ClientValidator.normalize_phone(
+                values["phone"])
+        except ValueError:
+            self.reject(line, "Contact commercial invalide")
+            return None
+        except Exception as e:
+            self.reject(line, str(e))
+            return None
+        values["content_hash"] = self.content_hash(values)
+        return values
+
+    def sync_batch(self, session, batch):
+        rows = {}
+        for line, record in batch:
+            row = self.prepare(line, record)
+            if row:
+                # Un email présent deux fois : la dernière ligne l'emporte
+                rows[row["email_normalized"]] = (line, row)
+        if not rows:
+            return
+
+        existing = dict(session.execute(
+            select(Client.email_normalized, Client.content_hash)
+            .where(Client.email_normalized.in_(rows))).all())
+        phones = dict(session.execute(
+            select(Client.phone_normalized, Client.email_normalized)
+            .where(Client.phone_normalized.in_(
+                row["phone_normalized"] for _, row in rows.values())))
+            .all())
+
+        now = utc_now()
+        changes = []
+        for email, (line, row) in rows.items():
+            if existing.get(email) == row["content_hash"]:
+                self.counts["unchanged"] += 1
+                continue
+            owner = phones.setdefault(row["phone_normalized"], email)
+            if owner != email:
+                self.reject(line, "Un client avec ce téléphone existe déjà")
+                continue
+            self.counts["updated" if email in existing else "inserted"] += 1
+            changes.append({**row, "updated_at": now})
+        if changes:
+            session.execute(self.upsert_statement(), changes)
+
+    @staticmethod
+    def upsert_statement():
+        """
+        INSERT ... ON CONFLICT sur l'index unique de l'email normalisé.
+        La mise à jour n'est appliquée que si l'empreinte a changé.
+        """
+        statement = insert(Client.__table__)
+        excluded = statement.excluded
+        return statement.on_conflict_do_update(
+            index_elements=[Client.email_normalized],
+            set_={column: excluded[column] for column in FIELDS + [
+                "commercial_id", "phone_normalized", "content_hash",
+                "updated_at"]} | {"version_id": Client.version_id + 1},
+            where=Client.content_hash.is_distinct_from(excluded.content_hash),
+        )
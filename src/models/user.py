@@ -1,6 +1,5 @@
-from datetime import datetime, timezone
-from sqlalchemy import Column, Integer, String, DateTime
-from src.models.base import BaseModel
+from sqlalchemy import Column, Integer, String, DateTime, Index
+from src.models.base import BaseModel, ConcurrentUpdateError, utc_now
 from src.models.validators import UserValidator
 import hashlib
 import os
@@ -33,10 +32,16 @@ class User(BaseModel):
     username = Column(String, nullable=False, unique=True)
     email = Column(String, nullable=False, unique=True)
     password = Column(String, nullable=False)
-    created_at = Column(DateTime, default=datetime.now(timezone.utc))
+    created_at = Column(DateTime, default=utc_now)
+    updated_at = Column(DateTime, default=utc_now, onupdate=utc_now)
     role = Column(String, nullable=False)
+    version_id = Column(Integer, nullable=False, server_default="1")
 
-    __table_args__ = {'extend_existing': True}
+    __table_args__ = (
+        Index("ix_users_updated_at", "updated_at"),
+        {'extend_existing': True},
+    )
+    __mapper_args__ = {"version_id_col": version_id}
 
     def __repr__(self):
         return f'User {self.username}'
@@ -128,6 +133,8 @@ class User(BaseModel):
             logger.info(success_message)
             capture_message(success_message)
             return cls._save_object(session, user)
+        except ConcurrentUpdateError:
+            raise
         except Exception as e:
             session.rollback()
             logger.error("Erreur lors de la mise à jour de l'utilisateur "
@@ -1,4 +1,5 @@
 from datetime import datetime
+from functools import lru_cache
 
 
 class UserValidator:
@@ -11,6 +12,13 @@ class UserValidator:
                 f"{', '.join(valid_roles)}"
             )
 
+    @staticmethod
+    def validate_roles_batch(roles):
+        """Valide une colonne de rôles en une seule passe"""
+        invalid = set(roles) - {"COMMERCIAL", "SUPPORT", "GESTION"}
+        if invalid:
+            UserValidator.validate_role(invalid.pop())
+
     @staticmethod
     def validate_required_fields(**kwargs):
         required_fields = ["username", "email", "role", "password"]
@@ -46,6 +54,25 @@ class ContractValidator:
                 "supérieur au montant total"
             )
 
+    @staticmethod
+    def validate_payment(amount):
+        if amount is None or amount <= 0:
+            raise Exception("Le montant du paiement doit être positif")
+
+    @staticmethod
+    def validate_amounts_batch(total_amounts, remaining_amounts):
+        """
+        Valide des colonnes de montants en une seule passe.
+        Lève l'erreur de validate_amounts pour la première ligne invalide.
+        """
+        for index, (total, remaining) in enumerate(
+                zip(total_amounts, remaining_amounts)):
+            if total < 0 or remaining < 0 or remaining > total:
+                try:
+                    ContractValidator.validate_amounts(total, remaining)
+                except Exception as e:
+                    raise Exception(f"Ligne {index}: {str(e)}")
+
 
 class EventValidator:
     @staticmethod
@@ -82,6 +109,24 @@ class EventValidator:
         if attendees <= 0:
             raise Exception("Le nombre de participants doit être positif")
 
+    @staticmethod
+    def validate_dates_batch(start_dates, end_dates):
+        """Valide des colonnes de dates (datetime) en une seule passe"""
+        now = datetime.now()
+        for index, (start, end) in enumerate(zip(start_dates, end_dates)):
+            if start > end:
+                raise Exception(f"Ligne {index}: La date de fin doit être "
+                                "supérieure à la date de début")
+            if start < now:
+                raise Exception(f"Ligne {index}: La date de début "
+                                "doit être dans le futur")
+
+    @staticmethod
+    def validate_attendees_batch(attendees):
+        """Valide une colonne de nombres de participants"""
+        if attendees and min(attendees) <= 0:
+            EventValidator.validate_attendees(min(attendees))
+
 
 class ClientValidator:
     @staticmethod
@@ -103,6 +148,40 @@ class ClientValidator:
         if "@" not in email:
             raise Exception("L'email doit être valide")
 
+    @staticmethod
+    def normalize_email(email):
+        """Email comparable : sans espaces superflus et en minuscules"""
+        return email.strip().lower()
+
+    @staticmethod
+    def normalize_phone(phone, default_prefix="+33"):
+        """
+        Numéro au format E.164 (+33612345678).
+        Les numéros nationaux (0X XX XX XX XX) prennent l'indicatif
+        par défaut, le préfixe international 00 est remplacé par +.
+        """
+        digits = "".join(char for char in phone if char.isdigit())
+        if phone.strip().startswith("+"):
+            number = f"+{digits}"
+        elif digits.startswith("00"):
+            number = f"+{digits[2:]}"
+        elif digits.startswith("0") and len(digits) == 10:
+            number = f"{default_prefix}{digits[1:]}"
+        else:
+            number = f"+{digits}"
+        if not 8 <= len(number) - 1 <= 15 or number[1] == "0":
+            raise Exception("Le numéro de téléphone doit être valide")
+        return number
+
+    @staticmethod
+    def validate_emails_batch(emails):
+        """Valide une colonne d'emails : format et unicité dans le lot"""
+        for email in emails:
+            if "@" not in email:
+                ClientValidator.validate_email(email)
+        if len(set(emails)) != len(emails):
+            raise Exception("Le lot contient des emails en double")
+
 
 class DateTimeUtils:
     """Utilitaire pour la gestion des dates et heures"""
@@ -111,6 +190,16 @@ class DateTimeUtils:
     DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
     DATETIME_CLI_FORMAT = "%Y-%m-%d_%H:%M:%S"
 
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def format_datetime(dt: datetime) -> str:
+        """
+        Convertit un datetime en chaîne d'affichage.
+        Le résultat est mis en cache : une même date n'est formatée
+        qu'une fois.
+        """
+        return dt.strftime(DateTimeUtils.DATETIME_FORMAT)
+
     @staticmethod
     def parse_date(date_str: str) -> datetime:
         """
@@ -119,7 +208,10 @@ class DateTimeUtils:
         - YYYY-MM-DD
         - YYYY-MM-DD HH:MM:SS
         - YYYY-MM-DD_HH:MM:SS (format CLI)
+        Un datetime est retourné tel quel.
         """
+        if isinstance(date_str, datetime):
+            return date_str
         formats_to_try = [
             DateTimeUtils.DATETIME_FORMAT,
             DateTimeUtils.DATE_FORMAT,
@@ -0,0 +1,34 @@
+import json
+import socket
+from src.models.authentication import Token
+from src.server.daemon import DEFAULT_SOCKET_PATH
+
+
+class DaemonClient:
+    """
+    Client léger du serveur Epic Events.
+    La connexion est conservée entre les appels.
+    """
+
+    def __init__(self, socket_path=DEFAULT_SOCKET_PATH, host=None, port=None):
+        if port:
+            self.sock = socket.create_connection((host or "127.0.0.1", port))
+        else:
+            self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.sock.connect(socket_path)
+        self.stream = self.sock.makefile("rwb")
+        self.token = Token.get_stored_token()
+
+    def call(self, action, **params):
+        """Envoie une requête et retourne la réponse décodée"""
+        request = {"action": action, "token": self.token, "params": params}
+        self.stream.write(json.dumps(request).encode() + b"\n")
+        self.stream.flush()
+        response = json.loads(self.stream.readline())
+        if action == "auth.login" and response.get("ok"):
+            self.token = response["data"]["token"]
+        return response
+
+    def close(self):
+        self.stream.close()
+        self.sock.close()
@@ -0,0 +1,283 @@
+import asyncio
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+import jwt
+from sqlalchemy import text
+from src.models.common import Session
+from src.models.authentication import Token, SECRET_KEY
+from src.models.user import User
+from src.models.client import Client
+from src.models.contract import Contract
+from src.models.event import Event
+from src.models.permission import PermissionManager
+from src.config.sentry_base import logger
+
+DEFAULT_SOCKET_PATH = os.getenv(
+    "EPIC_SOCKET_PATH", str(Path.home() / ".epic_daemon.sock"))
+
+# Permissions requises par action, identiques à celles des commandes CLI
+ACTION_PERMISSIONS = {
+    "client.create": ("create_clients",),
+    "client.report": ("view_reports",),
+    "client.update": ("update_own_clients",),
+    "client.delete": ("update_own_clients",),
+    "contract.create": ("manage_all_contracts",),
+    "contract.report": ("view_reports",),
+    "contract.sign": ("manage_all_contracts", "update_own_contracts"),
+    "contract.payment": ("update_own_contracts", "manage_all_contracts"),
+    "contract.delete": ("manage_all_contracts",),
+    "event.create": ("create_event",),
+    "event.report": ("view_reports",),
+    "event.update": ("update_own_events",),
+    "event.delete": ("update_own_events",),
+    "user.create": ("manage_users",),
+    "user.report": ("view_reports",),
+    "user.update": ("manage_users",),
+    "user.delete": ("manage_users",),
+}
+
+HIDDEN_COLUMNS = ("password",)
+
+
+def serialize(obj):
+    """Convertit un objet du modèle en dictionnaire sérialisable en JSON"""
+    data = {}
+    for column in obj.__table__.columns:
+        if column.name in HIDDEN_COLUMNS:
+            continue
+        value = getattr(obj, column.name)
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        data[column.name] = value
+    return data
+
+
+class EpicDaemon:
+    """
+    Serveur asyncio exposant les opérations du modèle en JSON.
+    Chaque requête est une ligne JSON :
+        {"action": "client.report", "token": "...", "params": {...}}
+    Chaque réponse est une ligne JSON :
+        {"ok": true, "data": ...} ou {"ok": false, "error": "..."}
+    """
+
+    def __init__(self, session_factory=Session):
+        self.session_factory = session_factory
+        self.sessions = {}
+        self.server = None
+
+    def warm_up(self):
+        """Ouvre le pool de connexions et charge le cache des permissions"""
+        session = self.session_factory()
+        try:
+            session.execute(text("SELECT 1"))
+            PermissionManager.enable_cache(session)
+        finally:
+            session.close()
+
+    async def start_unix(self, path=DEFAULT_SOCKET_PATH):
+        """Démarre le serveur sur un socket Unix"""
+        if os.path.exists(path):
+            os.unlink(path)
+        self.warm_up()
+        self.server = await asyncio.start_unix_server(
+            self.handle_connection, path=path)
+        os.chmod(path, 0o600)
+        logger.info(f"Serveur Epic Events démarré sur {path}")
+        return self.server
+
+    async def start_tcp(self, host="127.0.0.1", port=8765):
+        """Démarre le serveur sur un port local"""
+        self.warm_up()
+        self.server = await asyncio.start_server(
+            self.handle_connection, host=host, port=port)
+        logger.info(f"Serveur Epic Events démarré sur {host}:{port}")
+        return self.server
+
+    async def handle_connection(self, reader, writer):
+        """Traite les requêtes d'une connexion jusqu'à sa fermeture"""
+        try:
+            while line := await reader.readline():
+                try:
+                    request = json.loads(line)
+                    response = await asyncio.to_thread(self.handle, request)
+                except json.JSONDecodeError:
+                    response = {"ok": False, "error": "Requête JSON invalide"}
+                writer.write(
+                    json.dumps(response, default=str).encode() + b"\n")
+                await writer.drain()
+        finally:
+            writer.close()
+
+    def handle(self, request):
+        """Exécute une requête et retourne la réponse"""
+        action = request.get("action", "")
+        params = request.get("params") or {}
+        session = self.session_factory()
+        try:
+            if action == "auth.login":
+                return self.login(session, **params)
+            if action == "auth.logout":
+                self.sessions.pop(request.get("token"), None)
+                return {"ok": True, "data": "Déconnexion réussie"}
+            if action not in ACTION_PERMISSIONS:
+                return {"ok": False, "error": f"Action inconnue : {action}"}
+
+            user = self.authenticate(session, request.get("token"))
+            if not user:
+                return {"ok": False, "error": "Vous devez être connecté."}
+
+            allowed, error_message = self.check_permission(
+                session, user, action, params)
+            if not allowed:
+                return {"ok": False, "error": error_message}
+
+            entity, operation = action.split(".")
+            handler = getattr(self, f"{entity}_{operation}")
+            return {"ok": True, "data": handler(session, user, **params)}
+        except Exception as e:
+            session.rollback()
+            return {"ok": False, "error": str(e)}
+        finally:
+            session.close()
+
+    def login(self, session, username, password):
+        """Authentifie un utilisateur et ouvre une session serveur"""
+        user = User.get_object(session, username=username)
+        if not user or not User.verify_password(user.password, password):
+            return {
+                "ok": False, "error": "Identifiants ou mot de passe invalide"}
+        token = Token.create_token(user)
+        payload = jwt.decode(token, SECRET_KEY, algorithms=["HS256"])
+        self.sessions[token] = (user.id, payload["exp"])
+        return {"ok": True, "data": {"token": token}}
+
+    def authenticate(self, session, token):
+        """
+        Retourne l'utilisateur associé au token.
+        Les tokens émis par `auth login` sont aussi acceptés.
+        """
+        if not token:
+            return None
+        if token not in self.sessions:
+            try:
+                payload = jwt.decode(token, SECRET_KEY, algorithms=["HS256"])
+            except jwt.InvalidTokenError:
+                return None
+            user_id = int(payload["sub"].split("_")[0])
+            self.sessions[token] = (user_id, payload["exp"])
+
+        user_id, exp = self.sessions[token]
+        if exp < datetime.now(timezone.utc).timestamp():
+            del self.sessions[token]
+            return None
+        return User.get_object(session, id=user_id)
+
+    def check_permission(self, session, user, action, params):
+        """Vérifie qu'un utilisateur possède une des permissions de l'action"""
+        contract_id = params.get("contract_id")
+        client_id = params.get("client_id")
+        event_id = params.get("event_id")
+        context = {
+            "session": session,
+            "contract": Contract.get_object(
+                session, id=contract_id) if contract_id else None,
+            "client": Client.get_object(
+                session, id=client_id) if client_id else None,
+            "event": Event.get_object(
+                session, id=event_id) if event_id else None,
+            "contract_id": contract_id,
+            "client_id": client_id,
+        }
+        error_message = "Permission refusée"
+        for permission in ACTION_PERMISSIONS[action]:
+            allowed, error_message = PermissionManager.validate_permission(
+                session, user, permission, context=context,
+                return_error=True)
+            if allowed:
+                return True, None
+        return False, error_message
+
+    # Clients
+    def client_create(self, session, user, **params):
+        params["commercial_id"] = user.id
+        return serialize(Client.create_object(session, **params))
+
+    def client_report(self, session, user, **filters):
+        return [
+            serialize(client)
+            for client in Client.get_all_object(session, **filters)]
+
+    def client_update(self, session, user, client_id, **params):
+        return serialize(Client.update_object(session, client_id, **params))
+
+    def client_delete(self, session, user, client_id):
+        Client.delete_object(session, client_id)
+        return {"id": client_id}
+
+    # Contrats
+    def contract_create(self, session, user, **params):
+        return serialize(Contract.create_object(session, **params))
+
+    def contract_report(self, session, user, **filters):
+        return [
+            serialize(contract)
+            for contract in Contract.get_all_object(session, **filters)]
+
+    def contract_sign(self, session, user, contract_id):
+        return serialize(Contract.sign_object(session, contract_id))
+
+    def contract_payment(self, session, user, contract_id, **amounts):
+        return serialize(
+            Contract.update_amount(session, contract_id, **amounts))
+
+    def contract_delete(self, session, user, contract_id):
+        Contract.delete_object(session, contract_id)
+        return {"id": contract_id}
+
+    # Événements
+    def event_create(self, session, user, **params):
+        return serialize(Event.create_object(session, **params))
+
+    def event_report(self, session, user, **filters):
+        return [
+            serialize(event)
+            for event in Event.get_all_object(session, **filters)]
+
+    def event_update(self, session, user, event_id, **params):
+        return serialize(Event.update_object(session, event_id, **params))
+
+    def event_delete(self, session, user, event_id):
+        Event.delete_object(session, event_id)
+        return {"id": event_id}
+
+    # Utilisateurs
+    def user_create(self, session, user, **params):
+        return serialize(User.create_object(session, **params))
+
+    def user_report(self, session, user, **filters):
+        return [serialize(item)
+                for item in User.get_all_object(session, **filters)]
+
+    def user_update(self, session, user, user_id, **params):
+        return serialize(User.update_object(session, user_id, **params))
+
+    def user_delete(self, session, user, user_id):
+        User.delete_object(session, user_id)
+        return {"id": user_id}
+
+
+def run(socket_path=DEFAULT_SOCKET_PATH, host=None, port=None):
+    """Lance le serveur jusqu'à son interruption"""
+    async def main():
+        daemon = EpicDaemon()
+        if port:
+            server = await daemon.start_tcp(host or "127.0.0.1", port)
+        else:
+            server = await daemon.start_unix(socket_path)
+        async with server:
+            await server.serve_forever()
+
+    asyncio.run(main())
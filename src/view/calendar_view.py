@@ -0,0 +1,66 @@
+import sys
+from datetime import datetime, timezone
+
+
+class Calendar:
+    """
+    Export d'un agenda au format iCalendar (RFC 5545),
+    importable dans Google Agenda, Outlook ou Thunderbird.
+    """
+
+    PRODID = "-//Epic Events//Agenda//FR"
+    DATE_FORMAT = "%Y%m%dT%H%M%S"
+
+    @staticmethod
+    def escape(value) -> str:
+        """Échappe un texte selon la RFC 5545"""
+        return (str(value or "").replace("\\", "\\\\").replace(";", "\\;")
+                .replace(",", "\\,").replace("\n", "\\n"))
+
+    @staticmethod
+    def fold(line: str) -> list:
+        """Coupe une ligne en segments de 75 octets au plus"""
+        segments, current = [], ""
+        for char in line:
+            limit = 75 if not segments else 74
+            if len((current + char).encode("utf-8")) > limit:
+                segments.append(current)
+                current = ""
+            current += char
+        segments.append(current)
+        return [segments[0]] + [f" {segment}" for segment in segments[1:]]
+
+    @classmethod
+    def render(cls, events) -> str:
+        """
+        Construit le calendrier à partir de dictionnaires contenant
+        id, name, start_date, end_date, location et description.
+        """
+        stamp = datetime.now(timezone.utc).strftime(cls.DATE_FORMAT) + "Z"
+        lines = ["BEGIN:VCALENDAR", "VERSION:2.0", f"PRODID:{cls.PRODID}",
+                 "CALSCALE:GREGORIAN"]
+        for event in events:
+            lines += [
+                "BEGIN:VEVENT",
+                f"UID:event-{event['id']}@epic-events",
+                f"DTSTAMP:{stamp}",
+                f"DTSTART:{event['start_date'].strftime(cls.DATE_FORMAT)}",
+                f"DTEND:{event['end_date'].strftime(cls.DATE_FORMAT)}",
+                f"SUMMARY:{cls.escape(event['name'])}",
+                f"LOCATION:{cls.escape(event['location'])}",
+                f"DESCRIPTION:{cls.escape(event['description'])}",
+                "END:VEVENT",
+            ]
+        lines.append("END:VCALENDAR")
+        folded = [segment for line in lines for segment in cls.fold(line)]
+        return "\r\n".join(folded) + "\r\n"
+
+    @classmethod
+    def write(cls, events, path):
+        """Écrit le calendrier dans un fichier, ou sur la sortie si `-`"""
+        content = cls.render(events)
+        if path == "-":
+            sys.stdout.write(content)
+            return
+        with open(path, "w", encoding="utf-8", newline="") as file:
+            file.write(content)
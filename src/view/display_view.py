@@ -1,5 +1,8 @@
+from datetime import datetime
 from rich.console import Console
 from rich.table import Table
+from src.models.validators import DateTimeUtils
+from src.config.tracing import traced
 import os
 
 
@@ -10,6 +13,29 @@ class Display:
     def clear_screen(self):
         os.system('cls' if os.name == 'nt' else 'clear')
 
+    def _create_table(self, title: str, headers: list) -> Table:
+        table = Table(
+            title=title,
+            padding=(0, 1),
+            header_style="blue",
+            title_style="violet",
+            min_width=60
+        )
+        for title in headers:
+            table.add_column(str(title), style="cyan", justify="center")
+        return table
+
+    def _print_table(self, table: Table):
+        print('')
+        self.console.print(table)
+
+    @staticmethod
+    def format_value(value) -> str:
+        if isinstance(value, datetime):
+            return DateTimeUtils.format_datetime(value)
+        return str(value)
+
+    @traced("render", "Display.table")
     def table(
             self,
             title: str,
@@ -19,13 +45,6 @@ class Display:
     ):
         print("\n")
 
-        table = Table(
-            title=title,
-            padding=(0, 1),
-            header_style="blue",
-            title_style="violet",
-            min_width=60
-        )
         if not headers:
             try:
                 headers = list(items[0].keys())
@@ -37,12 +56,37 @@ class Display:
                 header for header in headers if header not in exclude_headers
             ]
 
-        for title in headers:
-            table.add_column(str(title), style="cyan", justify="center")
+        table = self._create_table(title, headers)
 
         for item in items:
             values = [str(item.get(header, '')) for header in headers]
             table.add_row(*values)
 
-        print('')
-        self.console.print(table)
+        self._print_table(table)
+
+    @traced("render", "Display.rows")
+    def rows(
+            self,
+            title: str,
+            headers: list,
+            rows: list[tuple],
+            exclude_headers=None
+    ):
+        """
+        Affiche des lignes sous forme de tuples, dans l'ordre de `headers`.
+        Évite la construction d'un dictionnaire par ligne.
+        """
+        print("\n")
+
+        indexes = [
+            index for index, header in enumerate(headers)
+            if not exclude_headers or header not in exclude_headers
+        ]
+        table = self._create_table(
+            title, [headers[index] for index in indexes])
+
+        format_value = self.format_value
+        for row in rows:
+            table.add_row(*[format_value(row[index]) for index in indexes])
+
+        self._print_table(table)
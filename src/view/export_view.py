@@ -0,0 +1,94 @@
+import csv
+import json
+from enum import Enum
+from sqlalchemy import Boolean, DateTime, Float, Integer
+
+
+class ExportFormat(str, Enum):
+    """Formats d'export disponibles"""
+    CSV = "csv"
+    JSONL = "jsonl"
+    PARQUET = "parquet"
+
+
+class Export:
+    """
+    Export des rapports vers un fichier.
+    Les lignes sont lues par paquets depuis le curseur de la base
+    et écrites au fil de l'eau : la mémoire utilisée ne dépend
+    pas du nombre de lignes exportées.
+    """
+
+    CHUNK_SIZE = 1000
+
+    @classmethod
+    def write(cls, session, query, path, export_format=ExportFormat.CSV,
+              chunk_size=CHUNK_SIZE):
+        """Exporte le résultat de la requête, retourne le nombre de lignes"""
+        export_format = ExportFormat(export_format)
+        result = session.execute(
+            query.execution_options(yield_per=chunk_size))
+        headers = list(result.keys())
+        writer = getattr(cls, f"_write_{export_format.value}")
+        return writer(query, headers, result.partitions(), path)
+
+    @staticmethod
+    def _write_csv(query, headers, chunks, path):
+        count = 0
+        with open(path, "w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            writer.writerow(headers)
+            for rows in chunks:
+                writer.writerows(rows)
+                count += len(rows)
+        return count
+
+    @staticmethod
+    def _write_jsonl(query, headers, chunks, path):
+        count = 0
+        with open(path, "w", encoding="utf-8") as file:
+            for rows in chunks:
+                file.writelines(
+                    json.dumps(
+                        dict(zip(headers, row)),
+                        default=str, ensure_ascii=False) + "\n"
+                    for row in rows
+                )
+                count += len(rows)
+        return count
+
+    @staticmethod
+    def _write_parquet(query, headers, chunks, path):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise Exception(
+                "L'export parquet nécessite pyarrow (pip install pyarrow)")
+
+        def arrow_type(column_type):
+            if isinstance(column_type, Boolean):
+                return pyarrow.bool_()
+            if isinstance(column_type, Integer):
+                return pyarrow.int64()
+            if isinstance(column_type, Float):
+                return pyarrow.float64()
+            if isinstance(column_type, DateTime):
+                return pyarrow.timestamp("us")
+            return pyarrow.string()
+
+        schema = pyarrow.schema([
+            (name, arrow_type(column.type))
+            for name, column in zip(headers, query.selected_columns)
+        ])
+        count = 0
+        with pyarrow.parquet.ParquetWriter(path, schema) as writer:
+            for rows in chunks:
+                columns = list(zip(*rows))
+                writer.write_table(pyarrow.table(
+                    [pyarrow.array(values, type=field.type)
+                     for values, field in zip(columns, schema)],
+                    schema=schema,
+                ))
+                count += len(rows)
+        return count